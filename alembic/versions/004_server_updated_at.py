@@ -0,0 +1,37 @@
+"""Default updated_at from the database clock
+
+Revision ID: 004_server_updated_at
+Revises: 003_add_inspections
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_server_updated_at'
+down_revision = '003_add_inspections'
+branch_labels = None
+depends_on = None
+
+_TABLES = ('bookings', 'vehicles', 'inspectors')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table, 'updated_at',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("timezone('utc', now())")
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table, 'updated_at',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None
+        )
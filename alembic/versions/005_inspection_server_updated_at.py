@@ -0,0 +1,33 @@
+"""Default inspections.updated_at from the database clock
+
+Revision ID: 005_inspection_updated_at
+Revises: 004_server_updated_at
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_inspection_updated_at'
+down_revision = '004_server_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'inspections', 'updated_at',
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.text("timezone('utc', now())")
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'inspections', 'updated_at',
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=None
+    )
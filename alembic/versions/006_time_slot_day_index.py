@@ -0,0 +1,24 @@
+"""Index time slots by calendar day
+
+Revision ID: 006_time_slot_day_index
+Revises: 005_inspection_updated_at
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_time_slot_day_index'
+down_revision = '005_inspection_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_time_slots_day ON time_slots ((date::date), is_available)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_time_slots_day', table_name='time_slots')
@@ -0,0 +1,25 @@
+"""Allow one active booking per appointment time
+
+Revision ID: 007_booking_active_slot_index
+Revises: 006_time_slot_day_index
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_booking_active_slot_index'
+down_revision = '006_time_slot_day_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE UNIQUE INDEX ux_bookings_active_slot ON bookings (appointment_date) "
+        "WHERE status IN ('PENDING', 'CONFIRMED')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_bookings_active_slot', table_name='bookings')
@@ -0,0 +1,41 @@
+"""Store inspection checkpoint scores as JSONB
+
+Revision ID: 008_inspection_scores_jsonb
+Revises: 007_booking_active_slot_index
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '008_inspection_scores_jsonb'
+down_revision = '007_booking_active_slot_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows written so far hold the scores as a JSON-encoded string; unwrap those
+    op.alter_column(
+        'inspections', 'checkpoint_scores',
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using=(
+            "CASE WHEN json_typeof(checkpoint_scores) = 'string' "
+            "THEN (checkpoint_scores #>> '{}')::jsonb "
+            "ELSE checkpoint_scores::jsonb END"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'inspections', 'checkpoint_scores',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using="checkpoint_scores::json"
+    )
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime, date
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -22,11 +22,26 @@ class BookingRepository(ABC):
         """Save a booking."""
         raise NotImplementedError
 
+    async def save_many(self, bookings: List["Booking"]) -> List["Booking"]:
+        """Save several bookings; adapters may override this with a bulk write."""
+        for booking in bookings:
+            await self.save(booking)
+        return bookings
+
     @abstractmethod
     async def find_by_id(self, booking_id: UUID) -> Optional["Booking"]:
         """Find booking by ID."""
         raise NotImplementedError
 
+    async def find_many_by_ids(self, booking_ids: Sequence[UUID]) -> Dict[UUID, "Booking"]:
+        """Find several bookings keyed by ID; prefer this over looping find_by_id."""
+        bookings = {}
+        for booking_id in booking_ids:
+            booking = await self.find_by_id(booking_id)
+            if booking is not None:
+                bookings[booking_id] = booking
+        return bookings
+
     @abstractmethod
     async def find_by_license_plate(self, license_plate: str) -> List["Booking"]:
         """Find all bookings for a license plate."""
@@ -66,6 +81,17 @@ class VehicleRepository(ABC):
         """Find vehicle by license plate."""
         raise NotImplementedError
 
+    async def find_many_by_license_plates(
+        self, license_plates: Sequence[str]
+    ) -> Dict[str, "Vehicle"]:
+        """Find several vehicles keyed by plate; prefer this over looping find_by_license_plate."""
+        vehicles = {}
+        for license_plate in license_plates:
+            vehicle = await self.find_by_license_plate(license_plate)
+            if vehicle is not None:
+                vehicles[license_plate] = vehicle
+        return vehicles
+
     @abstractmethod
     async def find_all(self) -> List["Vehicle"]:
         """Find all vehicles."""
@@ -104,11 +130,30 @@ class InspectorRepository(ABC):
         """Find inspector by ID."""
         raise NotImplementedError
 
+    async def find_many_by_ids(self, inspector_ids: Sequence[UUID]) -> Dict[UUID, "Inspector"]:
+        """Find several inspectors keyed by ID; prefer this over looping find_by_id."""
+        inspectors = {}
+        for inspector_id in inspector_ids:
+            inspector = await self.find_by_id(inspector_id)
+            if inspector is not None:
+                inspectors[inspector_id] = inspector
+        return inspectors
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional["Inspector"]:
         """Find inspector by email."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_auth_row_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Find the login columns of an inspector by email.
+
+        Returns a mapping with ``id``, ``password_hash``, ``status``,
+        ``failed_login_attempts`` and ``locked_until``, or None if not found.
+        Implementations should hold the row for update until the transaction ends.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_license_number(self, license_number: str) -> Optional["Inspector"]:
         """Find inspector by license number."""
@@ -187,6 +232,15 @@ class InspectionRepository(ABC):
         """Find inspection by ID."""
         raise NotImplementedError
 
+    async def find_many_by_ids(self, inspection_ids: Sequence[UUID]) -> Dict[UUID, "Inspection"]:
+        """Find several inspections keyed by ID; prefer this over looping find_by_id."""
+        inspections = {}
+        for inspection_id in inspection_ids:
+            inspection = await self.find_by_id(inspection_id)
+            if inspection is not None:
+                inspections[inspection_id] = inspection
+        return inspections
+
     @abstractmethod
     async def find_by_license_plate(self, license_plate: str) -> List["Inspection"]:
         """Find all inspections for a license plate (ordered by created_at DESC)."""
@@ -237,7 +291,21 @@ class InspectionRepository(ABC):
         """Count total inspections by inspector."""
         raise NotImplementedError
 
+    async def count_by_inspectors(self, inspector_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """Count inspections for several inspectors; prefer this over looping count_by_inspector."""
+        return {
+            inspector_id: await self.count_by_inspector(inspector_id)
+            for inspector_id in inspector_ids
+        }
+
     @abstractmethod
     async def count_by_license_plate(self, license_plate: str) -> int:
         """Count total inspections for a license plate."""
         raise NotImplementedError
+
+    async def count_by_license_plates(self, license_plates: Sequence[str]) -> Dict[str, int]:
+        """Count inspections for several plates; prefer this over looping count_by_license_plate."""
+        return {
+            license_plate: await self.count_by_license_plate(license_plate)
+            for license_plate in license_plates
+        }
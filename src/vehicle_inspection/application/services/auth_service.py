@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
+from src.vehicle_inspection.domain.entities.inspector import InspectorStatus
 from src.vehicle_inspection.domain.value_objects.auth import (
     LoginCredentials,
     LoginResult,
@@ -45,45 +46,47 @@ class AuthenticationService:
         self._logger.info(f"Login attempt for email: {email}")
 
         try:
-            # Find inspector by email
-            inspector = await self._inspector_repository.find_by_email(email)
+            # Fetch only the columns needed to authenticate, in one query
+            auth_row = await self._inspector_repository.find_auth_row_by_email(email)
 
-            if not inspector:
+            if not auth_row:
                 log_authentication_attempt(self._logger, email, False, failure_reason="inspector_not_found")
                 return LoginResult(
                     success=False,
                     error_message="Invalid email or password"
                 )
 
+            inspector_id = auth_row["id"]
+            locked_until = auth_row["locked_until"]
+
             # Check if account is locked
-            if await self._is_account_locked(inspector):
+            if locked_until and locked_until > datetime.utcnow():
                 log_authentication_attempt(self._logger, email, False,
                                           failure_reason="account_locked",
-                                          inspector_id=str(inspector.id))
+                                          inspector_id=str(inspector_id))
                 return LoginResult(
                     success=False,
                     error_message="Account is temporarily locked due to too many failed login attempts",
-                    locked_until=await self._get_lockout_expiry(inspector)
+                    locked_until=locked_until
                 )
 
             # Check if inspector is active
-            if not inspector.can_perform_inspections():
+            if auth_row["status"] != InspectorStatus.ACTIVE:
                 log_authentication_attempt(self._logger, email, False,
                                           failure_reason="account_inactive",
-                                          inspector_id=str(inspector.id))
+                                          inspector_id=str(inspector_id))
                 return LoginResult(
                     success=False,
                     error_message="Account is not active"
                 )
 
-            # Get stored password hash from database
-            password_hash = await self._get_password_hash(inspector.id)
+            password_hash = auth_row["password_hash"]
 
             if not password_hash:
-                self._logger.error(f"No password hash found for inspector {inspector.id}")
+                self._logger.error(f"No password hash found for inspector {inspector_id}")
                 log_authentication_attempt(self._logger, email, False,
                                           failure_reason="no_password_hash",
-                                          inspector_id=str(inspector.id))
+                                          inspector_id=str(inspector_id))
                 return LoginResult(
                     success=False,
                     error_message="Authentication error"
@@ -91,17 +94,15 @@ class AuthenticationService:
 
             # Verify password
             if not PasswordHasher.verify_password_hash(credentials.password, password_hash):
-                # Record failed attempt
-                await self._record_failed_login(inspector)
-
-                failed_attempts = await self._get_failed_attempts(inspector.id)
+                # Record failed attempt, locking the account in the same update if needed
+                failed_attempts = (auth_row["failed_login_attempts"] or 0) + 1
 
                 if failed_attempts >= self.MAX_FAILED_ATTEMPTS:
-                    lockout_expiry = await self._lock_account(inspector.id)
-                    self._logger.warning(f"Account locked for inspector {inspector.id} after {failed_attempts} failed attempts")
+                    lockout_expiry = await self._lock_account(inspector_id)
+                    self._logger.warning(f"Account locked for inspector {inspector_id} after {failed_attempts} failed attempts")
                     log_authentication_attempt(self._logger, email, False,
                                               failure_reason="account_locked_after_failures",
-                                              inspector_id=str(inspector.id),
+                                              inspector_id=str(inspector_id),
                                               failed_attempts=failed_attempts)
                     return LoginResult(
                         success=False,
@@ -110,9 +111,13 @@ class AuthenticationService:
                         failed_attempts=failed_attempts
                     )
 
+                await self._inspector_repository.update_login_info(
+                    inspector_id,
+                    failed_attempts=failed_attempts
+                )
                 log_authentication_attempt(self._logger, email, False,
                                           failure_reason="invalid_password",
-                                          inspector_id=str(inspector.id),
+                                          inspector_id=str(inspector_id),
                                           failed_attempts=failed_attempts)
                 return LoginResult(
                     success=False,
@@ -120,27 +125,26 @@ class AuthenticationService:
                     failed_attempts=failed_attempts
                 )
 
-            # Successful login - reset failed attempts and record login
-            await self._inspector_repository.update_login_info(inspector.id, failed_attempts=0)
-            await self._inspector_repository.record_login(inspector.id)
+            # Successful login - record_login also clears failed attempts and any lockout
+            await self._inspector_repository.record_login(inspector_id)
 
             # Generate authentication token
             auth_token = TokenGenerator.create_auth_token(
-                inspector.id,
+                inspector_id,
                 expires_in_hours=self.TOKEN_EXPIRY_HOURS
             )
 
             # Save token
             await self._token_repository.save_token(auth_token)
 
-            self._logger.info(f"Successful login for inspector {inspector.id} with token expiry {auth_token.expires_at}")
+            self._logger.info(f"Successful login for inspector {inspector_id} with token expiry {auth_token.expires_at}")
             log_authentication_attempt(self._logger, email, True,
-                                      inspector_id=str(inspector.id),
+                                      inspector_id=str(inspector_id),
                                       token_expires_at=auth_token.expires_at.isoformat())
 
             return LoginResult(
                 success=True,
-                inspector_id=inspector.id,
+                inspector_id=inspector_id,
                 token=auth_token
             )
 
@@ -186,6 +190,10 @@ class AuthenticationService:
             self._logger.error(f"Token validation error: {str(e)}", exc_info=True)
             return None
 
+    async def get_inspector(self, inspector_id: UUID) -> Optional["Inspector"]:
+        """Get an inspector by ID."""
+        return await self._inspector_repository.find_by_id(inspector_id)
+
     async def logout(self, token: str) -> bool:
         """Logout inspector by invalidating token."""
         try:
@@ -244,23 +252,6 @@ class AuthenticationService:
         except Exception:
             return 0
 
-    async def _is_account_locked(self, inspector: "Inspector") -> bool:
-        """Check if inspector account is locked."""
-        try:
-            lockout_expiry = await self._inspector_repository.get_lockout_expiry(inspector.id)
-            if lockout_expiry and lockout_expiry > datetime.utcnow():
-                return True
-            return False
-        except Exception:
-            return False
-
-    async def _get_lockout_expiry(self, inspector: "Inspector") -> Optional[datetime]:
-        """Get account lockout expiry time."""
-        try:
-            return await self._inspector_repository.get_lockout_expiry(inspector.id)
-        except Exception:
-            return None
-
     async def _get_password_hash(self, inspector_id: UUID) -> Optional[str]:
         """Get password hash from database."""
         try:
@@ -269,21 +260,6 @@ class AuthenticationService:
         except Exception:
             return None
 
-    async def _record_failed_login(self, inspector: "Inspector") -> None:
-        """Record failed login attempt."""
-        failed_attempts = await self._get_failed_attempts(inspector.id)
-        await self._inspector_repository.update_login_info(
-            inspector.id,
-            failed_attempts=failed_attempts + 1
-        )
-
-    async def _get_failed_attempts(self, inspector_id: UUID) -> int:
-        """Get number of failed login attempts."""
-        try:
-            return await self._inspector_repository.get_failed_attempts(inspector_id)
-        except Exception:
-            return 0
-
     async def _lock_account(self, inspector_id: UUID) -> datetime:
         """Lock inspector account."""
         lockout_expiry = datetime.utcnow() + timedelta(hours=self.LOCKOUT_DURATION_HOURS)
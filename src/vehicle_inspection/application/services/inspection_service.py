@@ -5,7 +5,11 @@ from datetime import datetime
 from typing import List, Optional, Dict, TYPE_CHECKING
 from uuid import UUID
 
-from src.vehicle_inspection.domain.entities.inspection import Inspection, InspectionStatus
+from src.vehicle_inspection.domain.entities.inspection import (
+    PLATE_SEPARATORS,
+    Inspection,
+    InspectionStatus
+)
 from src.vehicle_inspection.domain.entities.vehicle import VehicleType, Car, Motorcycle
 from src.vehicle_inspection.domain.value_objects.checkpoint_score import CheckpointScore
 from src.vehicle_inspection.domain.value_objects.checkpoint_types import CheckpointType
@@ -322,7 +326,7 @@ class InspectionService:
 
     def _normalize_license_plate(self, license_plate: str) -> str:
         """Normalize license plate for consistent storage and querying."""
-        return license_plate.strip().upper().replace(" ", "").replace("-", "")
+        return license_plate.strip().upper().translate(PLATE_SEPARATORS)
 
     def _validate_checkpoint_scores(self, scores: List[CheckpointScore], vehicle_type: VehicleType) -> None:
         """Validate checkpoint scores for business rules.
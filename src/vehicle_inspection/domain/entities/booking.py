@@ -28,7 +28,7 @@ class Booking:
         updated_at: Optional[datetime] = None
     ):
         self._id = booking_id or uuid4()
-        self._license_plate = license_plate
+        self._license_plate = license_plate.strip().upper()
         self._appointment_date = appointment_date
         self._user_id = user_id
         self._status = status
@@ -91,6 +91,11 @@ class Booking:
         self._status = BookingStatus.COMPLETED
         self._updated_at = datetime.utcnow()
 
+    def sync_timestamps(self, created_at: datetime, updated_at: datetime) -> None:
+        """Adopt the timestamps recorded by the store for this booking."""
+        self._created_at = created_at
+        self._updated_at = updated_at
+
     def is_editable(self) -> bool:
         """Check if booking can be modified."""
         return self._status in [BookingStatus.PENDING, BookingStatus.CONFIRMED]
@@ -10,6 +10,10 @@ from ..value_objects.checkpoint_types import CheckpointType
 from ..value_objects.safety_result import SafetyResult
 from .vehicle import VehicleType
 
+# Characters dropped from plates when matching stored inspections; translate
+# removes them in one pass, shared by every layer that normalizes plates
+PLATE_SEPARATORS = str.maketrans("", "", " -")
+
 
 class InspectionStatus(Enum):
     """Inspection status enumeration."""
@@ -30,7 +34,8 @@ class Inspection:
         observations: str = "",
         status: InspectionStatus = InspectionStatus.DRAFT,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None
     ):
         """Initialize inspection entity."""
         # Validate required fields
@@ -43,6 +48,7 @@ class Inspection:
 
         self._id = inspection_id or uuid4()
         self._license_plate = license_plate.strip().upper()
+        self._normalized_license_plate = self._license_plate.translate(PLATE_SEPARATORS)
         self._vehicle_type = vehicle_type
         self._inspector_id = inspector_id
         self._checkpoint_scores = checkpoint_scores or []
@@ -50,6 +56,7 @@ class Inspection:
         self._status = status
         self._created_at = created_at or datetime.utcnow()
         self._updated_at = updated_at or datetime.utcnow()
+        self._completed_at = completed_at
 
         # Validate checkpoint scores if provided
         self._validate_checkpoint_scores()
@@ -64,6 +71,11 @@ class Inspection:
         """Get vehicle license plate."""
         return self._license_plate
 
+    @property
+    def normalized_license_plate(self) -> str:
+        """Get the license plate without spaces or dashes, as stored."""
+        return self._normalized_license_plate
+
     @property
     def vehicle_type(self) -> VehicleType:
         """Get vehicle type."""
@@ -99,6 +111,11 @@ class Inspection:
         """Get last update timestamp."""
         return self._updated_at
 
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """Get completion timestamp."""
+        return self._completed_at
+
     def update_checkpoint_scores(self, scores: List[CheckpointScore]) -> None:
         """Update checkpoint scores."""
         if self._status == InspectionStatus.COMPLETED:
@@ -165,6 +182,7 @@ class Inspection:
 
         self._status = InspectionStatus.COMPLETED
         self._updated_at = datetime.utcnow()
+        self._completed_at = self._updated_at
 
     def calculate_safety_result(self) -> SafetyResult:
         """Calculate safety result based on checkpoint scores."""
@@ -23,6 +23,11 @@ class InspectorStatus(Enum):
 class Inspector:
     """Inspector entity representing an authorized vehicle inspector."""
 
+    __slots__ = (
+        "_id", "_email", "_first_name", "_last_name", "_role", "_license_number",
+        "_status", "_phone", "_hire_date", "_created_at", "_updated_at"
+    )
+
     def __init__(
         self,
         email: str,
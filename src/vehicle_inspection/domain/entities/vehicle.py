@@ -28,7 +28,7 @@ class Vehicle(ABC):
         year: int,
         created_at: datetime | None = None
     ):
-        self._license_plate = license_plate
+        self._license_plate = license_plate.strip().upper()
         self._make = make
         self._model = model
         self._year = year
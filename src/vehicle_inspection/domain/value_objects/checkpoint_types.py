@@ -1,6 +1,7 @@
 """Checkpoint types enumeration."""
 
 from enum import Enum
+from functools import lru_cache
 
 
 class CheckpointType(Enum):
@@ -17,20 +18,27 @@ class CheckpointType(Enum):
 
     def get_description(self) -> str:
         """Get human-readable description of checkpoint."""
-        descriptions = {
-            self.BRAKING_SYSTEM: "Brake pads, brake fluid, brake lines, parking brake",
-            self.STEERING_SYSTEM: "Steering wheel play, power steering, alignment",
-            self.SUSPENSION_SYSTEM: "Shock absorbers, springs, ball joints, wheel bearings",
-            self.TIRES: "Tread depth, tire pressure, sidewall condition, wear patterns",
-            self.LIGHTING_SYSTEM: "Headlights, taillights, brake lights, turn signals",
-            self.GAS_EMISSIONS: "Exhaust system, catalytic converter, emission levels",
-            self.ELECTRICAL_SYSTEM: "Battery, alternator, starter, wiring, horn",
-            self.BODY_STRUCTURE: "Frame integrity, doors, windows, mirrors, seatbelts",
-        }
-        return descriptions.get(self, "Unknown checkpoint")
-
-    def is_applicable_to_vehicle_type(self, vehicle_type: str) -> bool:
+        return _describe(self)
+
+    @staticmethod
+    def is_applicable_to_vehicle_type(vehicle_type: str) -> bool:
         """Check if checkpoint applies to specific vehicle type."""
         # All current checkpoints apply to both cars and motorcycles
         # This can be extended if vehicle-specific checkpoints are needed
         return True
+
+
+@lru_cache(maxsize=8)
+def _describe(checkpoint_type: CheckpointType) -> str:
+    """Look up the description for a checkpoint type (memoized per member)."""
+    descriptions = {
+        CheckpointType.BRAKING_SYSTEM: "Brake pads, brake fluid, brake lines, parking brake",
+        CheckpointType.STEERING_SYSTEM: "Steering wheel play, power steering, alignment",
+        CheckpointType.SUSPENSION_SYSTEM: "Shock absorbers, springs, ball joints, wheel bearings",
+        CheckpointType.TIRES: "Tread depth, tire pressure, sidewall condition, wear patterns",
+        CheckpointType.LIGHTING_SYSTEM: "Headlights, taillights, brake lights, turn signals",
+        CheckpointType.GAS_EMISSIONS: "Exhaust system, catalytic converter, emission levels",
+        CheckpointType.ELECTRICAL_SYSTEM: "Battery, alternator, starter, wiring, horn",
+        CheckpointType.BODY_STRUCTURE: "Frame integrity, doors, windows, mirrors, seatbelts",
+    }
+    return descriptions.get(checkpoint_type, "Unknown checkpoint")
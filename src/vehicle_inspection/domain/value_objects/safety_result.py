@@ -1,17 +1,19 @@
 """Safety result value object."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Final
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SafetyResult:
     """Immutable value object representing inspection safety result."""
 
-    is_safe: bool
-    total_score: int
-    max_score: int
-    requires_reinspection: bool
-    observation: str = ""
+    is_safe: Final[bool]
+    total_score: Final[int]
+    max_score: Final[int]
+    requires_reinspection: Final[bool]
+    observation: Final[str] = ""
+    _score_percentage: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate safety result data."""
@@ -22,12 +24,22 @@ class SafetyResult:
         if self.total_score > self.max_score:
             raise ValueError("Total score cannot exceed maximum score")
 
+        # Computed once since the result is immutable
+        self._score_percentage = (
+            0.0 if self.max_score == 0 else (self.total_score / self.max_score) * 100
+        )
+
+    def __hash__(self) -> int:
+        """Hash based on the result fields."""
+        return hash((
+            self.is_safe, self.total_score, self.max_score,
+            self.requires_reinspection, self.observation
+        ))
+
     @property
     def score_percentage(self) -> float:
         """Calculate score as percentage."""
-        if self.max_score == 0:
-            return 0.0
-        return (self.total_score / self.max_score) * 100
+        return self._score_percentage
 
     @property
     def status(self) -> str:
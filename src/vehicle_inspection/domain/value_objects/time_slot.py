@@ -2,18 +2,23 @@
 
 from dataclasses import dataclass
 from datetime import datetime, time
+from typing import Final
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class TimeSlot:
-    """Immutable value object representing an available time slot."""
+    """Immutable value object representing an available time slot.
 
-    date: datetime
-    start_time: time
-    end_time: time
-    is_available: bool = True
-    max_bookings: int = 1
-    current_bookings: int = 0
+    Fields are marked ``Final`` so mypy rejects mutation; ``frozen=True`` is
+    avoided because it slows down every construction.
+    """
+
+    date: Final[datetime]
+    start_time: Final[time]
+    end_time: Final[time]
+    is_available: Final[bool] = True
+    max_bookings: Final[int] = 1
+    current_bookings: Final[int] = 0
 
     def __post_init__(self) -> None:
         """Validate time slot data."""
@@ -26,6 +31,13 @@ class TimeSlot:
         if self.current_bookings > self.max_bookings:
             raise ValueError("Current bookings cannot exceed max bookings")
 
+    def __hash__(self) -> int:
+        """Hash based on all slot fields."""
+        return hash((
+            self.date, self.start_time, self.end_time,
+            self.is_available, self.max_bookings, self.current_bookings
+        ))
+
     @property
     def is_fully_booked(self) -> bool:
         """Check if time slot is fully booked."""
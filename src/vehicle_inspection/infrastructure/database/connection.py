@@ -1,15 +1,46 @@
 """Database connection management."""
 
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+
+import orjson
+
+
+# Compiled-statement cache entries per engine (SQLAlchemy defaults to 500)
+DEFAULT_QUERY_CACHE_SIZE = 1200
+
+# Connection pool sizing for the asyncpg engine
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_POOL_TIMEOUT_SECONDS = 30
+
+# Per-connection prepared statement caches (asyncpg's own and SQLAlchemy's adapter)
+DEFAULT_STATEMENT_CACHE_SIZE = 1024
+
+
+def _orjson_dumps(value: Any) -> str:
+    """Serialize a JSON/JSONB bind value with orjson."""
+    return orjson.dumps(value).decode()
 
 
 class DatabaseManager:
     """Database connection manager."""
 
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = DEFAULT_POOL_RECYCLE_SECONDS,
+        pool_timeout: int = DEFAULT_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping: bool = True,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ):
         """Initialize database manager."""
         # Convert postgresql:// to postgresql+asyncpg:// for async support
         if database_url.startswith("postgresql://"):
@@ -18,14 +49,42 @@ class DatabaseManager:
         self._engine: AsyncEngine | None = None
         self._database_url = database_url
         self._session_factory: sessionmaker | None = None
+        self._query_cache_size = query_cache_size
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._pool_recycle = pool_recycle
+        self._pool_timeout = pool_timeout
+        self._pool_pre_ping = pool_pre_ping
+        self._statement_cache_size = statement_cache_size
 
     async def connect(self) -> None:
         """Connect to database."""
+        connect_args = {}
+        if "+asyncpg" in self._database_url:
+            connect_args = {
+                "statement_cache_size": self._statement_cache_size,
+                "prepared_statement_cache_size": self._statement_cache_size,
+            }
+
         self._engine = create_async_engine(
             self._database_url,
             echo=True,  # Set to False in production
-            pool_pre_ping=True,
+            pool_pre_ping=self._pool_pre_ping,
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            pool_recycle=self._pool_recycle,
+            pool_timeout=self._pool_timeout,
+            query_cache_size=self._query_cache_size,
+            connect_args=connect_args,
+            # JSON/JSONB columns (inspection checkpoint scores) are encoded by the engine
+            json_serializer=_orjson_dumps,
+            json_deserializer=orjson.loads,
         )
+        # A sync QueuePool (or NullPool) under asyncpg can deadlock or stop reusing connections
+        if not isinstance(self._engine.pool, AsyncAdaptedQueuePool):
+            raise RuntimeError(
+                f"Async engine must use AsyncAdaptedQueuePool, got {type(self._engine.pool).__name__}"
+            )
 
         self._session_factory = sessionmaker(
             bind=self._engine,
@@ -4,17 +4,27 @@ from datetime import datetime
 from typing import List
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, Enum as SQLEnum, ForeignKey, JSON, Numeric
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Date, String, DateTime, Boolean, Integer, Text, Enum as SQLEnum, ForeignKey, Index, Numeric, cast, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
+from sqlalchemy.orm import DeclarativeBase, backref, relationship
 
 from src.vehicle_inspection.domain.entities.booking import BookingStatus
 from src.vehicle_inspection.domain.entities.inspector import InspectorRole, InspectorStatus
 from src.vehicle_inspection.domain.entities.inspection import InspectionStatus
 from src.vehicle_inspection.domain.entities.vehicle import VehicleType
 
-Base = declarative_base()
+# Enum values persisted by the database, computed once at import
+_INSPECTOR_ROLE_VALUES = [e.value for e in InspectorRole]
+_INSPECTOR_STATUS_VALUES = [e.value for e in InspectorStatus]
+_INSPECTION_STATUS_VALUES = [e.value for e in InspectionStatus]
+_VEHICLE_TYPE_VALUES = [e.value for e in VehicleType]
+
+# Naive UTC timestamp evaluated by the database, matching datetime.utcnow() semantics
+DB_UTC_NOW = func.timezone("utc", func.now())
+
+
+class Base(DeclarativeBase):
+    """Declarative base shared by all database models."""
 
 
 class BookingModel(Base):
@@ -35,7 +45,7 @@ class BookingModel(Base):
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, server_default=DB_UTC_NOW, onupdate=DB_UTC_NOW)
 
     # Additional booking information
     notes = Column(Text, nullable=True)
@@ -44,6 +54,16 @@ class BookingModel(Base):
         return f"<BookingModel(id={self.id}, license_plate='{self.license_plate}', status='{self.status}')>"
 
 
+# At most one pending or confirmed booking per appointment time, enforced by the schema
+ACTIVE_SLOT_INDEX = "ux_bookings_active_slot"
+Index(
+    ACTIVE_SLOT_INDEX,
+    BookingModel.appointment_date,
+    unique=True,
+    postgresql_where=BookingModel.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
+)
+
+
 class TimeSlotModel(Base):
     """SQLAlchemy model for time slots."""
 
@@ -70,6 +90,10 @@ class TimeSlotModel(Base):
         return f"<TimeSlotModel(id={self.id}, date={self.date}, available={self.is_available})>"
 
 
+# Slots are looked up by calendar day, so index the day rather than the timestamp
+Index("ix_time_slots_day", cast(TimeSlotModel.date, Date), TimeSlotModel.is_available)
+
+
 class VehicleModel(Base):
     """SQLAlchemy model for vehicles."""
 
@@ -86,7 +110,7 @@ class VehicleModel(Base):
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, server_default=DB_UTC_NOW, onupdate=DB_UTC_NOW)
 
     def __repr__(self) -> str:
         return f"<VehicleModel(license_plate='{self.license_plate}', make='{self.make}', model='{self.model}')>"
@@ -132,9 +156,9 @@ class InspectorModel(Base):
     phone = Column(String(20), nullable=True)
 
     # Inspector-specific fields
-    role = Column(SQLEnum(InspectorRole, values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=InspectorRole.JUNIOR)
+    role = Column(SQLEnum(InspectorRole, values_callable=lambda _: _INSPECTOR_ROLE_VALUES), nullable=False, default=InspectorRole.JUNIOR)
     license_number = Column(String(50), nullable=False, unique=True, index=True)
-    status = Column(SQLEnum(InspectorStatus, values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=InspectorStatus.ACTIVE)
+    status = Column(SQLEnum(InspectorStatus, values_callable=lambda _: _INSPECTOR_STATUS_VALUES), nullable=False, default=InspectorStatus.ACTIVE)
     hire_date = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Authentication fields
@@ -145,7 +169,7 @@ class InspectorModel(Base):
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, server_default=DB_UTC_NOW, onupdate=DB_UTC_NOW)
 
     def __repr__(self) -> str:
         return f"<InspectorModel(id={self.id}, email='{self.email}', name='{self.first_name} {self.last_name}', role='{self.role}')>"
@@ -161,13 +185,13 @@ class InspectionModel(Base):
 
     # Inspection identification
     license_plate = Column(String(20), nullable=False, index=True)  # Not unique - allows multiple inspections per vehicle
-    vehicle_type = Column(SQLEnum(VehicleType, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    vehicle_type = Column(SQLEnum(VehicleType, values_callable=lambda _: _VEHICLE_TYPE_VALUES), nullable=False)
 
     # Inspector reference
     inspector_id = Column(PostgresUUID(as_uuid=True), ForeignKey('inspectors.id'), nullable=False, index=True)
 
-    # Checkpoint scores (stored as JSON)
-    checkpoint_scores = Column(JSON, nullable=True)  # JSON array of checkpoint score objects
+    # Checkpoint scores (stored as JSONB; the driver encodes and decodes the list)
+    checkpoint_scores = Column(JSONB, nullable=True)  # JSON array of checkpoint score objects
 
     # Calculated safety metrics
     total_score = Column(Numeric(precision=5, scale=2), nullable=True)  # Total score calculated from checkpoints
@@ -178,15 +202,17 @@ class InspectionModel(Base):
     observations = Column(Text, nullable=False, default="")
 
     # Inspection status
-    status = Column(SQLEnum(InspectionStatus, values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=InspectionStatus.DRAFT)
+    status = Column(SQLEnum(InspectionStatus, values_callable=lambda _: _INSPECTION_STATUS_VALUES), nullable=False, default=InspectionStatus.DRAFT)
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, server_default=DB_UTC_NOW, onupdate=DB_UTC_NOW)
     completed_at = Column(DateTime, nullable=True)  # When inspection was completed
 
-    # Relationships
-    inspector = relationship("InspectorModel", backref="inspections")
+    # Relationships; never lazy-loaded, so queries must load related rows explicitly
+    inspector = relationship(
+        "InspectorModel", backref=backref("inspections", lazy="raise"), lazy="raise"
+    )
 
     def __repr__(self) -> str:
         return f"<InspectionModel(id={self.id}, license_plate='{self.license_plate}', status='{self.status}', inspector_id={self.inspector_id})>"
@@ -1,19 +1,45 @@
 """Structured JSON logging configuration for the Vehicle Inspection System."""
 
+import atexit
 import logging
 import logging.handlers
-import json
+import queue
 import sys
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from time import monotonic
+from typing import Dict, Any, List, Optional
 from contextvars import ContextVar
 from pathlib import Path
 import os
 
+import orjson
+
+
+# Placeholder logged when no correlation ID is set
+_UNKNOWN_CORRELATION_ID = "unknown"
 
 # Context variable for correlation ID tracking across async requests
-correlation_id_context: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
+correlation_id_context: ContextVar[str] = ContextVar(
+    'correlation_id', default=_UNKNOWN_CORRELATION_ID
+)
+# Bound once so the per-record filter skips the attribute lookup
+_get_correlation_id = correlation_id_context.get
+
+# Standard LogRecord attributes that are not emitted as "extra" fields
+_RESERVED_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+    'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'message', 'exc_info',
+    'exc_text', 'stack_info', 'correlation_id'
+})
+
+
+def _record_timestamp(record: logging.LogRecord) -> datetime:
+    """Get the record's creation time for the JSON "timestamp" field."""
+    # orjson renders naive datetimes as RFC 3339 UTC itself
+    return datetime.utcfromtimestamp(record.created)
 
 
 class CorrelationIDFilter(logging.Filter):
@@ -21,10 +47,26 @@ class CorrelationIDFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Add correlation ID to the log record."""
-        record.correlation_id = correlation_id_context.get() or "unknown"
+        record.correlation_id = _get_correlation_id()
         return True
 
 
+def _install_correlation_id_record_factory() -> None:
+    """Wrap the LogRecord factory so every record carries a correlation ID."""
+    base_factory = logging.getLogRecordFactory()
+    if getattr(base_factory, '_sets_correlation_id', False):
+        return
+
+    def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        """Create a record stamped with the current correlation ID."""
+        record = base_factory(*args, **kwargs)
+        record.correlation_id = _get_correlation_id()
+        return record
+
+    record_factory._sets_correlation_id = True  # type: ignore[attr-defined]
+    logging.setLogRecordFactory(record_factory)
+
+
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
@@ -34,24 +76,19 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        # Base log entry structure
+        # Base log entry structure; location fields are null when unknown
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _record_timestamp(record),
             "level": record.levelname,
             "service": self.service_name,
             "logger": record.name,
             "message": record.getMessage(),
-            "correlation_id": getattr(record, 'correlation_id', 'unknown'),
+            "correlation_id": record.correlation_id,
+            "module": record.module or None,
+            "function": record.funcName if record.funcName != '<module>' else None,
+            "line": record.lineno or None,
         }
 
-        # Add module and function info
-        if record.module:
-            log_entry["module"] = record.module
-        if record.funcName and record.funcName != '<module>':
-            log_entry["function"] = record.funcName
-        if record.lineno:
-            log_entry["line"] = record.lineno
-
         # Add exception information if present
         if record.exc_info:
             log_entry["exception"] = {
@@ -61,20 +98,112 @@ class JSONFormatter(logging.Formatter):
             }
 
         # Add extra fields from the log record
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in [
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-                'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                'thread', 'threadName', 'processName', 'process', 'message', 'exc_info',
-                'exc_text', 'stack_info', 'correlation_id'
-            ]:
-                extra_fields[key] = value
-
-        if extra_fields:
-            log_entry["extra"] = extra_fields
-
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
+        extra_keys = record.__dict__.keys() - _RESERVED_LOGRECORD_ATTRS
+        if extra_keys:
+            log_entry["extra"] = {key: record.__dict__[key] for key in extra_keys}
+
+        return orjson.dumps(
+            log_entry, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ).decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _get_json_formatter(service_name: str) -> JSONFormatter:
+    """Get the shared JSON formatter for a service name."""
+    return JSONFormatter(service_name=service_name)
+
+
+# Third-party loggers capped at WARNING: SQLAlchemy, FastAPI/Uvicorn and HTTP libraries
+_NOISY_THIRD_PARTY_LOGGERS = (
+    'sqlalchemy.engine', 'sqlalchemy.dialects', 'sqlalchemy.pool', 'sqlalchemy.orm',
+    'uvicorn.access', 'fastapi',
+    'urllib3', 'requests',
+)
+# Set once the levels above have been applied in this process
+_CONFIGURED_THIRD_PARTY = False
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for an in-process listener.
+
+    Records are enqueued as-is: they never leave the process, so there is no need
+    to pre-format them or strip ``exc_info`` the way ``QueueHandler.prepare`` does.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Enqueue the record for the listener thread."""
+        try:
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry.
+
+    Buffered handlers then hold records only while more are already queued, so
+    a quiet period never leaves earlier records sitting unwritten.
+    """
+
+    def dequeue(self, block: bool) -> Any:
+        """Take the next record, flushing the handlers before waiting on an empty queue."""
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler with buffered writes and periodic size checks.
+
+    Records are flushed when the buffer fills, on rollover/close, right away
+    for ERROR and above, and at least every FLUSH_INTERVAL_SECONDS while
+    records keep arriving; the file size is only checked every few hundred records.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+    ROLLOVER_CHECK_INTERVAL = 256
+    FLUSH_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._records_since_check = 0
+        self._flush_due = monotonic() + self.FLUSH_INTERVAL_SECONDS
+        super().__init__(*args, **kwargs)
+
+    def flush(self) -> None:
+        """Flush the buffer and restart the flush interval."""
+        super().flush()
+        self._flush_due = monotonic() + self.FLUSH_INTERVAL_SECONDS
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(
+            self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check the file size only every ROLLOVER_CHECK_INTERVAL records."""
+        self._records_since_check += 1
+        if self._records_since_check < self.ROLLOVER_CHECK_INTERVAL:
+            return False
+        self._records_since_check = 0
+        return bool(super().shouldRollover(record))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing for errors or once the flush interval has passed."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR or monotonic() >= self._flush_due:
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
 
 class LoggingConfig:
@@ -119,8 +248,14 @@ class LoggingConfig:
         if self.enable_file:
             self.log_dir.mkdir(parents=True, exist_ok=True)
 
+        # Background listener that owns the output handlers
+        self._listener: Optional[logging.handlers.QueueListener] = None
+
     def setup_logging(self) -> None:
         """Configure logging for the application."""
+        # Stop a listener left over from a previous setup
+        self.stop()
+
         # Clear any existing handlers
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
@@ -129,66 +264,77 @@ class LoggingConfig:
         # Set root logger level
         root_logger.setLevel(self.log_level)
 
-        # Create correlation ID filter
-        correlation_filter = CorrelationIDFilter()
-
         # Create JSON formatter
-        json_formatter = JSONFormatter(service_name=self.service_name)
+        json_formatter = _get_json_formatter(self.service_name)
+        handlers: List[logging.Handler] = []
 
         # Console handler
         if self.enable_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(self.log_level)
-            console_handler.addFilter(correlation_filter)
             console_handler.setFormatter(json_formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
 
         # File handler with rotation
         if self.enable_file:
             log_file = self.log_dir / f"{self.service_name}.log"
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = _BufferedRotatingFileHandler(
                 filename=log_file,
                 maxBytes=self.max_file_size,
                 backupCount=self.backup_count,
                 encoding='utf-8'
             )
             file_handler.setLevel(self.log_level)
-            file_handler.addFilter(correlation_filter)
             file_handler.setFormatter(json_formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
 
         # Error file handler (separate file for ERROR and CRITICAL logs)
         if self.enable_file:
             error_log_file = self.log_dir / f"{self.service_name}-errors.log"
-            error_handler = logging.handlers.RotatingFileHandler(
+            error_handler = _BufferedRotatingFileHandler(
                 filename=error_log_file,
                 maxBytes=self.max_file_size,
                 backupCount=self.backup_count,
                 encoding='utf-8'
             )
             error_handler.setLevel(logging.ERROR)
-            error_handler.addFilter(correlation_filter)
             error_handler.setFormatter(json_formatter)
-            root_logger.addHandler(error_handler)
+            handlers.append(error_handler)
+
+        # Stamp the correlation ID when the record is created, on the caller's side,
+        # so formatters can read it directly
+        _install_correlation_id_record_factory()
+
+        # Callers only enqueue records; formatting and I/O run on the listener thread
+        log_queue: queue.Queue = queue.Queue(-1)
+        root_logger.addHandler(_LocalQueueHandler(log_queue))
+
+        self._listener = _FlushingQueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.stop)
 
         # Configure third-party loggers to reduce noise
         self._configure_third_party_loggers()
 
+    def stop(self) -> None:
+        """Flush queued records and stop the background listener."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            atexit.unregister(self.stop)
+
     def _configure_third_party_loggers(self) -> None:
         """Configure third-party library loggers to reduce noise."""
-        # SQLAlchemy
-        logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
-        logging.getLogger('sqlalchemy.dialects').setLevel(logging.WARNING)
-        logging.getLogger('sqlalchemy.pool').setLevel(logging.WARNING)
-        logging.getLogger('sqlalchemy.orm').setLevel(logging.WARNING)
-
-        # FastAPI/Uvicorn
-        logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
-        logging.getLogger('fastapi').setLevel(logging.WARNING)
+        global _CONFIGURED_THIRD_PARTY
+        if _CONFIGURED_THIRD_PARTY:
+            return
+        _CONFIGURED_THIRD_PARTY = True
 
-        # HTTP libraries
-        logging.getLogger('urllib3').setLevel(logging.WARNING)
-        logging.getLogger('requests').setLevel(logging.WARNING)
+        get_logger_ = logging.getLogger
+        for name in _NOISY_THIRD_PARTY_LOGGERS:
+            get_logger_(name).setLevel(logging.WARNING)
 
 
 def generate_correlation_id() -> str:
@@ -203,12 +349,13 @@ def set_correlation_id(correlation_id: str) -> None:
 
 def get_correlation_id() -> Optional[str]:
     """Get current correlation ID."""
-    return correlation_id_context.get()
+    correlation_id = correlation_id_context.get()
+    return None if correlation_id == _UNKNOWN_CORRELATION_ID else correlation_id
 
 
 def clear_correlation_id() -> None:
     """Clear correlation ID from current context."""
-    correlation_id_context.set(None)
+    correlation_id_context.set(_UNKNOWN_CORRELATION_ID)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -233,17 +380,21 @@ def setup_logging_from_env() -> LoggingConfig:
 
 
 # Convenience functions for common logging patterns
-def log_with_extra(logger: logging.Logger, level: int, message: str, **extra) -> None:
-    """Log a message with extra fields."""
-    logger.log(level, message, extra=extra)
+def log_with_extra(logger: logging.Logger, level: int, message: str, *args, **extra) -> None:
+    """Log a message with extra fields; ``args`` are %-interpolated only if emitted."""
+    logger.log(level, message, *args, extra=extra)
 
 
 def log_request(logger: logging.Logger, method: str, path: str, **extra) -> None:
     """Log an HTTP request."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_with_extra(
         logger,
         logging.INFO,
-        f"HTTP Request: {method} {path}",
+        "HTTP Request: %s %s",
+        method,
+        path,
         request_method=method,
         request_path=path,
         **extra
@@ -252,10 +403,16 @@ def log_request(logger: logging.Logger, method: str, path: str, **extra) -> None
 
 def log_response(logger: logging.Logger, method: str, path: str, status_code: int, duration_ms: float, **extra) -> None:
     """Log an HTTP response."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_with_extra(
         logger,
         logging.INFO,
-        f"HTTP Response: {method} {path} -> {status_code} ({duration_ms:.2f}ms)",
+        "HTTP Response: %s %s -> %d (%.2fms)",
+        method,
+        path,
+        status_code,
+        duration_ms,
         request_method=method,
         request_path=path,
         response_status=status_code,
@@ -264,26 +421,40 @@ def log_response(logger: logging.Logger, method: str, path: str, status_code: in
     )
 
 
+# Field values passed through as-is; anything else (UUIDs, dates) is stringified
+_PLAIN_LOG_TYPES = (str, int, float, bool, type(None))
+
+
 def log_database_operation(logger: logging.Logger, operation: str, table: str, **extra) -> None:
-    """Log a database operation."""
+    """Log a database operation; callers pass raw values, stringified only if emitted."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     log_with_extra(
         logger,
         logging.DEBUG,
-        f"Database {operation}: {table}",
+        "Database %s: %s",
+        operation,
+        table,
         db_operation=operation,
         db_table=table,
-        **extra
+        **{
+            key: value if isinstance(value, _PLAIN_LOG_TYPES) else str(value)
+            for key, value in extra.items()
+        }
     )
 
 
 def log_authentication_attempt(logger: logging.Logger, email: str, success: bool, **extra) -> None:
     """Log an authentication attempt."""
     level = logging.INFO if success else logging.WARNING
-    status = "successful" if success else "failed"
+    if not logger.isEnabledFor(level):
+        return
     log_with_extra(
         logger,
         level,
-        f"Authentication attempt {status} for {email}",
+        "Authentication attempt %s for %s",
+        "successful" if success else "failed",
+        email,
         auth_email=email,
         auth_success=success,
         **extra
@@ -292,10 +463,14 @@ def log_authentication_attempt(logger: logging.Logger, email: str, success: bool
 
 def log_business_rule_violation(logger: logging.Logger, rule: str, details: str, **extra) -> None:
     """Log a business rule violation."""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     log_with_extra(
         logger,
         logging.WARNING,
-        f"Business rule violation: {rule} - {details}",
+        "Business rule violation: %s - %s",
+        rule,
+        details,
         business_rule=rule,
         violation_details=details,
         **extra
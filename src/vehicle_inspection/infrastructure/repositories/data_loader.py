@@ -0,0 +1,82 @@
+"""Batching loader that coalesces concurrent by-ID lookups into one query."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Batch(Generic[K, V]):
+    """The IDs queued within one tick, the callers waiting on them and the task fetching them."""
+
+    __slots__ = ("futures", "waiters", "task")
+
+    def __init__(self) -> None:
+        self.futures: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self.waiters = 0
+        self.task: Optional["asyncio.Task[None]"] = None
+
+
+class IdDataLoader(Generic[K, V]):
+    """Collect the IDs requested within one event-loop tick and fetch them together.
+
+    ``batch_load`` receives the distinct pending IDs and returns a mapping of the ones
+    found; IDs missing from the mapping resolve to None. Nothing is cached between
+    batches, so a lookup after a write always sees fresh data. A batch is cancelled
+    once every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self, batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]]):
+        self._batch_load = batch_load
+        self._queued: Optional[_Batch[K, V]] = None
+
+    async def load(self, key: K) -> Optional[V]:
+        """Queue an ID for the current tick's batch and wait for its value."""
+        loop = asyncio.get_running_loop()
+        batch = self._queued
+        if batch is None:
+            batch = self._queued = _Batch()
+            # Dispatch after the other tasks scheduled in this tick had a chance to queue
+            loop.call_soon(self._dispatch, batch)
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+
+        batch.waiters += 1
+        try:
+            # Shielded so one caller's cancellation leaves the shared future to the others
+            return await asyncio.shield(future)
+        finally:
+            batch.waiters -= 1
+            if not batch.waiters and batch.task is not None:
+                # Nobody is left to use the result; stop the query on the shared session
+                batch.task.cancel()
+
+    def _dispatch(self, batch: _Batch[K, V]) -> None:
+        """Start fetching everything queued so far, unless every caller already left."""
+        if self._queued is batch:
+            self._queued = None
+        if batch.waiters:
+            batch.task = asyncio.ensure_future(self._resolve(batch.futures))
+
+    async def _resolve(self, pending: Dict[K, "asyncio.Future[Optional[V]]"]) -> None:
+        """Run one batch query and settle its futures."""
+        try:
+            values = await self._batch_load(list(pending))
+        except BaseException as exc:
+            for future in pending.values():
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            # The waiters own ordinary errors; cancellation and exits must keep propagating
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(values.get(key))
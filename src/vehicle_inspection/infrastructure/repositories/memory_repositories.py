@@ -1,55 +1,72 @@
 """In-memory repository implementations for testing and development."""
 
-from datetime import datetime, date, time, timedelta
-from typing import List, Optional, Dict, TYPE_CHECKING
+import sys
+from collections import defaultdict
+from datetime import datetime, date, time
+from typing import Hashable, List, Optional, Dict, Tuple
 from uuid import UUID, uuid4
 
-if TYPE_CHECKING:
-    from src.vehicle_inspection.application.ports.repositories import BookingRepository, VehicleRepository, UserRepository
-    from src.vehicle_inspection.domain.entities.booking import Booking, BookingStatus
-    from src.vehicle_inspection.domain.entities.vehicle import Vehicle
-    from src.vehicle_inspection.domain.value_objects.time_slot import TimeSlot
+from src.vehicle_inspection.application.ports.repositories import BookingRepository, VehicleRepository, UserRepository
+from src.vehicle_inspection.domain.entities.booking import Booking, BookingStatus
+from src.vehicle_inspection.domain.entities.vehicle import Vehicle
+from src.vehicle_inspection.domain.value_objects.time_slot import TimeSlot
 
+# Hourly (start, end) slots from 8 AM to 5 PM, shared by every date
+_HOURLY_SLOTS: Tuple[Tuple[time, time], ...] = tuple(
+    (time(hour, 0), time(hour + 1, 0) if hour < 16 else time(17, 0)) for hour in range(8, 17)
+)
+# Number of days ahead (including today) that slots are offered for
+_BOOKING_WINDOW_DAYS = 30
+# Statuses that hold a time slot
+_ACTIVE_BOOKING_STATUSES = frozenset({BookingStatus.PENDING, BookingStatus.CONFIRMED})
 
-class InMemoryBookingRepository(BookingRepository):
-    """In-memory implementation of booking repository."""
-
-    def __init__(self):
-        self._bookings: Dict[UUID, Booking] = {}
-        self._time_slot_generator = self._create_default_time_slots()
 
-    def _create_default_time_slots(self) -> Dict[str, List[TimeSlot]]:
-        """Create default time slots for testing."""
-        slots = {}
+def _norm_plate(plate: str) -> str:
+    """Canonical, interned form of a license plate used as an index key."""
+    return sys.intern(plate.strip().upper())
 
-        # Generate slots for next 30 days
-        for i in range(30):
-            target_date = date.today() + timedelta(days=i)
-            date_key = target_date.isoformat()
 
-            daily_slots = []
-            # Create hourly slots from 8 AM to 5 PM
-            for hour in range(8, 17):
-                start_time = time(hour, 0)
-                end_time = time(hour + 1, 0) if hour < 16 else time(17, 0)
+def _unindex(index: Dict[Hashable, Dict[UUID, None]], key: Hashable, booking_id: UUID) -> None:
+    """Remove a booking ID from a reverse index, dropping the key once it is empty."""
+    booking_ids = index.get(key)
+    if booking_ids is not None:
+        booking_ids.pop(booking_id, None)
+        if not booking_ids:
+            del index[key]
 
-                slot = TimeSlot(
-                    date=datetime.combine(target_date, start_time),
-                    start_time=start_time,
-                    end_time=end_time,
-                    is_available=True,
-                    max_bookings=1,
-                    current_bookings=0
-                )
-                daily_slots.append(slot)
 
-            slots[date_key] = daily_slots
+class InMemoryBookingRepository(BookingRepository):
+    """In-memory implementation of booking repository."""
 
-        return slots
+    def __init__(self):
+        self._bookings: Dict[UUID, Booking] = {}
+        # Active (pending/confirmed) booking count per (date, start time)
+        self._slot_counts: Dict[Tuple[date, time], int] = defaultdict(int)
+        # Slot currently held by each active booking
+        self._booking_keys: Dict[UUID, Tuple[date, time]] = {}
+        # Reverse indexes for owner and plate lookups; each value is a dict used as
+        # an insertion-ordered set of booking IDs, so lookups keep save order
+        self._by_user: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+        self._by_plate: Dict[str, Dict[UUID, None]] = defaultdict(dict)
+
+    def _release_slot(self, booking_id: UUID) -> None:
+        """Drop a booking's contribution to the slot counts."""
+        key = self._booking_keys.pop(booking_id, None)
+        if key is not None:
+            self._slot_counts[key] -= 1
+            if not self._slot_counts[key]:
+                del self._slot_counts[key]
 
     async def save(self, booking: Booking) -> Booking:
         """Save a booking."""
+        self._release_slot(booking.id)
+        if booking.status in _ACTIVE_BOOKING_STATUSES:
+            key = (booking.appointment_date.date(), booking.appointment_date.time())
+            self._slot_counts[key] += 1
+            self._booking_keys[booking.id] = key
         self._bookings[booking.id] = booking
+        self._by_user[booking.user_id][booking.id] = None
+        self._by_plate[_norm_plate(booking.license_plate)][booking.id] = None
         return booking
 
     async def find_by_id(self, booking_id: UUID) -> Optional[Booking]:
@@ -58,43 +75,29 @@ class InMemoryBookingRepository(BookingRepository):
 
     async def find_by_license_plate(self, license_plate: str) -> List[Booking]:
         """Find all bookings for a license plate."""
-        return [booking for booking in self._bookings.values()
-                if booking.license_plate == license_plate]
+        booking_ids = self._by_plate.get(_norm_plate(license_plate), ())
+        return [self._bookings[booking_id] for booking_id in booking_ids]
 
     async def find_by_user_id(self, user_id: UUID) -> List[Booking]:
         """Find all bookings for a user."""
-        return [booking for booking in self._bookings.values()
-                if booking.user_id == user_id]
+        return [self._bookings[booking_id] for booking_id in self._by_user.get(user_id, ())]
 
     async def find_available_slots(self, target_date: date) -> List[TimeSlot]:
         """Find available time slots for a specific date."""
-        date_key = target_date.isoformat()
-        if date_key not in self._time_slot_generator:
+        if not 0 <= (target_date - date.today()).days < _BOOKING_WINDOW_DAYS:
             return []
 
-        # Get base slots
-        base_slots = self._time_slot_generator[date_key]
-
-        # Count bookings for each slot
         available_slots = []
-        for slot in base_slots:
-            # Count bookings in this time slot
-            booked_count = sum(1 for booking in self._bookings.values()
-                             if (booking.appointment_date.date() == target_date and
-                                 booking.appointment_date.time() == slot.start_time and
-                                 booking.status in [BookingStatus.PENDING, BookingStatus.CONFIRMED]))
-
-            # Update slot with current booking count
-            updated_slot = TimeSlot(
-                date=slot.date,
-                start_time=slot.start_time,
-                end_time=slot.end_time,
-                is_available=booked_count < slot.max_bookings,
-                max_bookings=slot.max_bookings,
+        for start_time, end_time in _HOURLY_SLOTS:
+            booked_count = self._slot_counts.get((target_date, start_time), 0)
+            available_slots.append(TimeSlot(
+                date=datetime.combine(target_date, start_time),
+                start_time=start_time,
+                end_time=end_time,
+                is_available=booked_count < 1,
+                max_bookings=1,
                 current_bookings=booked_count
-            )
-
-            available_slots.append(updated_slot)
+            ))
 
         return available_slots
 
@@ -115,10 +118,13 @@ class InMemoryBookingRepository(BookingRepository):
 
     async def delete(self, booking_id: UUID) -> bool:
         """Delete a booking."""
-        if booking_id in self._bookings:
-            del self._bookings[booking_id]
-            return True
-        return False
+        booking = self._bookings.pop(booking_id, None)
+        if booking is None:
+            return False
+        self._release_slot(booking_id)
+        _unindex(self._by_user, booking.user_id, booking_id)
+        _unindex(self._by_plate, _norm_plate(booking.license_plate), booking_id)
+        return True
 
 
 class InMemoryVehicleRepository(VehicleRepository):
@@ -129,12 +135,12 @@ class InMemoryVehicleRepository(VehicleRepository):
 
     async def save(self, vehicle: Vehicle) -> Vehicle:
         """Save a vehicle."""
-        self._vehicles[vehicle.license_plate] = vehicle
+        self._vehicles[_norm_plate(vehicle.license_plate)] = vehicle
         return vehicle
 
     async def find_by_license_plate(self, license_plate: str) -> Optional[Vehicle]:
         """Find vehicle by license plate."""
-        return self._vehicles.get(license_plate)
+        return self._vehicles.get(_norm_plate(license_plate))
 
     async def find_all(self) -> List[Vehicle]:
         """Find all vehicles."""
@@ -142,10 +148,7 @@ class InMemoryVehicleRepository(VehicleRepository):
 
     async def delete(self, license_plate: str) -> bool:
         """Delete a vehicle."""
-        if license_plate in self._vehicles:
-            del self._vehicles[license_plate]
-            return True
-        return False
+        return self._vehicles.pop(_norm_plate(license_plate), None) is not None
 
 
 class InMemoryUserRepository(UserRepository):
@@ -158,14 +161,14 @@ class InMemoryUserRepository(UserRepository):
 
     def _create_test_users(self):
         """Create some test users."""
-        test_users = [
-            {"id": uuid4(), "email": "user1@example.com", "role": "owner"},
-            {"id": uuid4(), "email": "user2@example.com", "role": "owner"},
-            {"id": uuid4(), "email": "inspector@example.com", "role": "inspector"},
-        ]
-
-        for user in test_users:
-            self._users[user["id"]] = user
+        self._users.update(
+            (user_id, {"id": user_id, "email": email, "role": role})
+            for user_id, email, role in (
+                (uuid4(), "user1@example.com", "owner"),
+                (uuid4(), "user2@example.com", "owner"),
+                (uuid4(), "inspector@example.com", "inspector"),
+            )
+        )
 
     async def find_by_id(self, user_id: UUID) -> Optional[dict]:
         """Find user by ID."""
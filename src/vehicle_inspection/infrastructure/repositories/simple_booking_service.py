@@ -1,13 +1,38 @@
 """Simple in-memory repositories for development."""
 
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime, date, time, timedelta
-from typing import List, Optional, Dict
+from time import time_ns
+from typing import List, Optional, Dict, Set, Tuple
 from uuid import UUID, uuid4
 
+# Hourly (start, end) slots from 8 AM to 5 PM, shared by every date
+_HOURLY_SLOTS: Tuple[Tuple[time, time], ...] = tuple(
+    (time(hour, 0), time(hour + 1, 0) if hour < 16 else time(17, 0)) for hour in range(8, 17)
+)
+# Statuses that hold a time slot / that can no longer change
+_ACTIVE_STATUSES = frozenset({"pending", "confirmed"})
+_CLOSED_STATUSES = frozenset({"completed", "cancelled"})
+# License plates of the vehicles seeded for development
+_TEST_PLATES = ("ABC123", "XYZ789", "DEF456")
+# Naive UTC epoch used to materialize nanosecond timestamps
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _norm_plate(plate: str) -> str:
+    """Canonical, interned form of a license plate."""
+    return sys.intern(plate.strip().upper())
+
 
 class SimpleBooking:
     """Simple booking data class."""
 
+    __slots__ = (
+        "id", "license_plate", "appointment_date", "slot_key", "user_id", "status",
+        "_created_ns", "_updated_ns"
+    )
+
     def __init__(
         self,
         license_plate: str,
@@ -19,29 +44,45 @@ class SimpleBooking:
         self.id = booking_id or uuid4()
         self.license_plate = license_plate
         self.appointment_date = appointment_date
+        # (date, start time) of the appointment, decomposed once
+        self.slot_key = (appointment_date.date(), appointment_date.time())
         self.user_id = user_id
         self.status = status
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        # Epoch nanoseconds; converted to datetimes only when read
+        self._created_ns = self._updated_ns = time_ns()
+
+    @property
+    def created_at(self) -> datetime:
+        """Get creation time (naive UTC)."""
+        return _EPOCH + timedelta(microseconds=self._created_ns // 1000)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Get last update time (naive UTC)."""
+        return _EPOCH + timedelta(microseconds=self._updated_ns // 1000)
 
     def confirm(self) -> None:
         """Confirm the booking."""
         if self.status != "pending":
             raise ValueError("Only pending bookings can be confirmed")
         self.status = "confirmed"
-        self.updated_at = datetime.utcnow()
+        self._updated_ns = time_ns()
 
     def cancel(self) -> None:
         """Cancel the booking."""
-        if self.status in ["completed", "cancelled"]:
+        if self.status in _CLOSED_STATUSES:
             raise ValueError("Cannot cancel completed or already cancelled bookings")
         self.status = "cancelled"
-        self.updated_at = datetime.utcnow()
+        self._updated_ns = time_ns()
 
 
 class SimpleTimeSlot:
     """Simple time slot data class."""
 
+    __slots__ = (
+        "date", "start_time", "end_time", "is_available", "max_bookings", "current_bookings"
+    )
+
     def __init__(
         self,
         date: datetime,
@@ -76,6 +117,10 @@ class InMemoryBookingService:
         self._bookings: Dict[UUID, SimpleBooking] = {}
         self._users: Dict[UUID, dict] = {}
         self._vehicles: Dict[str, dict] = {}
+        # Active (pending/confirmed) booking counts grouped by date, then start time
+        self._slot_counts: Dict[date, Counter[time]] = defaultdict(Counter)
+        # Booking ids per owner
+        self._by_user: Dict[UUID, Set[UUID]] = defaultdict(set)
         self._create_test_data()
 
     def _create_test_data(self):
@@ -89,15 +134,16 @@ class InMemoryBookingService:
         }
 
         # Test vehicles
-        test_plates = ["ABC123", "XYZ789", "DEF456"]
-        for plate in test_plates:
-            self._vehicles[plate] = {
+        self._vehicles = {
+            plate: {
                 "license_plate": plate,
                 "make": "TestMake",
                 "model": "TestModel",
                 "year": 2020,
                 "vehicle_type": "car"
             }
+            for plate in map(_norm_plate, _TEST_PLATES)
+        }
 
     def get_test_user_id(self) -> UUID:
         """Get test user ID."""
@@ -121,7 +167,7 @@ class InMemoryBookingService:
             raise ValueError("User not found")
 
         # Normalize license plate
-        normalized_plate = license_plate.strip().upper()
+        normalized_plate = _norm_plate(license_plate)
 
         # Check if slot is available
         if not await self.is_slot_available(appointment_date):
@@ -136,6 +182,9 @@ class InMemoryBookingService:
 
         # Store booking
         self._bookings[booking.id] = booking
+        self._by_user[user_id].add(booking.id)
+        slot_date, slot_time = booking.slot_key
+        self._slot_counts[slot_date][slot_time] += 1
 
         # Add vehicle if it doesn't exist
         if normalized_plate not in self._vehicles:
@@ -155,8 +204,7 @@ class InMemoryBookingService:
 
     async def get_user_bookings(self, user_id: UUID) -> List[SimpleBooking]:
         """Get all bookings for a user."""
-        return [booking for booking in self._bookings.values()
-                if booking.user_id == user_id]
+        return [self._bookings[booking_id] for booking_id in self._by_user.get(user_id, ())]
 
     async def confirm_booking(self, booking_id: UUID, user_id: UUID) -> SimpleBooking:
         """Confirm a booking."""
@@ -179,24 +227,22 @@ class InMemoryBookingService:
         if booking.user_id != user_id:
             raise ValueError("You can only cancel your own bookings")
 
+        was_active = booking.status in _ACTIVE_STATUSES
         booking.cancel()
+        if was_active:
+            slot_date, slot_time = booking.slot_key
+            self._slot_counts[slot_date][slot_time] -= 1
         return booking
 
     async def get_available_slots(self, target_date: date) -> List[SimpleTimeSlot]:
         """Get available slots for a date."""
         slots = []
+        # One lookup for the whole day; missing times count as zero
+        counts = self._slot_counts.get(target_date, Counter())
 
-        # Generate hourly slots from 8 AM to 5 PM
-        for hour in range(8, 17):
-            start_time = time(hour, 0)
-            end_time = time(hour + 1, 0) if hour < 16 else time(17, 0)
-
-            # Count existing bookings for this slot
+        for start_time, end_time in _HOURLY_SLOTS:
             slot_datetime = datetime.combine(target_date, start_time)
-            booked_count = sum(1 for booking in self._bookings.values()
-                             if (booking.appointment_date.date() == target_date and
-                                 booking.appointment_date.time() == start_time and
-                                 booking.status in ["pending", "confirmed"]))
+            booked_count = counts[start_time]
 
             slot = SimpleTimeSlot(
                 date=slot_datetime,
@@ -216,10 +262,4 @@ class InMemoryBookingService:
         target_date = appointment_date.date()
         target_time = appointment_date.time()
 
-        # Count bookings for this exact datetime
-        booked_count = sum(1 for booking in self._bookings.values()
-                         if (booking.appointment_date.date() == target_date and
-                             booking.appointment_date.time() == target_time and
-                             booking.status in ["pending", "confirmed"]))
-
-        return booked_count == 0
+        return self._slot_counts.get(target_date, Counter())[target_time] == 0
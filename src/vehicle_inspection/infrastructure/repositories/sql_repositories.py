@@ -1,12 +1,19 @@
 """SQLAlchemy repository implementations."""
 
-import json
+import heapq
+import itertools
+import logging
+from contextlib import contextmanager
 from datetime import datetime, date, time, timedelta
-from typing import List, Optional, Dict
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Callable, Iterator, List, Optional, Dict, Sequence, Tuple, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select, and_, func, delete, desc
+from sqlalchemy import Date, bindparam, cast, column, event, select, and_, func, delete, desc, exists, table, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, raiseload
 from sqlalchemy.exc import IntegrityError
 
 from src.vehicle_inspection.infrastructure.logging import (
@@ -18,115 +25,386 @@ from src.vehicle_inspection.application.ports.repositories import BookingReposit
 from src.vehicle_inspection.domain.entities.booking import Booking, BookingStatus
 from src.vehicle_inspection.domain.entities.vehicle import Vehicle, Car, Motorcycle
 from src.vehicle_inspection.domain.entities.inspector import Inspector, InspectorRole, InspectorStatus
-from src.vehicle_inspection.domain.entities.inspection import Inspection, InspectionStatus
+from src.vehicle_inspection.domain.entities.inspection import PLATE_SEPARATORS, Inspection, InspectionStatus
 from src.vehicle_inspection.domain.value_objects.time_slot import TimeSlot
 from src.vehicle_inspection.domain.value_objects.auth import AuthToken
 from src.vehicle_inspection.domain.value_objects.checkpoint_score import CheckpointScore
 from src.vehicle_inspection.domain.value_objects.checkpoint_types import CheckpointType
-from src.vehicle_inspection.infrastructure.database.models import BookingModel, TimeSlotModel, VehicleModel, UserModel, InspectorModel, InspectionModel
+from src.vehicle_inspection.infrastructure.repositories.data_loader import IdDataLoader
+from src.vehicle_inspection.infrastructure.database.models import ACTIVE_SLOT_INDEX, DB_UTC_NOW, BookingModel, TimeSlotModel, VehicleModel, UserModel, InspectorModel, InspectionModel
+
+# Entity finders hydrate columns only; any relationship access must be loaded explicitly
+# (e.g. selectinload) instead of silently issuing one lazy SELECT per row
+_NO_LAZY_LOADS = raiseload("*")
+
+# Stored vehicle_type values and the entity class each one maps back to
+_VEHICLE_TYPE_NAMES: Dict[type, str] = {Car: "car", Motorcycle: "motorcycle"}
+_VEHICLE_CTORS: Dict[str, type] = {name: cls for cls, name in _VEHICLE_TYPE_NAMES.items()}
+
+# Core statements for the hot auth/existence paths, built once against the tables so
+# each call only binds parameters and skips ORM entity construction
+_INSPECTORS = InspectorModel.__table__
+_INSPECTOR_AUTH_ROW_BY_EMAIL = select(
+    _INSPECTORS.c.id,
+    _INSPECTORS.c.password_hash,
+    _INSPECTORS.c.status,
+    _INSPECTORS.c.failed_login_attempts,
+    _INSPECTORS.c.locked_until
+).where(_INSPECTORS.c.email == bindparam("email")).with_for_update()
+_INSPECTOR_PASSWORD_HASH = select(_INSPECTORS.c.password_hash).where(
+    _INSPECTORS.c.id == bindparam("inspector_id")
+)
+_INSPECTOR_FAILED_ATTEMPTS = select(_INSPECTORS.c.failed_login_attempts).where(
+    _INSPECTORS.c.id == bindparam("inspector_id")
+)
+_INSPECTOR_LOCKED_UNTIL = select(_INSPECTORS.c.locked_until).where(
+    _INSPECTORS.c.id == bindparam("inspector_id")
+)
+_USER_EXISTS = select(exists().where(UserModel.__table__.c.id == bindparam("user_id")))
+
+
+def _on_booking_conflict(stmt: Any) -> Any:
+    """Turn a bookings INSERT into an upsert keyed on the booking ID."""
+    return stmt.on_conflict_do_update(
+        index_elements=[BookingModel.id],
+        set_={
+            "license_plate": stmt.excluded.license_plate,
+            "appointment_date": stmt.excluded.appointment_date,
+            "status": stmt.excluded.status,
+            "user_id": stmt.excluded.user_id,
+            "updated_at": DB_UTC_NOW,
+        }
+    )
+
+
+# Booking upsert shared by save and save_many; rows are bound at execute time so a
+# list of rows goes through the driver's executemany path
+_BOOKING_UPSERT = _on_booking_conflict(pg_insert(BookingModel))
+# Single-row saves read back the stored timestamps in the same round trip
+_BOOKING_UPSERT_RETURNING = _BOOKING_UPSERT.returning(
+    BookingModel.created_at, BookingModel.updated_at
+)
+
+# Batches of at least this many bookings are COPYed into a session-local staging
+# table and upserted from there in one statement
+_COPY_THRESHOLD = 100
+_BOOKING_COPY_COLUMNS = ("id", "license_plate", "appointment_date", "status", "user_id", "created_at")
+_BOOKING_STAGE = table("booking_stage", *(column(name) for name in _BOOKING_COPY_COLUMNS))
+_CREATE_BOOKING_STAGE = text(
+    "CREATE TEMP TABLE IF NOT EXISTS booking_stage "
+    "(LIKE bookings INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+_BOOKING_UPSERT_FROM_STAGE = _on_booking_conflict(
+    pg_insert(BookingModel).from_select(_BOOKING_COPY_COLUMNS, select(_BOOKING_STAGE))
+)
+_CLEAR_BOOKING_STAGE = text("TRUNCATE booking_stage")
+
+
+@contextmanager
+def _slot_conflicts_as_value_error() -> Iterator[None]:
+    """Report a violation of the active-slot unique index as an unavailable slot."""
+    try:
+        yield
+    except IntegrityError as exc:
+        # The partial unique index is the authoritative double-booking check
+        if ACTIVE_SLOT_INDEX in str(exc.orig):
+            raise ValueError("Selected time slot is not available") from exc
+        raise
+
+# Default hourly (start, end) slot times from 8 AM to 5 PM
+_DEFAULT_SLOT_HOURS: Tuple[Tuple[time, time], ...] = tuple(
+    (time(hour, 0), time(hour + 1, 0) if hour < 16 else time(17, 0)) for hour in range(8, 17)
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_plate(license_plate: str) -> str:
+    """Normalize an inspection license plate (upper-case, no spaces or dashes)."""
+    return license_plate.upper().translate(PLATE_SEPARATORS)
+
+
+# Cache entries a session's writes invalidate are evicted only when its transaction
+# ends: evicting before the commit lets a concurrent reader re-cache the old rows,
+# and a rollback must still drop anything cached from the session's uncommitted reads
+_PENDING_EVICTIONS = "pending_cache_evictions"
+
+
+def _evict_after_transaction(session: AsyncSession, cache: Dict[Any, Any], key: Any = None) -> None:
+    """Drop a cache key, or the whole cache when no key is given, once the session's transaction ends."""
+    session.sync_session.info.setdefault(_PENDING_EVICTIONS, []).append((cache, key))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _apply_pending_evictions(session: Session, transaction: SessionTransaction) -> None:
+    """Evict the registered cache entries when the outermost transaction commits or rolls back."""
+    if transaction.parent is not None:
+        return
+    for cache, key in session.info.pop(_PENDING_EVICTIONS, ()):
+        if key is None:
+            cache.clear()
+        else:
+            cache.pop(key, None)
+
+
+# Availability is read far more often than bookings change; remember each day's
+# slots briefly, process-wide, and drop a day once a write to its bookings commits
+_SLOTS_CACHE_TTL_SECONDS = 30.0
+_SLOTS_CACHE_MAX_DATES = 2048
+_SLOTS_CACHE: Dict[date, Tuple[float, Tuple[TimeSlot, ...]]] = {}
+
+# Inspection counts back repeated per-inspector/per-plate checks; keep each briefly,
+# process-wide, and drop the affected keys once an inspection write commits
+_COUNTS_CACHE_TTL_SECONDS = 5.0
+_COUNTS_CACHE_MAX_KEYS = 10_000
+_COUNTS_CACHE: Dict[Tuple[str, Any], Tuple[float, int]] = {}
+
+
+def _cached_count(key: Tuple[str, Any]) -> Optional[int]:
+    """Return a still-fresh cached inspection count, if any."""
+    cached = _COUNTS_CACHE.get(key)
+    if cached is not None and cached[0] > monotonic():
+        return cached[1]
+    return None
+
+
+def _remember_count(key: Tuple[str, Any], count: int) -> None:
+    """Cache an inspection count for the TTL window."""
+    if len(_COUNTS_CACHE) >= _COUNTS_CACHE_MAX_KEYS:
+        _COUNTS_CACHE.clear()
+    _COUNTS_CACHE[key] = (monotonic() + _COUNTS_CACHE_TTL_SECONDS, count)
+
+
+def _forget_counts(session: AsyncSession, inspection: Inspection) -> None:
+    """Drop the cached counts a write to this inspection may change, once it commits."""
+    _evict_after_transaction(session, _COUNTS_CACHE, ("inspector", inspection.inspector_id))
+    _evict_after_transaction(session, _COUNTS_CACHE, ("plate", inspection.normalized_license_plate))
+
+
+# Checkpoint types by stored value, resolved per score on every inspection row read
+_CHECKPOINT_TYPE_BY_VALUE: Dict[str, CheckpointType] = {member.value: member for member in CheckpointType}
+
+# Rows fetched per round trip when streaming history-sized result sets
+_STREAM_BATCH_SIZE = 500
+
+_Entity = TypeVar("_Entity")
+
+
+async def _stream_entities(
+    session: AsyncSession,
+    stmt: Any,
+    convert: Callable[[Any], _Entity],
+    params: Optional[Dict[str, Any]] = None
+) -> List[_Entity]:
+    """Convert a query's models batch by batch from a server-side cursor."""
+    result = await session.stream_scalars(
+        stmt.execution_options(yield_per=_STREAM_BATCH_SIZE), params
+    )
+    return [convert(model) async for model in result]
+
+
+@lru_cache(maxsize=4096)
+def _default_slots_for(target_date: date) -> Tuple[TimeSlot, ...]:
+    """Build the default hourly slots (8 AM to 5 PM) for a date, shared between calls."""
+    return tuple(
+        TimeSlot(
+            date=datetime.combine(target_date, start_time),
+            start_time=start_time,
+            end_time=end_time,
+            is_available=True,
+            max_bookings=1,
+            current_bookings=0
+        )
+        for start_time, end_time in _DEFAULT_SLOT_HOURS
+    )
 
 
 class SQLAlchemyBookingRepository(BookingRepository):
     """SQLAlchemy implementation of booking repository."""
 
-    def __init__(self, session: AsyncSession):
+    # Lookups prebuilt once with bind parameters; calls only bind values
+    _FIND_BY_IDS = select(BookingModel).options(_NO_LAZY_LOADS).where(
+        BookingModel.id.in_(bindparam("ids", expanding=True))
+    )
+    _FIND_BY_LICENSE_PLATE = select(BookingModel).options(_NO_LAZY_LOADS).where(
+        BookingModel.license_plate == bindparam("license_plate")
+    ).order_by(BookingModel.appointment_date.desc())
+    _FIND_BY_USER_ID = select(BookingModel).options(_NO_LAZY_LOADS).where(
+        BookingModel.user_id == bindparam("user_id")
+    ).order_by(BookingModel.appointment_date.desc())
+    # Any active booking at the time takes the slot; EXISTS stops at the first match
+    _SLOT_TAKEN = select(exists().where(
+        BookingModel.appointment_date == bindparam("appointment_date"),
+        BookingModel.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
+    ))
+
+    def __init__(self, session: AsyncSession, cache_ttl_seconds: float = _SLOTS_CACHE_TTL_SECONDS):
         self._session = session
         self._logger = get_logger(__name__)
+        self._loader: IdDataLoader[UUID, Booking] = IdDataLoader(self._load_by_ids)
+        self._cache_by_id: Dict[UUID, Optional[Booking]] = {}
+        self._cache_ttl_seconds = cache_ttl_seconds
 
     async def save(self, booking: Booking) -> Booking:
         """Save a booking to the database."""
-        # Check if booking exists
-        stmt = select(BookingModel).where(BookingModel.id == booking.id)
-        result = await self._session.execute(stmt)
-        existing_booking = result.scalar_one_or_none()
-
-        if existing_booking:
-            # Update existing booking
-            existing_booking.license_plate = booking.license_plate
-            existing_booking.appointment_date = booking.appointment_date
-            existing_booking.status = booking.status
-            existing_booking.user_id = booking.user_id
-            existing_booking.updated_at = datetime.utcnow()
-        else:
-            # Create new booking
-            booking_model = BookingModel(
-                id=booking.id,
-                license_plate=booking.license_plate,
-                appointment_date=booking.appointment_date,
-                status=booking.status,
-                user_id=booking.user_id,
-                created_at=booking.created_at,
-                updated_at=datetime.utcnow()
+        self._cache_by_id.pop(booking.id, None)
+        _evict_after_transaction(self._session, _SLOTS_CACHE, booking.appointment_date.date())
+        # Single round trip: the database decides between insert and update
+        with _slot_conflicts_as_value_error():
+            result = await self._session.execute(
+                _BOOKING_UPSERT_RETURNING, self._entity_to_row(booking)
             )
-            self._session.add(booking_model)
-
-        await self._session.flush()
+        booking.sync_timestamps(*result.one())
         return booking
 
-    async def find_by_id(self, booking_id: UUID) -> Optional[Booking]:
-        """Find booking by ID."""
-        stmt = select(BookingModel).where(BookingModel.id == booking_id)
-        result = await self._session.execute(stmt)
-        booking_model = result.scalar_one_or_none()
+    async def save_many(self, bookings: List[Booking]) -> List[Booking]:
+        """Save several bookings with one executemany upsert, or COPY for large batches."""
+        for booking in bookings:
+            self._cache_by_id.pop(booking.id, None)
+            _evict_after_transaction(self._session, _SLOTS_CACHE, booking.appointment_date.date())
+        with _slot_conflicts_as_value_error():
+            if len(bookings) >= _COPY_THRESHOLD:
+                await self._copy_upsert(bookings)
+            elif bookings:
+                await self._session.execute(
+                    _BOOKING_UPSERT, [self._entity_to_row(booking) for booking in bookings]
+                )
+        return bookings
+
+    async def _copy_upsert(self, bookings: List[Booking]) -> None:
+        """Stream bookings into the staging table with COPY, then upsert them at once."""
+        # One upsert statement cannot touch a row twice; the last save of an ID wins,
+        # as it would through the executemany path
+        bookings = list({booking.id: booking for booking in bookings}.values())
+        await self._session.execute(_CREATE_BOOKING_STAGE)
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "booking_stage",
+            records=[
+                (
+                    booking.id,
+                    booking.license_plate,
+                    booking.appointment_date,
+                    booking.status.name,  # the enum column stores member names
+                    booking.user_id,
+                    booking.created_at,
+                )
+                for booking in bookings
+            ],
+            columns=list(_BOOKING_COPY_COLUMNS)
+        )
+        await self._session.execute(_BOOKING_UPSERT_FROM_STAGE)
+        await self._session.execute(_CLEAR_BOOKING_STAGE)
 
-        if not booking_model:
-            return None
+    @staticmethod
+    def _entity_to_row(booking: Booking) -> Dict[str, Any]:
+        """Convert domain entity to upsert parameters."""
+        return {
+            "id": booking.id,
+            "license_plate": booking.license_plate,
+            "appointment_date": booking.appointment_date,
+            "status": booking.status,
+            "user_id": booking.user_id,
+            "created_at": booking.created_at,
+        }
 
-        return self._model_to_entity(booking_model)
+    async def find_by_id(self, booking_id: UUID) -> Optional[Booking]:
+        """Find booking by ID, batched with concurrent lookups and cached per session."""
+        if booking_id in self._cache_by_id:
+            return self._cache_by_id[booking_id]
 
-    async def find_by_license_plate(self, license_plate: str) -> List[Booking]:
-        """Find all bookings for a license plate."""
-        stmt = select(BookingModel).where(
-            BookingModel.license_plate == license_plate.upper()
-        ).order_by(BookingModel.appointment_date.desc())
+        booking = await self._loader.load(booking_id)
+        self._cache_by_id[booking_id] = booking
+        return booking
 
-        result = await self._session.execute(stmt)
-        booking_models = result.scalars().all()
+    async def find_many_by_ids(self, booking_ids: Sequence[UUID]) -> Dict[UUID, Booking]:
+        """Find several bookings with one IN query, keyed by ID."""
+        if not booking_ids:
+            return {}
+        return await self._load_by_ids(list(booking_ids))
 
-        return [self._model_to_entity(model) for model in booking_models]
+    async def _load_by_ids(self, booking_ids: List[UUID]) -> Dict[UUID, Booking]:
+        """Load a batch of bookings keyed by ID."""
+        result = await self._session.execute(self._FIND_BY_IDS, {"ids": booking_ids})
+        return {model.id: self._model_to_entity(model) for model in result.scalars()}
+
+    async def find_by_license_plate(self, license_plate: str) -> List[Booking]:
+        """Find all bookings for a license plate (expects the normalized, upper-case plate)."""
+        return await _stream_entities(
+            self._session, self._FIND_BY_LICENSE_PLATE, self._model_to_entity,
+            {"license_plate": license_plate}
+        )
 
     async def find_by_user_id(self, user_id: UUID) -> List[Booking]:
         """Find all bookings for a user."""
-        stmt = select(BookingModel).where(
-            BookingModel.user_id == user_id
-        ).order_by(BookingModel.appointment_date.desc())
-
-        result = await self._session.execute(stmt)
-        booking_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in booking_models]
+        return await _stream_entities(
+            self._session, self._FIND_BY_USER_ID, self._model_to_entity, {"user_id": user_id}
+        )
 
     async def find_available_slots(self, target_date: date) -> List[TimeSlot]:
-        """Find available time slots for a specific date."""
+        """Find available time slots for a specific date, cached briefly per date."""
+        cached = _SLOTS_CACHE.get(target_date)
+        now = monotonic()
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
+
+        slots = await self._query_available_slots(target_date)
+        if self._cache_ttl_seconds > 0:
+            if len(_SLOTS_CACHE) >= _SLOTS_CACHE_MAX_DATES:
+                _SLOTS_CACHE.clear()
+            _SLOTS_CACHE[target_date] = (now + self._cache_ttl_seconds, tuple(slots))
+        return slots
+
+    async def _query_available_slots(self, target_date: date) -> List[TimeSlot]:
+        """Load a date's slots with their live booking counts."""
         log_database_operation(
             self._logger,
             "SELECT",
             "TimeSlotModel",
-            extra={"target_date": str(target_date)}
+            target_date=target_date
         )
 
-        # First, try to get existing time slots from database
+        # First, try to get existing time slots from database, together with their
+        # live booking counts so callers need no per-slot availability queries
         start_of_day = datetime.combine(target_date, time.min)
         end_of_day = datetime.combine(target_date, time.max)
 
-        stmt = select(TimeSlotModel).where(
+        booking_counts = select(
+            BookingModel.appointment_date,
+            func.count().label("booking_count")
+        ).where(
             and_(
-                TimeSlotModel.date >= start_of_day,
-                TimeSlotModel.date <= end_of_day,
-                TimeSlotModel.is_available == True
+                BookingModel.appointment_date >= start_of_day,
+                BookingModel.appointment_date <= end_of_day,
+                BookingModel.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
             )
+        ).group_by(BookingModel.appointment_date).subquery()
+
+        stmt = select(
+            TimeSlotModel,
+            func.coalesce(booking_counts.c.booking_count, 0)
+        ).outerjoin(
+            booking_counts, booking_counts.c.appointment_date == TimeSlotModel.date
+        ).where(
+            # Matches the ix_time_slots_day expression index with a single equality
+            cast(TimeSlotModel.date, Date) == target_date,
+            TimeSlotModel.is_available.is_(True)
         ).order_by(TimeSlotModel.start_time)
 
         result = await self._session.execute(stmt)
-        slot_models = result.scalars().all()
+        slot_models = result.all()
 
         if slot_models:
             # Return existing slots from database
-            self._logger.debug(
-                "Found existing time slots in database",
-                extra={"slot_count": len(slot_models), "date": str(target_date)}
-            )
-            return [self._slot_model_to_value_object(model) for model in slot_models]
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Found existing time slots in database",
+                    extra={"slot_count": len(slot_models), "date": str(target_date)}
+                )
+            return [
+                self._slot_model_to_value_object(model, booking_count)
+                for model, booking_count in slot_models
+            ]
         else:
             # Generate default slots if none exist
             self._logger.info(
@@ -141,39 +419,34 @@ class SQLAlchemyBookingRepository(BookingRepository):
             self._logger,
             "SELECT",
             "BookingModel",
-            extra={"appointment_date": str(appointment_date), "operation": "availability_check"}
-        )
-
-        # Check if there are any conflicting bookings
-        stmt = select(func.count(BookingModel.id)).where(
-            and_(
-                BookingModel.appointment_date == appointment_date,
-                BookingModel.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
-            )
+            appointment_date=appointment_date,
+            check="availability"
         )
 
-        result = await self._session.execute(stmt)
-        booking_count = result.scalar()
-
         # For now, assume max 1 booking per slot
-        is_available = booking_count < 1
-        self._logger.debug(
-            "Slot availability check completed",
-            extra={
-                "appointment_date": str(appointment_date),
-                "booking_count": booking_count,
-                "is_available": is_available
-            }
+        is_available = not await self._session.scalar(
+            self._SLOT_TAKEN, {"appointment_date": appointment_date}
         )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Slot availability check completed",
+                extra={
+                    "appointment_date": str(appointment_date),
+                    "is_available": is_available
+                }
+            )
         return is_available
 
     async def delete(self, booking_id: UUID) -> bool:
         """Delete a booking."""
+        self._cache_by_id.pop(booking_id, None)
+        # Only the ID is known here, so forget every cached day
+        _evict_after_transaction(self._session, _SLOTS_CACHE)
         log_database_operation(
             self._logger,
             "DELETE",
             "BookingModel",
-            extra={"booking_id": str(booking_id)}
+            booking_id=booking_id
         )
 
         stmt = delete(BookingModel).where(BookingModel.id == booking_id)
@@ -205,308 +478,345 @@ class SQLAlchemyBookingRepository(BookingRepository):
             updated_at=model.updated_at
         )
 
-    def _slot_model_to_value_object(self, model: TimeSlotModel) -> TimeSlot:
-        """Convert database slot model to value object."""
+    def _slot_model_to_value_object(self, model: TimeSlotModel, booking_count: int) -> TimeSlot:
+        """Convert database slot model and its active booking count to value object."""
+        current_bookings = min(booking_count, model.max_bookings)
         return TimeSlot(
             date=model.date,
             start_time=model.start_time.time(),
             end_time=model.end_time.time(),
-            is_available=model.is_available,
+            is_available=model.is_available and current_bookings < model.max_bookings,
             max_bookings=model.max_bookings,
-            current_bookings=model.current_bookings
+            current_bookings=current_bookings
         )
 
     def _generate_default_slots(self, target_date: date) -> List[TimeSlot]:
         """Generate default time slots for a date."""
-        slots = []
-
-        # Create hourly slots from 8 AM to 5 PM
-        for hour in range(8, 17):
-            start_time = time(hour, 0)
-            end_time = time(hour + 1, 0) if hour < 16 else time(17, 0)
-
-            slot = TimeSlot(
-                date=datetime.combine(target_date, start_time),
-                start_time=start_time,
-                end_time=end_time,
-                is_available=True,
-                max_bookings=1,
-                current_bookings=0
-            )
-            slots.append(slot)
-
-        return slots
+        return list(_default_slots_for(target_date))
 
 
 class SQLAlchemyVehicleRepository(VehicleRepository):
     """SQLAlchemy implementation of vehicle repository."""
 
+    _FIND_BY_PLATES = select(VehicleModel).options(_NO_LAZY_LOADS).where(
+        VehicleModel.license_plate.in_(bindparam("license_plates", expanding=True))
+    )
+
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._cache_by_plate: Dict[str, Optional[Vehicle]] = {}
 
     async def save(self, vehicle: Vehicle) -> Vehicle:
         """Save a vehicle to the database."""
-        # Check if vehicle exists
-        stmt = select(VehicleModel).where(VehicleModel.license_plate == vehicle.license_plate)
-        result = await self._session.execute(stmt)
-        existing_vehicle = result.scalar_one_or_none()
-
-        if existing_vehicle:
-            # Update existing vehicle
-            existing_vehicle.make = vehicle.make
-            existing_vehicle.model = vehicle.model
-            existing_vehicle.year = vehicle.year
-            existing_vehicle.vehicle_type = vehicle.__class__.__name__.lower()
-            existing_vehicle.updated_at = datetime.utcnow()
-        else:
-            # Create new vehicle
-            vehicle_model = VehicleModel(
-                license_plate=vehicle.license_plate,
-                make=vehicle.make,
-                model=vehicle.model,
-                year=vehicle.year,
-                vehicle_type=vehicle.__class__.__name__.lower(),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            self._session.add(vehicle_model)
-
-        await self._session.flush()
+        self._cache_by_plate.pop(vehicle.license_plate, None)
+        stmt = pg_insert(VehicleModel).values(
+            license_plate=vehicle.license_plate,
+            make=vehicle.make,
+            model=vehicle.model,
+            year=vehicle.year,
+            vehicle_type=(
+                _VEHICLE_TYPE_NAMES.get(type(vehicle)) or type(vehicle).__name__.lower()
+            ),
+            created_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VehicleModel.license_plate],
+            set_={
+                "make": stmt.excluded.make,
+                "model": stmt.excluded.model,
+                "year": stmt.excluded.year,
+                "vehicle_type": stmt.excluded.vehicle_type,
+                "updated_at": DB_UTC_NOW,
+            }
+        )
+        await self._session.execute(stmt)
         return vehicle
 
     async def find_by_license_plate(self, license_plate: str) -> Optional[Vehicle]:
-        """Find vehicle by license plate."""
-        stmt = select(VehicleModel).where(VehicleModel.license_plate == license_plate.upper())
-        result = await self._session.execute(stmt)
-        vehicle_model = result.scalar_one_or_none()
+        """Find vehicle by license plate (expects the normalized, upper-case plate)."""
+        if license_plate in self._cache_by_plate:
+            return self._cache_by_plate[license_plate]
 
-        if not vehicle_model:
-            return None
+        # The plate is the primary key, so the identity map may answer without SQL
+        vehicle_model = await self._session.get(
+            VehicleModel, license_plate, options=[_NO_LAZY_LOADS]
+        )
+        vehicle = self._model_to_entity(vehicle_model) if vehicle_model else None
+        self._cache_by_plate[license_plate] = vehicle
+        return vehicle
 
-        return self._model_to_entity(vehicle_model)
+    async def find_many_by_license_plates(self, license_plates: Sequence[str]) -> Dict[str, Vehicle]:
+        """Find several vehicles with one IN query, keyed by the normalized plate."""
+        if not license_plates:
+            return {}
+        result = await self._session.execute(
+            self._FIND_BY_PLATES, {"license_plates": list(license_plates)}
+        )
+        return {model.license_plate: self._model_to_entity(model) for model in result.scalars()}
 
     async def find_all(self) -> List[Vehicle]:
         """Find all vehicles."""
-        stmt = select(VehicleModel).order_by(VehicleModel.license_plate)
-        result = await self._session.execute(stmt)
-        vehicle_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in vehicle_models]
+        stmt = select(VehicleModel).options(_NO_LAZY_LOADS).order_by(VehicleModel.license_plate)
+        return await _stream_entities(self._session, stmt, self._model_to_entity)
 
     async def delete(self, license_plate: str) -> bool:
-        """Delete a vehicle."""
-        stmt = delete(VehicleModel).where(VehicleModel.license_plate == license_plate.upper())
+        """Delete a vehicle (expects the normalized, upper-case plate)."""
+        self._cache_by_plate.pop(license_plate, None)
+        stmt = delete(VehicleModel).where(VehicleModel.license_plate == license_plate)
         result = await self._session.execute(stmt)
 
         return result.rowcount > 0
 
     def _model_to_entity(self, model: VehicleModel) -> Vehicle:
         """Convert database model to domain entity."""
-        if model.vehicle_type == "car":
-            return Car(
-                license_plate=model.license_plate,
-                make=model.make,
-                model=model.model,
-                year=model.year
-            )
-        elif model.vehicle_type == "motorcycle":
-            return Motorcycle(
-                license_plate=model.license_plate,
-                make=model.make,
-                model=model.model,
-                year=model.year
-            )
-        else:
-            # Default to Car if unknown type
-            return Car(
-                license_plate=model.license_plate,
-                make=model.make,
-                model=model.model,
-                year=model.year
-            )
+        # Unknown types default to Car
+        vehicle_cls = _VEHICLE_CTORS.get(model.vehicle_type, Car)
+        return vehicle_cls(
+            license_plate=model.license_plate,
+            make=model.make,
+            model=model.model,
+            year=model.year
+        )
 
 
 class SQLAlchemyUserRepository(UserRepository):
     """SQLAlchemy implementation of user repository."""
 
+    # Column projection: results are plain dicts, so skip ORM hydration
+    _FIND_BY_IDS = select(
+        UserModel.id,
+        UserModel.email,
+        UserModel.first_name,
+        UserModel.last_name,
+        UserModel.phone,
+        UserModel.is_active
+    ).where(UserModel.id.in_(bindparam("ids", expanding=True)))
+
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._loader: IdDataLoader[UUID, dict] = IdDataLoader(self._load_by_ids)
 
     async def find_by_id(self, user_id: UUID) -> Optional[dict]:
-        """Find user by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
-        user_model = result.scalar_one_or_none()
-
-        if not user_model:
-            return None
+        """Find user by ID, batched with concurrent lookups."""
+        return await self._loader.load(user_id)
 
-        return {
-            "id": user_model.id,
-            "email": user_model.email,
-            "first_name": user_model.first_name,
-            "last_name": user_model.last_name,
-            "phone": user_model.phone,
-            "is_active": user_model.is_active
-        }
+    async def _load_by_ids(self, user_ids: List[UUID]) -> Dict[UUID, dict]:
+        """Load a batch of users keyed by ID."""
+        result = await self._session.execute(self._FIND_BY_IDS, {"ids": user_ids})
+        return {row.id: dict(row._mapping) for row in result}
 
     async def exists(self, user_id: UUID) -> bool:
         """Check if user exists."""
-        stmt = select(func.count(UserModel.id)).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
-        count = result.scalar()
-
-        return count > 0
+        return bool(await self._session.scalar(_USER_EXISTS, {"user_id": user_id}))
 
 
 class SQLAlchemyInspectorRepository(InspectorRepository):
     """SQLAlchemy implementation of inspector repository."""
 
+    # Lookups prebuilt once with bind parameters; calls only bind values
+    _FIND_BY_IDS = select(InspectorModel).options(_NO_LAZY_LOADS).where(
+        InspectorModel.id.in_(bindparam("ids", expanding=True))
+    )
+    _FIND_BY_EMAIL = select(InspectorModel).options(_NO_LAZY_LOADS).where(
+        InspectorModel.email == bindparam("email")
+    )
+    _FIND_BY_LICENSE_NUMBER = select(InspectorModel).options(_NO_LAZY_LOADS).where(
+        InspectorModel.license_number == bindparam("license_number")
+    )
+    # Columns listed in Inspector constructor order so rows build entities positionally
+    _FIND_ALL_ACTIVE = select(
+        InspectorModel.email, InspectorModel.first_name, InspectorModel.last_name,
+        InspectorModel.role, InspectorModel.license_number, InspectorModel.id,
+        InspectorModel.status, InspectorModel.phone, InspectorModel.hire_date,
+        InspectorModel.created_at, InspectorModel.updated_at
+    ).where(
+        InspectorModel.status == InspectorStatus.ACTIVE
+    ).order_by(InspectorModel.last_name, InspectorModel.first_name)
+
     def __init__(self, session: AsyncSession):
         self._session = session
         self._logger = get_logger(__name__)
+        self._loader: IdDataLoader[UUID, Inspector] = IdDataLoader(self._load_by_ids)
+        # Lookups resolved within this session (one request); every write clears them
+        self._cache_by_id: Dict[UUID, Optional[Inspector]] = {}
+        self._cache_by_email: Dict[str, Optional[Inspector]] = {}
+
+    def _invalidate_cache(self) -> None:
+        """Forget inspectors resolved earlier in this session."""
+        self._cache_by_id.clear()
+        self._cache_by_email.clear()
 
     async def save(self, inspector: Inspector) -> Inspector:
         """Save an inspector to the database."""
-        # Check if inspector exists
-        stmt = select(InspectorModel).where(InspectorModel.id == inspector.id)
-        result = await self._session.execute(stmt)
-        existing_inspector = result.scalar_one_or_none()
-
-        if existing_inspector:
-            # Update existing inspector
-            log_database_operation(
-                self._logger,
-                "UPDATE",
-                "InspectorModel",
-                extra={"inspector_id": str(inspector.id), "email": inspector.email}
-            )
-
-            existing_inspector.email = inspector.email
-            existing_inspector.first_name = inspector.first_name
-            existing_inspector.last_name = inspector.last_name
-            existing_inspector.phone = inspector.phone
-            existing_inspector.role = inspector.role
-            existing_inspector.license_number = inspector.license_number
-            existing_inspector.status = inspector.status
-            existing_inspector.hire_date = inspector.hire_date
-            existing_inspector.updated_at = datetime.utcnow()
-
-            self._logger.info(
-                "Inspector updated successfully",
-                extra={"inspector_id": str(inspector.id), "email": inspector.email}
-            )
-        else:
-            # Create new inspector
-            log_database_operation(
-                self._logger,
-                "INSERT",
-                "InspectorModel",
-                extra={"inspector_id": str(inspector.id), "email": inspector.email}
-            )
-
-            inspector_model = InspectorModel(
-                id=inspector.id,
-                email=inspector.email,
-                first_name=inspector.first_name,
-                last_name=inspector.last_name,
-                phone=inspector.phone,
-                role=inspector.role,
-                license_number=inspector.license_number,
-                status=inspector.status,
-                hire_date=inspector.hire_date,
-                password_hash="",  # Will be set separately
-                created_at=inspector.created_at,
-                updated_at=datetime.utcnow()
-            )
-            self._session.add(inspector_model)
+        self._invalidate_cache()
+        log_database_operation(
+            self._logger,
+            "UPSERT",
+            "InspectorModel",
+            inspector_id=inspector.id,
+            email=inspector.email
+        )
 
-            self._logger.info(
-                "New inspector created successfully",
-                extra={"inspector_id": str(inspector.id), "email": inspector.email}
-            )
+        stmt = pg_insert(InspectorModel).values(
+            id=inspector.id,
+            email=inspector.email,
+            first_name=inspector.first_name,
+            last_name=inspector.last_name,
+            phone=inspector.phone,
+            role=inspector.role,
+            license_number=inspector.license_number,
+            status=inspector.status,
+            hire_date=inspector.hire_date,
+            password_hash="",  # Will be set separately
+            created_at=inspector.created_at
+        )
+        # Authentication columns are managed separately and left untouched on update
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[InspectorModel.id],
+            set_={
+                "email": stmt.excluded.email,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "phone": stmt.excluded.phone,
+                "role": stmt.excluded.role,
+                "license_number": stmt.excluded.license_number,
+                "status": stmt.excluded.status,
+                "hire_date": stmt.excluded.hire_date,
+                "updated_at": DB_UTC_NOW,
+            }
+        )
+        await self._session.execute(stmt)
 
-        await self._session.flush()
+        self._logger.info(
+            "Inspector saved successfully",
+            extra={"inspector_id": str(inspector.id), "email": inspector.email}
+        )
         return inspector
 
     async def find_by_id(self, inspector_id: UUID) -> Optional[Inspector]:
-        """Find inspector by ID."""
+        """Find inspector by ID, batched with concurrent lookups and cached per session."""
+        if inspector_id in self._cache_by_id:
+            return self._cache_by_id[inspector_id]
+
         log_database_operation(
             self._logger,
             "SELECT",
             "InspectorModel",
-            extra={"inspector_id": str(inspector_id), "lookup_field": "id"}
+            inspector_id=inspector_id,
+            lookup_field="id"
         )
 
-        stmt = select(InspectorModel).where(InspectorModel.id == inspector_id)
-        result = await self._session.execute(stmt)
-        inspector_model = result.scalar_one_or_none()
+        inspector = await self._loader.load(inspector_id)
+        self._cache_by_id[inspector_id] = inspector
 
-        if not inspector_model:
+        if not inspector:
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Inspector not found by ID",
+                    extra={"inspector_id": str(inspector_id)}
+                )
+            return None
+
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
-                "Inspector not found by ID",
-                extra={"inspector_id": str(inspector_id)}
+                "Inspector found by ID",
+                extra={"inspector_id": str(inspector_id), "email": inspector.email}
             )
-            return None
+        return inspector
 
-        self._logger.debug(
-            "Inspector found by ID",
-            extra={"inspector_id": str(inspector_id), "email": inspector_model.email}
-        )
-        return self._model_to_entity(inspector_model)
+    async def find_many_by_ids(self, inspector_ids: Sequence[UUID]) -> Dict[UUID, Inspector]:
+        """Find several inspectors with one IN query, keyed by ID."""
+        if not inspector_ids:
+            return {}
+        return await self._load_by_ids(list(inspector_ids))
+
+    async def _load_by_ids(self, inspector_ids: List[UUID]) -> Dict[UUID, Inspector]:
+        """Load a batch of inspectors keyed by ID."""
+        result = await self._session.execute(self._FIND_BY_IDS, {"ids": inspector_ids})
+        return {model.id: self._model_to_entity(model) for model in result.scalars()}
 
     async def find_by_email(self, email: str) -> Optional[Inspector]:
-        """Find inspector by email."""
-        sanitized_email = email.lower().strip()
+        """Find inspector by email (expects the normalized, lower-case email), cached per session."""
+        if email in self._cache_by_email:
+            return self._cache_by_email[email]
+
         log_database_operation(
             self._logger,
             "SELECT",
             "InspectorModel",
-            extra={"email": sanitized_email, "lookup_field": "email"}
+            email=email,
+            lookup_field="email"
         )
 
-        stmt = select(InspectorModel).where(InspectorModel.email == sanitized_email)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(self._FIND_BY_EMAIL, {"email": email})
         inspector_model = result.scalar_one_or_none()
 
         if not inspector_model:
+            self._cache_by_email[email] = None
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Inspector not found by email",
+                    extra={"email": email}
+                )
+            return None
+
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
-                "Inspector not found by email",
-                extra={"email": sanitized_email}
+                "Inspector found by email",
+                extra={"email": email, "inspector_id": str(inspector_model.id)}
             )
-            return None
+        inspector = self._model_to_entity(inspector_model)
+        self._cache_by_email[email] = self._cache_by_id[inspector.id] = inspector
+        return inspector
 
-        self._logger.debug(
-            "Inspector found by email",
-            extra={"email": sanitized_email, "inspector_id": str(inspector_model.id)}
+    async def find_auth_row_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Find the login columns of an inspector by normalized, lower-case email.
+
+        The row is locked (SELECT ... FOR UPDATE) until the transaction ends, so
+        concurrent login attempts for the same account update the counters in turn.
+        """
+        log_database_operation(
+            self._logger,
+            "SELECT",
+            "InspectorModel",
+            email=email,
+            lookup_field="email",
+            projection="auth"
         )
-        return self._model_to_entity(inspector_model)
+
+        result = await self._session.execute(_INSPECTOR_AUTH_ROW_BY_EMAIL, {"email": email})
+        row = result.one_or_none()
+
+        return dict(row._mapping) if row else None
 
     async def find_by_license_number(self, license_number: str) -> Optional[Inspector]:
-        """Find inspector by license number."""
-        sanitized_license = license_number.upper().strip()
+        """Find inspector by license number (expects the normalized, upper-case number)."""
         log_database_operation(
             self._logger,
             "SELECT",
             "InspectorModel",
-            extra={"license_number": sanitized_license, "lookup_field": "license_number"}
+            license_number=license_number,
+            lookup_field="license_number"
         )
 
-        stmt = select(InspectorModel).where(InspectorModel.license_number == sanitized_license)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(
+            self._FIND_BY_LICENSE_NUMBER, {"license_number": license_number}
+        )
         inspector_model = result.scalar_one_or_none()
 
         if not inspector_model:
-            self._logger.debug(
-                "Inspector not found by license number",
-                extra={"license_number": sanitized_license}
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Inspector not found by license number",
+                    extra={"license_number": license_number}
+                )
             return None
 
-        self._logger.debug(
-            "Inspector found by license number",
-            extra={"license_number": sanitized_license, "inspector_id": str(inspector_model.id)}
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Inspector found by license number",
+                extra={"license_number": license_number, "inspector_id": str(inspector_model.id)}
+            )
         return self._model_to_entity(inspector_model)
 
     async def find_all_active(self) -> List[Inspector]:
@@ -515,87 +825,70 @@ class SQLAlchemyInspectorRepository(InspectorRepository):
             self._logger,
             "SELECT",
             "InspectorModel",
-            extra={"filter": "status=ACTIVE", "operation": "find_all_active"}
+            filter="status=ACTIVE",
+            finder="find_all_active"
         )
 
-        stmt = select(InspectorModel).where(
-            InspectorModel.status == InspectorStatus.ACTIVE
-        ).order_by(InspectorModel.last_name, InspectorModel.first_name)
-
-        result = await self._session.execute(stmt)
-        inspector_models = result.scalars().all()
+        result = await self._session.execute(self._FIND_ALL_ACTIVE)
+        # Rows come back in constructor order, so no ORM model is hydrated
+        inspectors = list(itertools.starmap(Inspector, result))
 
         self._logger.info(
             "Found active inspectors",
-            extra={"count": len(inspector_models)}
+            extra={"count": len(inspectors)}
         )
-        return [self._model_to_entity(model) for model in inspector_models]
+        return inspectors
 
     async def update_password_hash(self, inspector_id: UUID, password_hash: str) -> bool:
         """Update inspector password hash."""
-        stmt = select(InspectorModel).where(InspectorModel.id == inspector_id)
+        self._invalidate_cache()
+        stmt = update(InspectorModel).where(InspectorModel.id == inspector_id).values(
+            password_hash=password_hash
+        )
         result = await self._session.execute(stmt)
-        inspector_model = result.scalar_one_or_none()
-
-        if not inspector_model:
-            return False
-
-        inspector_model.password_hash = password_hash
-        inspector_model.updated_at = datetime.utcnow()
-        await self._session.flush()
-
-        return True
+        return result.rowcount > 0
 
     async def update_login_info(self, inspector_id: UUID, failed_attempts: int = 0, locked_until: Optional[datetime] = None) -> bool:
         """Update inspector login information."""
-        stmt = select(InspectorModel).where(InspectorModel.id == inspector_id)
+        self._invalidate_cache()
+        stmt = update(InspectorModel).where(InspectorModel.id == inspector_id).values(
+            failed_login_attempts=failed_attempts,
+            locked_until=locked_until
+        )
         result = await self._session.execute(stmt)
-        inspector_model = result.scalar_one_or_none()
-
-        if not inspector_model:
-            return False
-
-        inspector_model.failed_login_attempts = failed_attempts
-        inspector_model.locked_until = locked_until
-        inspector_model.updated_at = datetime.utcnow()
-        await self._session.flush()
-
-        return True
+        return result.rowcount > 0
 
     async def record_login(self, inspector_id: UUID) -> bool:
         """Record successful login."""
-        stmt = select(InspectorModel).where(InspectorModel.id == inspector_id)
+        self._invalidate_cache()
+        stmt = update(InspectorModel).where(InspectorModel.id == inspector_id).values(
+            last_login=datetime.utcnow(),
+            failed_login_attempts=0,
+            locked_until=None
+        )
         result = await self._session.execute(stmt)
-        inspector_model = result.scalar_one_or_none()
-
-        if not inspector_model:
-            return False
-
-        inspector_model.last_login = datetime.utcnow()
-        inspector_model.failed_login_attempts = 0
-        inspector_model.locked_until = None
-        inspector_model.updated_at = datetime.utcnow()
-        await self._session.flush()
-
-        return True
+        return result.rowcount > 0
 
     async def get_password_hash(self, inspector_id: UUID) -> Optional[str]:
         """Get password hash for inspector."""
-        stmt = select(InspectorModel.password_hash).where(InspectorModel.id == inspector_id)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(
+            _INSPECTOR_PASSWORD_HASH, {"inspector_id": inspector_id}
+        )
         return result.scalar_one_or_none()
 
     async def get_failed_attempts(self, inspector_id: UUID) -> int:
         """Get number of failed login attempts."""
-        stmt = select(InspectorModel.failed_login_attempts).where(InspectorModel.id == inspector_id)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(
+            _INSPECTOR_FAILED_ATTEMPTS, {"inspector_id": inspector_id}
+        )
         failed_attempts = result.scalar_one_or_none()
         return failed_attempts or 0
 
     async def get_lockout_expiry(self, inspector_id: UUID) -> Optional[datetime]:
         """Get account lockout expiry time."""
-        stmt = select(InspectorModel.locked_until).where(InspectorModel.id == inspector_id)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(
+            _INSPECTOR_LOCKED_UNTIL, {"inspector_id": inspector_id}
+        )
         return result.scalar_one_or_none()
 
     def _model_to_entity(self, model: InspectorModel) -> Inspector:
@@ -618,66 +911,83 @@ class SQLAlchemyInspectorRepository(InspectorRepository):
 class SQLAlchemyInspectionRepository(InspectionRepository):
     """SQLAlchemy implementation of inspection repository."""
 
+    # Lookups prebuilt once with bind parameters; calls only bind values
+    _FIND_BY_IDS = select(InspectionModel).options(_NO_LAZY_LOADS).where(
+        InspectionModel.id.in_(bindparam("ids", expanding=True))
+    )
+    _FIND_BY_INSPECTOR = select(InspectionModel).options(_NO_LAZY_LOADS).where(
+        InspectionModel.inspector_id == bindparam("inspector_id")
+    ).order_by(desc(InspectionModel.created_at))
+    _EXISTS = select(exists().where(InspectionModel.id == bindparam("inspection_id")))
+    _COUNT_BY_INSPECTORS = select(InspectionModel.inspector_id, func.count()).where(
+        InspectionModel.inspector_id.in_(bindparam("inspector_ids", expanding=True))
+    ).group_by(InspectionModel.inspector_id)
+    _COUNT_BY_LICENSE_PLATES = select(InspectionModel.license_plate, func.count()).where(
+        InspectionModel.license_plate.in_(bindparam("license_plates", expanding=True))
+    ).group_by(InspectionModel.license_plate)
+
     def __init__(self, session: AsyncSession):
         self._session = session
         self._logger = get_logger(__name__)
+        self._loader: IdDataLoader[UUID, Inspection] = IdDataLoader(self._load_by_ids)
+        self._cache_by_id: Dict[UUID, Optional[Inspection]] = {}
 
     async def save(self, inspection: Inspection) -> Inspection:
         """Save an inspection to the database."""
-        # Check if inspection exists
-        stmt = select(InspectionModel).where(InspectionModel.id == inspection.id)
-        result = await self._session.execute(stmt)
-        existing_inspection = result.scalar_one_or_none()
-
-        if existing_inspection:
-            # Update existing inspection
-            log_database_operation(self._logger, "UPDATE", "inspections",
-                                 inspection_id=str(inspection.id),
-                                 license_plate=inspection.license_plate)
-            self._update_model_from_entity(existing_inspection, inspection)
-            existing_inspection.updated_at = datetime.utcnow()
-        else:
-            # Create new inspection
-            log_database_operation(self._logger, "INSERT", "inspections",
-                                 inspection_id=str(inspection.id),
-                                 license_plate=inspection.license_plate)
-            inspection_model = self._entity_to_model(inspection)
-            self._session.add(inspection_model)
-
-        await self._session.flush()
+        self._cache_by_id.pop(inspection.id, None)
+        _forget_counts(self._session, inspection)
+        # Single round trip: the database decides between insert and update
+        log_database_operation(self._logger, "UPSERT", "inspections",
+                             inspection_id=inspection.id,
+                             license_plate=inspection.license_plate)
+        values = self._entity_to_update_values(inspection)
+        stmt = pg_insert(InspectionModel).values(
+            id=inspection.id, created_at=inspection.created_at, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[InspectionModel.id],
+            set_={column: stmt.excluded[column] for column in values}
+        )
+        await self._session.execute(stmt)
         return inspection
 
     async def find_by_id(self, inspection_id: UUID) -> Optional[Inspection]:
-        """Find inspection by ID."""
+        """Find inspection by ID, batched with concurrent lookups and cached per session."""
+        if inspection_id in self._cache_by_id:
+            return self._cache_by_id[inspection_id]
+
         log_database_operation(self._logger, "SELECT", "inspections",
-                             inspection_id=str(inspection_id))
-        stmt = select(InspectionModel).where(InspectionModel.id == inspection_id)
-        result = await self._session.execute(stmt)
-        inspection_model = result.scalar_one_or_none()
+                             inspection_id=inspection_id)
+        inspection = await self._loader.load(inspection_id)
+        self._cache_by_id[inspection_id] = inspection
+        return inspection
 
-        if not inspection_model:
-            return None
+    async def find_many_by_ids(self, inspection_ids: Sequence[UUID]) -> Dict[UUID, Inspection]:
+        """Find several inspections with one IN query, keyed by ID."""
+        if not inspection_ids:
+            return {}
+        return await self._load_by_ids(list(inspection_ids))
 
-        return self._model_to_entity(inspection_model)
+    async def _load_by_ids(self, inspection_ids: List[UUID]) -> Dict[UUID, Inspection]:
+        """Load a batch of inspections keyed by ID."""
+        result = await self._session.execute(self._FIND_BY_IDS, {"ids": inspection_ids})
+        return {model.id: self._model_to_entity(model) for model in result.scalars()}
 
     async def find_by_license_plate(self, license_plate: str) -> List[Inspection]:
         """Find all inspections for a license plate (ordered by created_at DESC)."""
-        normalized_plate = license_plate.upper().replace(" ", "").replace("-", "")
+        normalized_plate = _normalize_plate(license_plate)
 
-        stmt = select(InspectionModel).where(
+        stmt = select(InspectionModel).options(_NO_LAZY_LOADS).where(
             InspectionModel.license_plate == normalized_plate
         ).order_by(desc(InspectionModel.created_at))
 
-        result = await self._session.execute(stmt)
-        inspection_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in inspection_models]
+        return await _stream_entities(self._session, stmt, self._model_to_entity)
 
     async def find_latest_by_license_plate(self, license_plate: str) -> Optional[Inspection]:
         """Find the most recent inspection for a license plate."""
-        normalized_plate = license_plate.upper().replace(" ", "").replace("-", "")
+        normalized_plate = _normalize_plate(license_plate)
 
-        stmt = select(InspectionModel).where(
+        stmt = select(InspectionModel).options(_NO_LAZY_LOADS).where(
             InspectionModel.license_plate == normalized_plate
         ).order_by(desc(InspectionModel.created_at)).limit(1)
 
@@ -691,71 +1001,65 @@ class SQLAlchemyInspectionRepository(InspectionRepository):
 
     async def find_by_inspector(self, inspector_id: UUID) -> List[Inspection]:
         """Find all inspections performed by a specific inspector."""
-        stmt = select(InspectionModel).where(
-            InspectionModel.inspector_id == inspector_id
-        ).order_by(desc(InspectionModel.created_at))
-
-        result = await self._session.execute(stmt)
-        inspection_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in inspection_models]
+        return await _stream_entities(
+            self._session, self._FIND_BY_INSPECTOR, self._model_to_entity,
+            {"inspector_id": inspector_id}
+        )
 
     async def find_by_status(self, status: str) -> List[Inspection]:
         """Find all inspections with a specific status (draft/completed)."""
-        stmt = select(InspectionModel).where(
+        stmt = select(InspectionModel).options(_NO_LAZY_LOADS).where(
             InspectionModel.status == InspectionStatus(status)
         ).order_by(desc(InspectionModel.created_at))
 
-        result = await self._session.execute(stmt)
-        inspection_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in inspection_models]
+        return await _stream_entities(self._session, stmt, self._model_to_entity)
 
     async def find_completed_inspections(self, limit: Optional[int] = None) -> List[Inspection]:
         """Find completed inspections, optionally limited by count."""
-        stmt = select(InspectionModel).where(
+        stmt = select(InspectionModel).options(_NO_LAZY_LOADS).where(
             InspectionModel.status == InspectionStatus.COMPLETED
         ).order_by(desc(InspectionModel.completed_at))
 
         if limit:
             stmt = stmt.limit(limit)
 
-        result = await self._session.execute(stmt)
-        inspection_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in inspection_models]
+        return await _stream_entities(self._session, stmt, self._model_to_entity)
 
     async def find_draft_inspections_by_inspector(self, inspector_id: UUID) -> List[Inspection]:
         """Find all draft inspections for a specific inspector."""
-        stmt = select(InspectionModel).where(
+        stmt = select(InspectionModel).options(_NO_LAZY_LOADS).where(
             and_(
                 InspectionModel.inspector_id == inspector_id,
                 InspectionModel.status == InspectionStatus.DRAFT
             )
         ).order_by(desc(InspectionModel.updated_at))
 
-        result = await self._session.execute(stmt)
-        inspection_models = result.scalars().all()
-
-        return [self._model_to_entity(model) for model in inspection_models]
+        return await _stream_entities(self._session, stmt, self._model_to_entity)
 
     async def update(self, inspection: Inspection) -> Inspection:
         """Update an existing inspection."""
-        stmt = select(InspectionModel).where(InspectionModel.id == inspection.id)
+        self._cache_by_id.pop(inspection.id, None)
+        _forget_counts(self._session, inspection)
+        # RETURNING reports a missing row without a preliminary SELECT
+        stmt = (
+            update(InspectionModel)
+            .where(InspectionModel.id == inspection.id)
+            .values(**self._entity_to_update_values(inspection))
+            .returning(InspectionModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(stmt)
-        inspection_model = result.scalar_one_or_none()
 
-        if not inspection_model:
+        if result.scalar_one_or_none() is None:
             raise ValueError(f"Inspection with ID {inspection.id} not found")
 
-        self._update_model_from_entity(inspection_model, inspection)
-        inspection_model.updated_at = datetime.utcnow()
-
-        await self._session.flush()
         return inspection
 
     async def delete(self, inspection_id: UUID) -> bool:
         """Delete an inspection by ID."""
+        self._cache_by_id.pop(inspection_id, None)
+        # The deleted row's inspector and plate are unknown here
+        _evict_after_transaction(self._session, _COUNTS_CACHE)
         stmt = delete(InspectionModel).where(InspectionModel.id == inspection_id)
         result = await self._session.execute(stmt)
 
@@ -763,41 +1067,64 @@ class SQLAlchemyInspectionRepository(InspectionRepository):
 
     async def exists(self, inspection_id: UUID) -> bool:
         """Check if an inspection exists."""
-        stmt = select(func.count(InspectionModel.id)).where(
-            InspectionModel.id == inspection_id
-        )
-        result = await self._session.execute(stmt)
-        count = result.scalar()
-
-        return count > 0
+        return bool(await self._session.scalar(self._EXISTS, {"inspection_id": inspection_id}))
 
     async def count_by_inspector(self, inspector_id: UUID) -> int:
-        """Count total inspections by inspector."""
-        stmt = select(func.count(InspectionModel.id)).where(
-            InspectionModel.inspector_id == inspector_id
-        )
-        result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        """Count total inspections by inspector, cached briefly."""
+        key = ("inspector", inspector_id)
+        count = _cached_count(key)
+        if count is None:
+            stmt = select(func.count(InspectionModel.id)).where(
+                InspectionModel.inspector_id == inspector_id
+            )
+            result = await self._session.execute(stmt)
+            count = result.scalar() or 0
+            _remember_count(key, count)
+        return count
 
     async def count_by_license_plate(self, license_plate: str) -> int:
-        """Count total inspections for a license plate."""
-        normalized_plate = license_plate.upper().replace(" ", "").replace("-", "")
-
-        stmt = select(func.count(InspectionModel.id)).where(
-            InspectionModel.license_plate == normalized_plate
+        """Count total inspections for a license plate, cached briefly."""
+        normalized_plate = _normalize_plate(license_plate)
+        key = ("plate", normalized_plate)
+        count = _cached_count(key)
+        if count is None:
+            stmt = select(func.count(InspectionModel.id)).where(
+                InspectionModel.license_plate == normalized_plate
+            )
+            result = await self._session.execute(stmt)
+            count = result.scalar() or 0
+            _remember_count(key, count)
+        return count
+
+    async def count_by_inspectors(self, inspector_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """Count inspections for several inspectors with one grouped query."""
+        if not inspector_ids:
+            return {}
+        result = await self._session.execute(
+            self._COUNT_BY_INSPECTORS, {"inspector_ids": list(inspector_ids)}
         )
-        result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        counts = dict(result.all())
+        return {inspector_id: counts.get(inspector_id, 0) for inspector_id in inspector_ids}
+
+    async def count_by_license_plates(self, license_plates: Sequence[str]) -> Dict[str, int]:
+        """Count inspections for several plates with one grouped query, keyed as given."""
+        if not license_plates:
+            return {}
+        normalized = {plate: _normalize_plate(plate) for plate in license_plates}
+        result = await self._session.execute(
+            self._COUNT_BY_LICENSE_PLATES, {"license_plates": list(set(normalized.values()))}
+        )
+        counts = dict(result.all())
+        return {plate: counts.get(normalized_plate, 0) for plate, normalized_plate in normalized.items()}
 
     def _model_to_entity(self, model: InspectionModel) -> Inspection:
         """Convert database model to domain entity."""
-        # Deserialize checkpoint scores from JSON
+        # JSONB column: the driver already decoded the scores into a list of dicts
         checkpoint_scores = []
         if model.checkpoint_scores:
-            scores_data = json.loads(model.checkpoint_scores) if isinstance(model.checkpoint_scores, str) else model.checkpoint_scores
-            for score_data in scores_data:
+            for score_data in model.checkpoint_scores:
                 checkpoint_scores.append(CheckpointScore(
-                    checkpoint_type=CheckpointType(score_data['checkpoint_type']),
+                    checkpoint_type=_CHECKPOINT_TYPE_BY_VALUE[score_data['checkpoint_type']],
                     score=score_data['score'],
                     notes=score_data.get('notes', '')
                 ))
@@ -815,60 +1142,40 @@ class SQLAlchemyInspectionRepository(InspectionRepository):
             completed_at=model.completed_at
         )
 
-    def _entity_to_model(self, inspection: Inspection) -> InspectionModel:
-        """Convert domain entity to database model."""
-        # Serialize checkpoint scores to JSON
-        checkpoint_scores_json = None
-        if inspection.checkpoint_scores:
-            scores_data = []
-            for score in inspection.checkpoint_scores:
-                scores_data.append({
-                    'checkpoint_type': score.checkpoint_type.value,
-                    'score': score.score,
-                    'notes': score.notes
-                })
-            checkpoint_scores_json = json.dumps(scores_data)
-
-        return InspectionModel(
-            id=inspection.id,
-            license_plate=inspection.license_plate.upper().replace(" ", "").replace("-", ""),
+    def _entity_to_update_values(self, inspection: Inspection) -> Dict[str, Any]:
+        """Convert domain entity to the column values a write may change."""
+        # The property hands out a fresh copy of the list; take it once
+        scores = inspection.checkpoint_scores
+
+        # JSONB column: hand the driver plain dicts to encode
+        scores_data = [
+            {
+                'checkpoint_type': score.checkpoint_type.value,
+                'score': score.score,
+                'notes': score.notes
+            }
+            for score in scores
+        ] if scores else None
+        # One pass over the scores yields total, safety and reinspection together
+        safety = inspection.calculate_safety_result() if scores else None
+
+        return dict(
+            license_plate=inspection.normalized_license_plate,
             vehicle_type=inspection.vehicle_type,
             inspector_id=inspection.inspector_id,
-            checkpoint_scores=checkpoint_scores_json,
-            total_score=inspection.get_total_score() if inspection.checkpoint_scores else None,
-            is_safe=inspection.is_safe() if inspection.checkpoint_scores else None,
-            requires_reinspection=inspection.requires_reinspection() if inspection.checkpoint_scores else None,
+            checkpoint_scores=scores_data,
+            total_score=safety.total_score if safety else None,
+            is_safe=safety.is_safe if safety else None,
+            requires_reinspection=safety.requires_reinspection if safety else None,
             observations=inspection.observations,
             status=inspection.status,
-            created_at=inspection.created_at,
-            updated_at=inspection.updated_at,
+            updated_at=DB_UTC_NOW,
             completed_at=inspection.completed_at
         )
 
-    def _update_model_from_entity(self, model: InspectionModel, inspection: Inspection) -> None:
-        """Update database model fields from domain entity."""
-        # Serialize checkpoint scores to JSON
-        checkpoint_scores_json = None
-        if inspection.checkpoint_scores:
-            scores_data = []
-            for score in inspection.checkpoint_scores:
-                scores_data.append({
-                    'checkpoint_type': score.checkpoint_type.value,
-                    'score': score.score,
-                    'notes': score.notes
-                })
-            checkpoint_scores_json = json.dumps(scores_data)
-
-        model.license_plate = inspection.license_plate.upper().replace(" ", "").replace("-", "")
-        model.vehicle_type = inspection.vehicle_type
-        model.inspector_id = inspection.inspector_id
-        model.checkpoint_scores = checkpoint_scores_json
-        model.total_score = inspection.get_total_score() if inspection.checkpoint_scores else None
-        model.is_safe = inspection.is_safe() if inspection.checkpoint_scores else None
-        model.requires_reinspection = inspection.requires_reinspection() if inspection.checkpoint_scores else None
-        model.observations = inspection.observations
-        model.status = inspection.status
-        model.completed_at = inspection.completed_at
+
+# Stale expiry-heap entries tolerated beyond twice the live token count
+_HEAP_COMPACT_SLACK = 64
 
 
 class InMemoryAuthTokenRepository(AuthTokenRepository):
@@ -876,14 +1183,14 @@ class InMemoryAuthTokenRepository(AuthTokenRepository):
 
     def __init__(self):
         self._tokens: Dict[str, AuthToken] = {}
+        # (expires_at, token) min-heap; invalidated tokens are dropped lazily on cleanup
+        self._expiry_heap: List[Tuple[datetime, str]] = []
 
     async def save_token(self, token: AuthToken) -> bool:
         """Save authentication token."""
-        try:
-            self._tokens[token.token] = token
-            return True
-        except Exception:
-            return False
+        self._tokens[token.token] = token
+        heapq.heappush(self._expiry_heap, (token.expires_at, token.token))
+        return True
 
     async def find_token(self, token: str) -> Optional[AuthToken]:
         """Find authentication token."""
@@ -891,25 +1198,27 @@ class InMemoryAuthTokenRepository(AuthTokenRepository):
 
     async def invalidate_token(self, token: str) -> bool:
         """Invalidate authentication token."""
-        try:
-            if token in self._tokens:
-                del self._tokens[token]
-                return True
-            return False
-        except Exception:
+        if self._tokens.pop(token, None) is None:
             return False
+        # Invalidated entries linger in the heap until expiry; rebuild once
+        # they outnumber the live tokens so memory tracks active sessions
+        if len(self._expiry_heap) > 2 * len(self._tokens) + _HEAP_COMPACT_SLACK:
+            self._expiry_heap = [
+                (auth_token.expires_at, key) for key, auth_token in self._tokens.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+        return True
 
     async def cleanup_expired_tokens(self) -> int:
         """Clean up expired tokens."""
-        try:
-            expired_tokens = [
-                token for token, auth_token in self._tokens.items()
-                if auth_token.is_expired
-            ]
-
-            for token in expired_tokens:
+        now = datetime.utcnow()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            _, token = heapq.heappop(heap)
+            auth_token = self._tokens.get(token)
+            # Skip stale entries left by invalidation or a re-save with a later expiry
+            if auth_token is not None and auth_token.expires_at < now:
                 del self._tokens[token]
-
-            return len(expired_tokens)
-        except Exception:
-            return 0
+                removed += 1
+        return removed
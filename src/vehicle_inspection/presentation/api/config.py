@@ -1,11 +1,17 @@
 """Application configuration using Pydantic Settings."""
 
 from functools import lru_cache
-from typing import List, Union
+from typing import List, Tuple, Union
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
+def _split_csv(value: Union[str, List[str], Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Split a comma-separated setting into a tuple of trimmed, non-empty items."""
+    items = value.split(",") if isinstance(value, str) else value
+    return tuple(item.strip() for item in items if item.strip())
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
@@ -29,25 +35,29 @@ class Settings(BaseSettings):
     max_log_body_size: int = 1024
 
     # CORS
-    allowed_origins: Union[str, List[str]] = "http://localhost:3000,http://localhost:8080"
-    allowed_methods: Union[str, List[str]] = "GET,POST,PUT,DELETE,OPTIONS"
-    allowed_headers: Union[str, List[str]] = "*"
+    allowed_origins: Union[str, List[str], Tuple[str, ...]] = "http://localhost:3000,http://localhost:8080"
+    allowed_methods: Union[str, List[str], Tuple[str, ...]] = "GET,POST,PUT,DELETE,OPTIONS"
+    allowed_headers: Union[str, List[str], Tuple[str, ...]] = "*"
 
     @model_validator(mode='after')
     def convert_cors_lists(self):
-        """Convert comma-separated strings to lists."""
-        if isinstance(self.allowed_origins, str):
-            self.allowed_origins = [item.strip() for item in self.allowed_origins.split(",") if item.strip()]
-        if isinstance(self.allowed_methods, str):
-            self.allowed_methods = [item.strip() for item in self.allowed_methods.split(",") if item.strip()]
-        if isinstance(self.allowed_headers, str):
-            self.allowed_headers = [item.strip() for item in self.allowed_headers.split(",") if item.strip()]
+        """Convert comma-separated strings to immutable tuples, split once at startup."""
+        self.allowed_origins = _split_csv(self.allowed_origins)
+        self.allowed_methods = _split_csv(self.allowed_methods)
+        self.allowed_headers = _split_csv(self.allowed_headers)
         return self
 
+    @property
+    def allowed_origins_set(self) -> frozenset:
+        """Allowed origins as a set, for hashed membership checks per request."""
+        return frozenset(self.allowed_origins)
+
     # Database Pool
     db_pool_size: int = 10
     db_max_overflow: int = 20
     db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_pool_timeout: int = 30
 
     class Config:
         """Pydantic config."""
@@ -0,0 +1,37 @@
+"""Request-scoped FastAPI dependencies."""
+
+from typing import AsyncGenerator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.vehicle_inspection.application.services.auth_service import AuthenticationService
+from src.vehicle_inspection.application.services.booking_service import BookingService
+from src.vehicle_inspection.application.services.inspection_service import InspectionService
+from src.vehicle_inspection.infrastructure.services import get_service_factory
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Open one session per request, shared by every service the request resolves."""
+    async with get_service_factory().database_manager.get_session() as session:
+        yield session
+
+
+# Function scope closes the session (and commits) when the endpoint returns, before
+# the response is sent, so a failed commit reaches the client as an error
+_request_session = Depends(get_db_session, scope="function")
+
+
+async def get_booking_service(session: AsyncSession = _request_session) -> BookingService:
+    """Dependency to get the booking service bound to the request session."""
+    return get_service_factory().create_booking_service(session)
+
+
+async def get_auth_service(session: AsyncSession = _request_session) -> AuthenticationService:
+    """Dependency to get the authentication service bound to the request session."""
+    return get_service_factory().create_auth_service(session)
+
+
+async def get_inspection_service(session: AsyncSession = _request_session) -> InspectionService:
+    """Dependency to get the inspection service bound to the request session."""
+    return get_service_factory().create_inspection_service(session)
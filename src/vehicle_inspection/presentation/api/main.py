@@ -10,7 +10,7 @@ from ...infrastructure.services import initialize_services, shutdown_services
 from ...infrastructure.logging import setup_logging_from_env
 from .routes import health, vehicles, bookings, inspections, auth, reports
 from .config import get_settings
-from .middleware.auth import AuthenticationError, AuthorizationError
+from .middleware.auth import AUTH_HEADERS, AuthenticationError, AuthorizationError
 from .middleware.logging import create_logging_middleware
 
 
@@ -24,7 +24,14 @@ async def lifespan(app: FastAPI):
     # Configure structured logging first
     setup_logging_from_env()
     logger.info("Starting Vehicle Inspection System API")
-    await initialize_services()
+    settings = get_settings()
+    await initialize_services(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
+    )
 
     yield
 
@@ -39,20 +46,20 @@ def add_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(AuthenticationError)
     async def authentication_error_handler(request: Request, exc: AuthenticationError):
         """Handle authentication errors."""
-        logger.warning(f"Authentication error on {request.url}: {str(exc)}")
+        logger.warning("Authentication error on %s: %s", request.url, exc)
         return JSONResponse(
             status_code=401,
             content={
                 "detail": str(exc),
                 "type": "authentication_error"
             },
-            headers={"WWW-Authenticate": "Bearer"}
+            headers=AUTH_HEADERS
         )
 
     @app.exception_handler(AuthorizationError)
     async def authorization_error_handler(request: Request, exc: AuthorizationError):
         """Handle authorization errors."""
-        logger.warning(f"Authorization error on {request.url}: {str(exc)}")
+        logger.warning("Authorization error on %s: %s", request.url, exc)
         return JSONResponse(
             status_code=403,
             content={
@@ -64,7 +71,7 @@ def add_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError):
         """Handle validation errors from business logic."""
-        logger.warning(f"Validation error on {request.url}: {str(exc)}")
+        logger.warning("Validation error on %s: %s", request.url, exc)
         return JSONResponse(
             status_code=400,
             content={
@@ -76,7 +83,7 @@ def add_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(RuntimeError)
     async def runtime_error_handler(request: Request, exc: RuntimeError):
         """Handle runtime errors from business logic."""
-        logger.error(f"Runtime error on {request.url}: {str(exc)}")
+        logger.error("Runtime error on %s: %s", request.url, exc)
         return JSONResponse(
             status_code=500,
             content={
@@ -110,10 +117,10 @@ def create_app() -> FastAPI:
     )
     app.add_middleware(logging_middleware)
 
-    # CORS middleware
+    # CORS middleware; Starlette checks origins with `in` on every request, so hand it a set
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.allowed_origins,
+        allow_origins=settings.allowed_origins_set,
         allow_credentials=True,
         allow_methods=settings.allowed_methods,
         allow_headers=settings.allowed_headers,
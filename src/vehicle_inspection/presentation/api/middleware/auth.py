@@ -5,26 +5,84 @@ This module provides authentication and authorization functionality
 for protecting API endpoints that require inspector authentication.
 """
 
-from typing import Optional
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+from uuid import UUID
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 import os
 from datetime import datetime, timedelta, timezone
 
 from ....domain.entities.inspector import Inspector
 from ....domain.value_objects.auth import LoginCredentials
-from ....infrastructure.services import ServiceFactory
+from ....infrastructure.services import get_service_factory
 
 
 # Security scheme for bearer token authentication
 security = HTTPBearer()
 
+# Resolved once; each request only opens its own session through it
+_service_factory = get_service_factory()
+
 # JWT configuration
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 8
 
+# Bearer challenge sent with every 401; responses copy headers, so one dict is shared
+AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+class ValidTokenCache:
+    """Remember recently validated bearer tokens and the inspector they resolved to.
+
+    Entries are keyed by the token's SHA-256 digest and live until the token
+    expires or the TTL passes, whichever comes first, so a deactivated inspector
+    keeps access for at most ``ttl_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 10_000):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[str, Tuple[Inspector, float]] = {}
+
+    @staticmethod
+    def _key(token: str) -> str:
+        """Digest a token so raw credentials are never kept in memory."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Inspector]:
+        """Return the cached inspector for a token that is still fresh."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        inspector, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        return inspector
+
+    def put(self, token: str, inspector: Inspector, token_expires_at: Optional[float] = None) -> None:
+        """Cache a validated token, never past its own expiry."""
+        expires_at = time.time() + self._ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        if len(self._entries) >= self._max_entries:
+            self._entries.clear()
+        self._entries[self._key(token)] = (inspector, expires_at)
+
+    def discard(self, token: str) -> None:
+        """Forget a token, e.g. on logout."""
+        self._entries.pop(self._key(token), None)
+
+
+# Validated tokens shared by every request in this process
+token_cache = ValidTokenCache()
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -59,9 +117,14 @@ async def get_current_inspector(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing authentication token",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=AUTH_HEADERS,
         )
 
+    # Repeat requests with a recently validated token skip the decode and the lookup
+    cached_inspector = token_cache.get(credentials.credentials)
+    if cached_inspector is not None:
+        return cached_inspector
+
     try:
         # Decode JWT token
         payload = jwt.decode(
@@ -74,6 +137,10 @@ async def get_current_inspector(
         inspector_id: str = payload.get("sub")
         if inspector_id is None:
             raise AuthenticationError("Invalid token: missing subject")
+        try:
+            inspector_uuid = UUID(inspector_id)
+        except ValueError:
+            raise AuthenticationError("Invalid token: malformed subject")
 
         # Check token expiration
         exp = payload.get("exp")
@@ -84,32 +151,33 @@ async def get_current_inspector(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid authentication token: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=AUTH_HEADERS,
         )
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=AUTH_HEADERS,
         )
 
     # Get inspector from database
-    async with ServiceFactory().get_inspector_service() as inspector_service:
-        inspector = await inspector_service.get_inspector_by_id(inspector_id)
+    async with _service_factory.get_auth_service() as auth_service:
+        inspector = await auth_service.get_inspector(inspector_uuid)
 
         if not inspector:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Inspector not found",
-                headers={"WWW-Authenticate": "Bearer"},
+                headers=AUTH_HEADERS,
             )
 
-        if not inspector.is_active:
+        if not inspector.is_active():
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Inspector account is inactive",
             )
 
+    token_cache.put(credentials.credentials, inspector, exp)
     return inspector
 
 
@@ -166,11 +234,11 @@ async def authenticate_inspector(credentials: LoginCredentials) -> Optional[str]
     Returns:
         Optional[str]: Access token if authentication successful, None otherwise
     """
-    async with ServiceFactory().get_inspector_service() as inspector_service:
-        inspector = await inspector_service.authenticate_inspector(credentials)
+    async with _service_factory.get_auth_service() as auth_service:
+        result = await auth_service.login(credentials)
 
-        if inspector:
-            return create_access_token(inspector.id)
+        if result.success:
+            return create_access_token(str(result.inspector_id))
 
         return None
 
@@ -6,7 +6,8 @@ from fastapi import APIRouter, HTTPException, Depends, Header
 from pydantic import BaseModel
 
 from src.vehicle_inspection.domain.value_objects.auth import LoginCredentials, LoginResult
-from src.vehicle_inspection.infrastructure.services import get_service_factory
+from src.vehicle_inspection.presentation.api.dependencies import get_auth_service
+from src.vehicle_inspection.presentation.api.middleware.auth import token_cache
 
 router = APIRouter()
 
@@ -55,13 +56,6 @@ class ApiResponse(BaseModel):
     message: str
 
 
-async def get_auth_service():
-    """Dependency to get authentication service."""
-    service_factory = get_service_factory()
-    async with service_factory.get_auth_service() as auth_service:
-        yield auth_service
-
-
 async def get_current_inspector(
     authorization: str = Header(None),
     auth_service = Depends(get_auth_service)
@@ -130,6 +124,7 @@ async def logout(
             raise HTTPException(status_code=401, detail="Authentication required")
 
         token = authorization.split(" ")[1]
+        token_cache.discard(token)
         success = await auth_service.logout(token)
 
         return ApiResponse(
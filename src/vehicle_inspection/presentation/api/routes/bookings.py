@@ -3,10 +3,11 @@
 from datetime import datetime, date as Date
 from typing import List, Optional
 from uuid import UUID, uuid4
-from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from pydantic import BaseModel
 
-from src.vehicle_inspection.infrastructure.services import get_service_factory
+from src.vehicle_inspection.application.services.booking_service import BookingService
+from src.vehicle_inspection.presentation.api.dependencies import get_booking_service
 
 router = APIRouter()
 
@@ -58,7 +59,8 @@ DEFAULT_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
 
 @router.get("/available-slots")
 async def get_available_slots(
-    date: str = Query(..., description="Date in YYYY-MM-DD format")
+    date: str = Query(..., description="Date in YYYY-MM-DD format"),
+    booking_service: BookingService = Depends(get_booking_service)
 ) -> AvailableSlotsResponse:
     """Get available appointment slots for a specific date."""
     try:
@@ -70,9 +72,7 @@ async def get_available_slots(
             raise HTTPException(status_code=400, detail="Cannot check availability for past dates")
 
         # Get available slots using database service
-        service_factory = get_service_factory()
-        async with service_factory.get_booking_service() as booking_service:
-            slots = await booking_service.get_available_slots(target_date)
+        slots = await booking_service.get_available_slots(target_date)
 
         # Convert to response format
         slot_responses = []
@@ -103,7 +103,10 @@ async def get_available_slots(
 
 
 @router.post("/")
-async def create_booking(request: BookingRequest) -> BookingResponse:
+async def create_booking(
+    request: BookingRequest,
+    booking_service: BookingService = Depends(get_booking_service)
+) -> BookingResponse:
     """Create a new vehicle inspection appointment using license plate."""
     try:
         # Use default user ID for license plate-based booking (no user account required)
@@ -117,13 +120,11 @@ async def create_booking(request: BookingRequest) -> BookingResponse:
             appointment_date = datetime(*appointment_date[:6])
 
         # Create booking using database service
-        service_factory = get_service_factory()
-        async with service_factory.get_booking_service() as booking_service:
-            booking = await booking_service.request_appointment(
-                license_plate=request.license_plate,
-                appointment_date=appointment_date,
-                user_id=user_id
-            )
+        booking = await booking_service.request_appointment(
+            license_plate=request.license_plate,
+            appointment_date=appointment_date,
+            user_id=user_id
+        )
 
         return BookingResponse(
             id=booking.id,
@@ -143,13 +144,12 @@ async def create_booking(request: BookingRequest) -> BookingResponse:
 
 @router.get("/{booking_id}")
 async def get_booking(
-    booking_id: UUID = Path(..., description="Booking ID")
+    booking_id: UUID = Path(..., description="Booking ID"),
+    booking_service: BookingService = Depends(get_booking_service)
 ) -> BookingResponse:
     """Get booking by ID."""
     try:
-        service_factory = get_service_factory()
-        async with service_factory.get_booking_service() as booking_service:
-            booking = await booking_service.get_booking(booking_id)
+        booking = await booking_service.get_booking(booking_id)
 
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -173,15 +173,14 @@ async def get_booking(
 @router.post("/{booking_id}/confirm")
 async def confirm_booking(
     booking_id: UUID = Path(..., description="Booking ID"),
-    request: BookingActionRequest = BookingActionRequest()
+    request: BookingActionRequest = BookingActionRequest(),
+    booking_service: BookingService = Depends(get_booking_service)
 ) -> BookingResponse:
     """Confirm a booking."""
     try:
         user_id = DEFAULT_USER_ID
 
-        service_factory = get_service_factory()
-        async with service_factory.get_booking_service() as booking_service:
-            booking = await booking_service.confirm_booking(booking_id, user_id)
+        booking = await booking_service.confirm_booking(booking_id, user_id)
 
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -205,15 +204,14 @@ async def confirm_booking(
 @router.post("/{booking_id}/cancel")
 async def cancel_booking(
     booking_id: UUID = Path(..., description="Booking ID"),
-    request: BookingActionRequest = BookingActionRequest()
+    request: BookingActionRequest = BookingActionRequest(),
+    booking_service: BookingService = Depends(get_booking_service)
 ) -> BookingResponse:
     """Cancel a booking."""
     try:
         user_id = DEFAULT_USER_ID
 
-        service_factory = get_service_factory()
-        async with service_factory.get_booking_service() as booking_service:
-            booking = await booking_service.cancel_booking(booking_id, user_id)
+        booking = await booking_service.cancel_booking(booking_id, user_id)
 
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
@@ -236,13 +234,12 @@ async def cancel_booking(
 
 @router.get("/vehicle/{license_plate}")
 async def get_vehicle_bookings(
-    license_plate: str = Path(..., description="Vehicle license plate (e.g., ABC123)")
+    license_plate: str = Path(..., description="Vehicle license plate (e.g., ABC123)"),
+    booking_service: BookingService = Depends(get_booking_service)
 ) -> List[BookingResponse]:
     """Get all inspection bookings for a specific vehicle by license plate."""
     try:
-        service_factory = get_service_factory()
-        async with service_factory.get_booking_service() as booking_service:
-            bookings = await booking_service.get_vehicle_bookings(license_plate)
+        bookings = await booking_service.get_vehicle_bookings(license_plate)
 
         return [
             BookingResponse(
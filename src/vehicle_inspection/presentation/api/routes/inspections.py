@@ -10,7 +10,8 @@ from ....domain.entities.inspector import Inspector
 from ....domain.entities.vehicle import VehicleType
 from ....domain.value_objects.checkpoint_types import CheckpointType
 from ....domain.value_objects.checkpoint_score import CheckpointScore
-from ....infrastructure.services import ServiceFactory
+from ....application.services.inspection_service import InspectionService
+from ..dependencies import get_inspection_service
 from ..middleware import get_current_inspector
 
 router = APIRouter()
@@ -77,7 +78,8 @@ class InspectionListResponse(BaseModel):
 @router.post("/", response_model=InspectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_inspection(
     request: CreateInspectionRequest,
-    current_inspector: Inspector = Depends(get_current_inspector)
+    current_inspector: Inspector = Depends(get_current_inspector),
+    inspection_service: InspectionService = Depends(get_inspection_service)
 ) -> InspectionResponse:
     """
     Create a new inspection.
@@ -86,35 +88,34 @@ async def create_inspection(
     Requires inspector authentication.
     """
     try:
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            inspection = await inspection_service.create_inspection(
-                license_plate=request.license_plate,
-                vehicle_type=request.vehicle_type,
-                inspector_id=str(current_inspector.id)
-            )
+        inspection = await inspection_service.create_inspection(
+            license_plate=request.license_plate,
+            vehicle_type=request.vehicle_type,
+            inspector_id=str(current_inspector.id)
+        )
 
-            # Convert to response model
-            return InspectionResponse(
-                id=inspection.id,
-                license_plate=inspection.license_plate,
-                vehicle_type=inspection.vehicle_type,
-                inspector_id=inspection.inspector_id,
-                status=inspection.status.value,
-                scores=[
-                    CheckpointScoreResponse(
-                        checkpoint_type=score.checkpoint_type,
-                        score=score.score,
-                        observations=score.observations
-                    ) for score in inspection.checkpoint_scores
-                ],
-                observations=inspection.observations,
-                total_score=inspection.total_score,
-                is_safe=inspection.is_safe,
-                requires_reinspection=inspection.requires_reinspection,
-                created_at=inspection.created_at,
-                updated_at=inspection.updated_at,
-                completed_at=inspection.completed_at
-            )
+        # Convert to response model
+        return InspectionResponse(
+            id=inspection.id,
+            license_plate=inspection.license_plate,
+            vehicle_type=inspection.vehicle_type,
+            inspector_id=inspection.inspector_id,
+            status=inspection.status.value,
+            scores=[
+                CheckpointScoreResponse(
+                    checkpoint_type=score.checkpoint_type,
+                    score=score.score,
+                    observations=score.observations
+                ) for score in inspection.checkpoint_scores
+            ],
+            observations=inspection.observations,
+            total_score=inspection.total_score,
+            is_safe=inspection.is_safe,
+            requires_reinspection=inspection.requires_reinspection,
+            created_at=inspection.created_at,
+            updated_at=inspection.updated_at,
+            completed_at=inspection.completed_at
+        )
 
     except ValueError as e:
         raise HTTPException(
@@ -131,7 +132,8 @@ async def create_inspection(
 @router.get("/{inspection_id}", response_model=InspectionResponse)
 async def get_inspection(
     inspection_id: UUID,
-    current_inspector: Inspector = Depends(get_current_inspector)
+    current_inspector: Inspector = Depends(get_current_inspector),
+    inspection_service: InspectionService = Depends(get_inspection_service)
 ) -> InspectionResponse:
     """
     Get inspection details by ID.
@@ -140,37 +142,36 @@ async def get_inspection(
     Requires inspector authentication.
     """
     try:
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            inspection = await inspection_service.get_inspection_by_id(str(inspection_id))
+        inspection = await inspection_service.get_inspection_by_id(str(inspection_id))
 
-            if not inspection:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Inspection with ID {inspection_id} not found"
-                )
-
-            return InspectionResponse(
-                id=inspection.id,
-                license_plate=inspection.license_plate,
-                vehicle_type=inspection.vehicle_type,
-                inspector_id=inspection.inspector_id,
-                status=inspection.status.value,
-                scores=[
-                    CheckpointScoreResponse(
-                        checkpoint_type=score.checkpoint_type,
-                        score=score.score,
-                        observations=score.observations
-                    ) for score in inspection.checkpoint_scores
-                ],
-                observations=inspection.observations,
-                total_score=inspection.total_score,
-                is_safe=inspection.is_safe,
-                requires_reinspection=inspection.requires_reinspection,
-                created_at=inspection.created_at,
-                updated_at=inspection.updated_at,
-                completed_at=inspection.completed_at
+        if not inspection:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Inspection with ID {inspection_id} not found"
             )
 
+        return InspectionResponse(
+            id=inspection.id,
+            license_plate=inspection.license_plate,
+            vehicle_type=inspection.vehicle_type,
+            inspector_id=inspection.inspector_id,
+            status=inspection.status.value,
+            scores=[
+                CheckpointScoreResponse(
+                    checkpoint_type=score.checkpoint_type,
+                    score=score.score,
+                    observations=score.observations
+                ) for score in inspection.checkpoint_scores
+            ],
+            observations=inspection.observations,
+            total_score=inspection.total_score,
+            is_safe=inspection.is_safe,
+            requires_reinspection=inspection.requires_reinspection,
+            created_at=inspection.created_at,
+            updated_at=inspection.updated_at,
+            completed_at=inspection.completed_at
+        )
+
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -182,7 +183,8 @@ async def get_inspection(
 async def update_checkpoint_scores(
     inspection_id: UUID,
     request: UpdateScoresRequest,
-    current_inspector: Inspector = Depends(get_current_inspector)
+    current_inspector: Inspector = Depends(get_current_inspector),
+    inspection_service: InspectionService = Depends(get_inspection_service)
 ) -> InspectionResponse:
     """
     Update checkpoint scores for an inspection.
@@ -201,33 +203,32 @@ async def update_checkpoint_scores(
             for score_req in request.scores
         ]
 
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            inspection = await inspection_service.update_checkpoint_scores(
-                inspection_id=str(inspection_id),
-                checkpoint_scores=checkpoint_scores
-            )
+        inspection = await inspection_service.update_checkpoint_scores(
+            inspection_id=str(inspection_id),
+            checkpoint_scores=checkpoint_scores
+        )
 
-            return InspectionResponse(
-                id=inspection.id,
-                license_plate=inspection.license_plate,
-                vehicle_type=inspection.vehicle_type,
-                inspector_id=inspection.inspector_id,
-                status=inspection.status.value,
-                scores=[
-                    CheckpointScoreResponse(
-                        checkpoint_type=score.checkpoint_type,
-                        score=score.score,
-                        observations=score.observations
-                    ) for score in inspection.checkpoint_scores
-                ],
-                observations=inspection.observations,
-                total_score=inspection.total_score,
-                is_safe=inspection.is_safe,
-                requires_reinspection=inspection.requires_reinspection,
-                created_at=inspection.created_at,
-                updated_at=inspection.updated_at,
-                completed_at=inspection.completed_at
-            )
+        return InspectionResponse(
+            id=inspection.id,
+            license_plate=inspection.license_plate,
+            vehicle_type=inspection.vehicle_type,
+            inspector_id=inspection.inspector_id,
+            status=inspection.status.value,
+            scores=[
+                CheckpointScoreResponse(
+                    checkpoint_type=score.checkpoint_type,
+                    score=score.score,
+                    observations=score.observations
+                ) for score in inspection.checkpoint_scores
+            ],
+            observations=inspection.observations,
+            total_score=inspection.total_score,
+            is_safe=inspection.is_safe,
+            requires_reinspection=inspection.requires_reinspection,
+            created_at=inspection.created_at,
+            updated_at=inspection.updated_at,
+            completed_at=inspection.completed_at
+        )
 
     except ValueError as e:
         raise HTTPException(
@@ -245,7 +246,8 @@ async def update_checkpoint_scores(
 async def complete_inspection(
     inspection_id: UUID,
     request: CompleteInspectionRequest,
-    current_inspector: Inspector = Depends(get_current_inspector)
+    current_inspector: Inspector = Depends(get_current_inspector),
+    inspection_service: InspectionService = Depends(get_inspection_service)
 ) -> InspectionResponse:
     """
     Complete an inspection.
@@ -255,33 +257,32 @@ async def complete_inspection(
     Requires inspector authentication.
     """
     try:
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            inspection = await inspection_service.complete_inspection(
-                inspection_id=str(inspection_id),
-                observations=request.observations
-            )
+        inspection = await inspection_service.complete_inspection(
+            inspection_id=str(inspection_id),
+            observations=request.observations
+        )
 
-            return InspectionResponse(
-                id=inspection.id,
-                license_plate=inspection.license_plate,
-                vehicle_type=inspection.vehicle_type,
-                inspector_id=inspection.inspector_id,
-                status=inspection.status.value,
-                scores=[
-                    CheckpointScoreResponse(
-                        checkpoint_type=score.checkpoint_type,
-                        score=score.score,
-                        observations=score.observations
-                    ) for score in inspection.checkpoint_scores
-                ],
-                observations=inspection.observations,
-                total_score=inspection.total_score,
-                is_safe=inspection.is_safe,
-                requires_reinspection=inspection.requires_reinspection,
-                created_at=inspection.created_at,
-                updated_at=inspection.updated_at,
-                completed_at=inspection.completed_at
-            )
+        return InspectionResponse(
+            id=inspection.id,
+            license_plate=inspection.license_plate,
+            vehicle_type=inspection.vehicle_type,
+            inspector_id=inspection.inspector_id,
+            status=inspection.status.value,
+            scores=[
+                CheckpointScoreResponse(
+                    checkpoint_type=score.checkpoint_type,
+                    score=score.score,
+                    observations=score.observations
+                ) for score in inspection.checkpoint_scores
+            ],
+            observations=inspection.observations,
+            total_score=inspection.total_score,
+            is_safe=inspection.is_safe,
+            requires_reinspection=inspection.requires_reinspection,
+            created_at=inspection.created_at,
+            updated_at=inspection.updated_at,
+            completed_at=inspection.completed_at
+        )
 
     except ValueError as e:
         raise HTTPException(
@@ -298,7 +299,8 @@ async def complete_inspection(
 @router.get("/", response_model=InspectionListResponse)
 async def list_inspections(
     current_inspector: Inspector = Depends(get_current_inspector),
-    limit: int = 50
+    limit: int = 50,
+    inspection_service: InspectionService = Depends(get_inspection_service)
 ) -> InspectionListResponse:
     """
     List inspections for the current inspector.
@@ -307,40 +309,39 @@ async def list_inspections(
     Requires inspector authentication.
     """
     try:
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            inspections = await inspection_service.list_inspections_by_inspector(
-                inspector_id=str(current_inspector.id),
-                limit=limit
-            )
+        inspections = await inspection_service.list_inspections_by_inspector(
+            inspector_id=str(current_inspector.id),
+            limit=limit
+        )
 
-            inspection_responses = [
-                InspectionResponse(
-                    id=inspection.id,
-                    license_plate=inspection.license_plate,
-                    vehicle_type=inspection.vehicle_type,
-                    inspector_id=inspection.inspector_id,
-                    status=inspection.status.value,
-                    scores=[
-                        CheckpointScoreResponse(
-                            checkpoint_type=score.checkpoint_type,
-                            score=score.score,
-                            observations=score.observations
-                        ) for score in inspection.checkpoint_scores
-                    ],
-                    observations=inspection.observations,
-                    total_score=inspection.total_score,
-                    is_safe=inspection.is_safe,
-                    requires_reinspection=inspection.requires_reinspection,
-                    created_at=inspection.created_at,
-                    updated_at=inspection.updated_at,
-                    completed_at=inspection.completed_at
-                ) for inspection in inspections
-            ]
-
-            return InspectionListResponse(
-                inspections=inspection_responses,
-                total=len(inspection_responses)
-            )
+        inspection_responses = [
+            InspectionResponse(
+                id=inspection.id,
+                license_plate=inspection.license_plate,
+                vehicle_type=inspection.vehicle_type,
+                inspector_id=inspection.inspector_id,
+                status=inspection.status.value,
+                scores=[
+                    CheckpointScoreResponse(
+                        checkpoint_type=score.checkpoint_type,
+                        score=score.score,
+                        observations=score.observations
+                    ) for score in inspection.checkpoint_scores
+                ],
+                observations=inspection.observations,
+                total_score=inspection.total_score,
+                is_safe=inspection.is_safe,
+                requires_reinspection=inspection.requires_reinspection,
+                created_at=inspection.created_at,
+                updated_at=inspection.updated_at,
+                completed_at=inspection.completed_at
+            ) for inspection in inspections
+        ]
+
+        return InspectionListResponse(
+            inspections=inspection_responses,
+            total=len(inspection_responses)
+        )
 
     except ValueError as e:
         raise HTTPException(
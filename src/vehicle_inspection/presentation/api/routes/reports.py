@@ -1,6 +1,6 @@
 """Public inspection reports endpoint."""
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
@@ -8,7 +8,8 @@ from uuid import UUID
 
 from ....domain.entities.vehicle import VehicleType
 from ....domain.value_objects.checkpoint_types import CheckpointType
-from ....infrastructure.services import ServiceFactory
+from ....application.services.inspection_service import InspectionService
+from ..dependencies import get_inspection_service
 
 router = APIRouter()
 
@@ -77,7 +78,10 @@ class InspectionNotFoundResponse(BaseModel):
                200: {"description": "Inspection report found"},
                404: {"description": "No inspection found for this license plate", "model": InspectionNotFoundResponse}
            })
-async def get_inspection_report(license_plate: str) -> InspectionReport:
+async def get_inspection_report(
+    license_plate: str,
+    inspection_service: InspectionService = Depends(get_inspection_service)
+) -> InspectionReport:
     """
     Get the latest inspection report for a vehicle by license plate.
 
@@ -102,72 +106,71 @@ async def get_inspection_report(license_plate: str) -> InspectionReport:
                 detail="License plate cannot be empty"
             )
 
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            # Get the latest completed inspection
-            inspection = await inspection_service.get_latest_inspection_by_license_plate(license_plate)
-
-            if not inspection:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "message": f"No inspection report found for license plate '{license_plate}'",
-                        "license_plate": license_plate,
-                        "suggestion": "Please ensure the license plate is correct and that an inspection has been completed for this vehicle."
-                    }
-                )
-
-            # Only return completed inspections for public access
-            if inspection.status.value != "COMPLETED":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "message": f"No completed inspection found for license plate '{license_plate}'",
-                        "license_plate": license_plate,
-                        "suggestion": "The inspection for this vehicle may still be in progress. Please check again later."
-                    }
-                )
-
-            # Convert checkpoint scores to public format
-            checkpoint_reports = [
-                CheckpointScoreReport.from_checkpoint_score(score)
-                for score in inspection.checkpoint_scores
-            ]
+        # Get the latest completed inspection
+        inspection = await inspection_service.get_latest_inspection_by_license_plate(license_plate)
 
-            # Determine safety category
-            safety_category = "SAFE"
-            if inspection.requires_reinspection:
-                safety_category = "UNSAFE"
-            elif not inspection.is_safe:
-                safety_category = "CONDITIONAL"
-
-            # Find critical failures (scores < 5)
-            critical_failures = [
-                score.checkpoint_type for score in inspection.checkpoint_scores
-                if score.score < 5
-            ]
-
-            # Create safety result report
-            safety_result = SafetyResultReport(
-                total_score=inspection.total_score,
-                is_safe=inspection.is_safe,
-                requires_reinspection=inspection.requires_reinspection,
-                safety_category=safety_category,
-                critical_failures=critical_failures
+        if not inspection:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "message": f"No inspection report found for license plate '{license_plate}'",
+                    "license_plate": license_plate,
+                    "suggestion": "Please ensure the license plate is correct and that an inspection has been completed for this vehicle."
+                }
             )
 
-            # Create the public report
-            return InspectionReport(
-                license_plate=inspection.license_plate,
-                vehicle_type=inspection.vehicle_type,
-                inspection_date=inspection.completed_at,
-                inspector_id=inspection.inspector_id,
-                checkpoint_scores=checkpoint_reports,
-                safety_result=safety_result,
-                observations=inspection.observations,
-                created_at=inspection.created_at,
-                completed_at=inspection.completed_at
+        # Only return completed inspections for public access
+        if inspection.status.value != "COMPLETED":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "message": f"No completed inspection found for license plate '{license_plate}'",
+                    "license_plate": license_plate,
+                    "suggestion": "The inspection for this vehicle may still be in progress. Please check again later."
+                }
             )
 
+        # Convert checkpoint scores to public format
+        checkpoint_reports = [
+            CheckpointScoreReport.from_checkpoint_score(score)
+            for score in inspection.checkpoint_scores
+        ]
+
+        # Determine safety category
+        safety_category = "SAFE"
+        if inspection.requires_reinspection:
+            safety_category = "UNSAFE"
+        elif not inspection.is_safe:
+            safety_category = "CONDITIONAL"
+
+        # Find critical failures (scores < 5)
+        critical_failures = [
+            score.checkpoint_type for score in inspection.checkpoint_scores
+            if score.score < 5
+        ]
+
+        # Create safety result report
+        safety_result = SafetyResultReport(
+            total_score=inspection.total_score,
+            is_safe=inspection.is_safe,
+            requires_reinspection=inspection.requires_reinspection,
+            safety_category=safety_category,
+            critical_failures=critical_failures
+        )
+
+        # Create the public report
+        return InspectionReport(
+            license_plate=inspection.license_plate,
+            vehicle_type=inspection.vehicle_type,
+            inspection_date=inspection.completed_at,
+            inspector_id=inspection.inspector_id,
+            checkpoint_scores=checkpoint_reports,
+            safety_result=safety_result,
+            observations=inspection.observations,
+            created_at=inspection.created_at,
+            completed_at=inspection.completed_at
+        )
+
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
@@ -193,7 +196,8 @@ async def get_inspection_report(license_plate: str) -> InspectionReport:
            })
 async def get_inspection_history(
     license_plate: str,
-    limit: int = Query(default=10, ge=1, le=50, description="Maximum number of inspections to return")
+    limit: int = Query(default=10, ge=1, le=50, description="Maximum number of inspections to return"),
+    inspection_service: InspectionService = Depends(get_inspection_service)
 ) -> List[InspectionReport]:
     """
     Get inspection history for a vehicle by license plate.
@@ -220,75 +224,74 @@ async def get_inspection_history(
                 detail="License plate cannot be empty"
             )
 
-        async with ServiceFactory().get_inspection_service() as inspection_service:
-            # Get inspection history
-            inspections = await inspection_service.get_inspections_by_license_plate(
-                license_plate=license_plate,
-                limit=limit
+        # Get inspection history
+        inspections = await inspection_service.get_inspections_by_license_plate(
+            license_plate=license_plate,
+            limit=limit
+        )
+
+        # Filter only completed inspections for public access
+        completed_inspections = [
+            inspection for inspection in inspections
+            if inspection.status.value == "COMPLETED"
+        ]
+
+        if not completed_inspections:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "message": f"No completed inspection history found for license plate '{license_plate}'",
+                    "license_plate": license_plate,
+                    "suggestion": "This vehicle may not have any completed inspections on record."
+                }
             )
 
-            # Filter only completed inspections for public access
-            completed_inspections = [
-                inspection for inspection in inspections
-                if inspection.status.value == "COMPLETED"
+        # Convert to public report format
+        reports = []
+        for inspection in completed_inspections:
+            # Convert checkpoint scores
+            checkpoint_reports = [
+                CheckpointScoreReport.from_checkpoint_score(score)
+                for score in inspection.checkpoint_scores
+            ]
+
+            # Determine safety category
+            safety_category = "SAFE"
+            if inspection.requires_reinspection:
+                safety_category = "UNSAFE"
+            elif not inspection.is_safe:
+                safety_category = "CONDITIONAL"
+
+            # Find critical failures
+            critical_failures = [
+                score.checkpoint_type for score in inspection.checkpoint_scores
+                if score.score < 5
             ]
 
-            if not completed_inspections:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "message": f"No completed inspection history found for license plate '{license_plate}'",
-                        "license_plate": license_plate,
-                        "suggestion": "This vehicle may not have any completed inspections on record."
-                    }
-                )
-
-            # Convert to public report format
-            reports = []
-            for inspection in completed_inspections:
-                # Convert checkpoint scores
-                checkpoint_reports = [
-                    CheckpointScoreReport.from_checkpoint_score(score)
-                    for score in inspection.checkpoint_scores
-                ]
-
-                # Determine safety category
-                safety_category = "SAFE"
-                if inspection.requires_reinspection:
-                    safety_category = "UNSAFE"
-                elif not inspection.is_safe:
-                    safety_category = "CONDITIONAL"
-
-                # Find critical failures
-                critical_failures = [
-                    score.checkpoint_type for score in inspection.checkpoint_scores
-                    if score.score < 5
-                ]
-
-                # Create safety result
-                safety_result = SafetyResultReport(
-                    total_score=inspection.total_score,
-                    is_safe=inspection.is_safe,
-                    requires_reinspection=inspection.requires_reinspection,
-                    safety_category=safety_category,
-                    critical_failures=critical_failures
-                )
-
-                # Create report
-                report = InspectionReport(
-                    license_plate=inspection.license_plate,
-                    vehicle_type=inspection.vehicle_type,
-                    inspection_date=inspection.completed_at,
-                    inspector_id=inspection.inspector_id,
-                    checkpoint_scores=checkpoint_reports,
-                    safety_result=safety_result,
-                    observations=inspection.observations,
-                    created_at=inspection.created_at,
-                    completed_at=inspection.completed_at
-                )
-                reports.append(report)
-
-            return reports
+            # Create safety result
+            safety_result = SafetyResultReport(
+                total_score=inspection.total_score,
+                is_safe=inspection.is_safe,
+                requires_reinspection=inspection.requires_reinspection,
+                safety_category=safety_category,
+                critical_failures=critical_failures
+            )
+
+            # Create report
+            report = InspectionReport(
+                license_plate=inspection.license_plate,
+                vehicle_type=inspection.vehicle_type,
+                inspection_date=inspection.completed_at,
+                inspector_id=inspection.inspector_id,
+                checkpoint_scores=checkpoint_reports,
+                safety_result=safety_result,
+                observations=inspection.observations,
+                created_at=inspection.created_at,
+                completed_at=inspection.completed_at
+            )
+            reports.append(report)
+
+        return reports
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -0,0 +1,118 @@
+"""Unit tests for the authentication middleware."""
+
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.vehicle_inspection.domain.entities.inspector import Inspector, InspectorRole, InspectorStatus
+from src.vehicle_inspection.infrastructure.services import get_service_factory
+from src.vehicle_inspection.presentation.api.middleware import auth
+from src.vehicle_inspection.presentation.api.middleware.auth import ValidTokenCache
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _inspector() -> Inspector:
+    """Build an active inspector for cache entries."""
+    return Inspector(
+        email="inspector@example.com",
+        first_name="Ana",
+        last_name="Lopez",
+        role=InspectorRole.SENIOR,
+        license_number="LIC-001",
+        status=InspectorStatus.ACTIVE
+    )
+
+
+class TestValidTokenCache:
+    """Test cases for ValidTokenCache."""
+
+    async def test_returns_cached_inspector_until_token_expiry(self):
+        """Test that an entry is served until the token's own expiry passes."""
+        cache = ValidTokenCache(ttl_seconds=300)
+        inspector = _inspector()
+
+        with patch.object(auth.time, "time", return_value=1000.0):
+            cache.put("token", inspector, token_expires_at=1010.0)
+            assert cache.get("token") is inspector
+
+        with patch.object(auth.time, "time", return_value=1010.0):
+            assert cache.get("token") is None
+
+    async def test_ttl_caps_long_lived_tokens(self):
+        """Test that entries expire after the TTL even if the token lives longer."""
+        cache = ValidTokenCache(ttl_seconds=5)
+
+        with patch.object(auth.time, "time", return_value=1000.0):
+            cache.put("token", _inspector(), token_expires_at=9999.0)
+        with patch.object(auth.time, "time", return_value=1006.0):
+            assert cache.get("token") is None
+
+    async def test_discard_forgets_token(self):
+        """Test that a discarded token is no longer served."""
+        cache = ValidTokenCache()
+        cache.put("token", _inspector())
+
+        cache.discard("token")
+
+        assert cache.get("token") is None
+
+    async def test_raw_token_is_not_stored(self):
+        """Test that entries are keyed by digest rather than the raw token."""
+        cache = ValidTokenCache()
+        cache.put("secret-token", _inspector())
+
+        assert "secret-token" not in cache._entries
+
+
+class TestGetCurrentInspector:
+    """Test cases for the get_current_inspector dependency."""
+
+    async def test_cached_token_skips_decode(self):
+        """Test that a cached token is answered without decoding the JWT."""
+        inspector = _inspector()
+        auth.token_cache.put("cached-token", inspector)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="cached-token")
+
+        try:
+            with patch.object(auth.jwt, "decode", side_effect=AssertionError):
+                assert await auth.get_current_inspector(credentials) is inspector
+        finally:
+            auth.token_cache.discard("cached-token")
+
+    async def test_uses_the_shared_service_factory(self):
+        """Test that the middleware resolves inspectors through the process-wide factory."""
+        inspector = _inspector()
+        auth_service = AsyncMock()
+        auth_service.get_inspector.return_value = inspector
+
+        @asynccontextmanager
+        async def fake_auth_service():
+            yield auth_service
+
+        token = auth.create_access_token(str(inspector.id))
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        assert auth._service_factory is get_service_factory()
+        try:
+            with patch.object(auth._service_factory, "get_auth_service", fake_auth_service):
+                assert await auth.get_current_inspector(credentials) is inspector
+        finally:
+            auth.token_cache.discard(token)
+
+        auth_service.get_inspector.assert_awaited_once_with(inspector.id)
+
+    async def test_expired_token_is_rejected(self):
+        """Test that an expired token is refused with 401 before any lookup."""
+        token = auth.create_access_token(str(_inspector().id), expires_delta=timedelta(seconds=-1))
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_inspector(credentials)
+
+        assert exc_info.value.status_code == 401
@@ -32,6 +32,20 @@ class MockInspectorRepository:
         """Find inspector by ID."""
         return self.inspectors.get(inspector_id)
 
+    async def find_auth_row_by_email(self, email: str) -> dict | None:
+        """Find the login columns of an inspector by email."""
+        inspector = await self.find_by_email(email)
+        if not inspector:
+            return None
+        login_info = self.login_info.get(inspector.id, {})
+        return {
+            "id": inspector.id,
+            "password_hash": self.password_hashes.get(inspector.id),
+            "status": inspector.status,
+            "failed_login_attempts": login_info.get('failed_attempts', 0),
+            "locked_until": login_info.get('locked_until')
+        }
+
     async def update_login_info(self, inspector_id: UUID, **kwargs):
         """Update login information."""
         if inspector_id not in self.login_info:
@@ -43,6 +57,8 @@ class MockInspectorRepository:
         if inspector_id not in self.login_info:
             self.login_info[inspector_id] = {}
         self.login_info[inspector_id]['last_login'] = datetime.now()
+        self.login_info[inspector_id]['failed_attempts'] = 0
+        self.login_info[inspector_id]['locked_until'] = None
 
     async def get_password_hash(self, inspector_id: UUID) -> str | None:
         """Get password hash for inspector."""
@@ -29,6 +29,16 @@ class TestBooking:
         assert booking.created_at is not None
         assert booking.updated_at is not None
 
+    def test_booking_normalizes_license_plate(self):
+        """Test license plate is stored stripped and upper-cased."""
+        booking = Booking(
+            license_plate="  abc123 ",
+            appointment_date=datetime.utcnow() + timedelta(days=1),
+            user_id=uuid4()
+        )
+
+        assert booking.license_plate == "ABC123"
+
     def test_booking_creation_with_custom_id_and_status(self):
         """Test booking creation with custom ID and status."""
         booking_id = uuid4()
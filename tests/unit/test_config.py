@@ -0,0 +1,26 @@
+"""Unit tests for application settings."""
+
+from src.vehicle_inspection.presentation.api.config import Settings
+
+
+class TestSettings:
+    """Test cases for Settings CORS parsing."""
+
+    def test_cors_strings_are_split_into_tuples(self):
+        """Test that comma-separated CORS settings become trimmed tuples."""
+        settings = Settings(
+            allowed_origins="http://a.test, http://b.test,",
+            allowed_methods="GET,POST",
+            allowed_headers="*"
+        )
+
+        assert settings.allowed_origins == ("http://a.test", "http://b.test")
+        assert settings.allowed_methods == ("GET", "POST")
+        assert settings.allowed_headers == ("*",)
+
+    def test_cors_lists_are_frozen(self):
+        """Test that list values are also stored as tuples."""
+        settings = Settings(allowed_origins=["http://a.test"])
+
+        assert settings.allowed_origins == ("http://a.test",)
+        assert settings.allowed_origins_set == frozenset({"http://a.test"})
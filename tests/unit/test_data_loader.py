@@ -0,0 +1,110 @@
+"""Unit tests for the batching ID data loader."""
+
+import asyncio
+
+import pytest
+
+from src.vehicle_inspection.infrastructure.repositories.data_loader import IdDataLoader
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestIdDataLoader:
+    """Test cases for IdDataLoader."""
+
+    async def test_concurrent_loads_share_one_batch(self):
+        """Test that loads issued in the same tick are fetched with one call."""
+        batches = []
+
+        async def batch_load(ids):
+            batches.append(sorted(ids))
+            return {key: key * 10 for key in ids if key != 3}
+
+        loader = IdDataLoader(batch_load)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3))
+
+        assert results == [10, 20, 10, None]
+        assert batches == [[1, 2, 3]]
+
+    async def test_sequential_loads_are_not_cached(self):
+        """Test that each awaited load after a batch triggers a fresh fetch."""
+        calls = []
+
+        async def batch_load(ids):
+            calls.append(list(ids))
+            return {key: len(calls) for key in ids}
+
+        loader = IdDataLoader(batch_load)
+
+        assert await loader.load("a") == 1
+        assert await loader.load("a") == 2
+
+    async def test_batch_failure_propagates_to_every_caller(self):
+        """Test that a failing batch raises in all waiting callers."""
+        async def batch_load(ids):
+            raise RuntimeError("database unavailable")
+
+        loader = IdDataLoader(batch_load)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_batch_interruption_reaches_every_caller(self):
+        """Test that a BaseException from the batch settles all waiting callers."""
+        class Interrupted(BaseException):
+            pass
+
+        async def batch_load(ids):
+            raise Interrupted()
+
+        loader = IdDataLoader(batch_load)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        assert all(isinstance(result, Interrupted) for result in results)
+
+    async def test_cancelled_caller_leaves_shared_key_to_the_others(self):
+        """Test that cancelling one caller does not cancel another waiting on the same ID."""
+        release = asyncio.Event()
+
+        async def batch_load(ids):
+            await release.wait()
+            return {key: key * 10 for key in ids}
+
+        loader = IdDataLoader(batch_load)
+        cancelled = asyncio.ensure_future(loader.load(1))
+        survivor = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await survivor == 10
+        assert cancelled.cancelled()
+
+    async def test_cancelling_every_caller_cancels_the_batch(self):
+        """Test that the batch query stops once no caller is waiting for it."""
+        started = asyncio.Event()
+        batch_cancelled = asyncio.Event()
+
+        async def batch_load(ids):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                batch_cancelled.set()
+                raise
+
+        loader = IdDataLoader(batch_load)
+        callers = [asyncio.ensure_future(loader.load(key)) for key in (1, 2)]
+        await started.wait()
+
+        for caller in callers:
+            caller.cancel()
+        await asyncio.wait_for(batch_cancelled.wait(), timeout=1)
+
+        assert all(caller.cancelled() for caller in callers)
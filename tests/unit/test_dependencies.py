@@ -0,0 +1,58 @@
+"""Unit tests for the request-scoped API dependencies."""
+
+from unittest.mock import Mock
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.vehicle_inspection.presentation.api.dependencies import (
+    get_auth_service,
+    get_booking_service,
+    get_db_session
+)
+
+
+def _app(session_dependency) -> FastAPI:
+    """Build an app with two service dependencies over an overridden session."""
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(
+        booking_service=Depends(get_booking_service),
+        auth_service=Depends(get_auth_service)
+    ):
+        return {
+            "shared": booking_service._booking_repository._session
+            is auth_service._inspector_repository._session
+        }
+
+    app.dependency_overrides[get_db_session] = session_dependency
+    return app
+
+
+class TestRequestSession:
+    """Test cases for the per-request database session."""
+
+    def test_services_share_one_session(self):
+        """Test that every service resolved in a request gets the same session."""
+        async def session():
+            yield Mock()
+
+        response = TestClient(_app(session)).get("/")
+
+        assert response.json() == {"shared": True}
+
+    def test_commit_failure_reaches_the_client(self):
+        """Test that the session closes before the response, so a failed commit is a 500."""
+        events = []
+
+        async def failing_session():
+            events.append("open")
+            yield Mock()
+            events.append("commit")
+            raise RuntimeError("commit failed")
+
+        response = TestClient(_app(failing_session), raise_server_exceptions=False).get("/")
+
+        assert response.status_code == 500
+        assert events == ["open", "commit"]
@@ -84,6 +84,12 @@ class TestInspection:
         inspection = Inspection("  abc123  ", VehicleType.CAR, inspector_id)
         assert inspection.license_plate == "ABC123"
 
+    def test_normalized_license_plate_drops_separators(self):
+        """Test the stored-form plate is computed once without spaces or dashes."""
+        inspection = Inspection(" ab-12 cd ", VehicleType.CAR, uuid4())
+        assert inspection.license_plate == "AB-12 CD"
+        assert inspection.normalized_license_plate == "AB12CD"
+
     def test_vehicle_type_validation(self):
         """Test vehicle type validation."""
         inspector_id = uuid4()
@@ -169,6 +175,7 @@ class TestInspection:
         assert inspection.observations == "Final inspection complete"
         assert not inspection.is_editable()
         assert inspection.is_completed()
+        assert inspection.completed_at == inspection.updated_at
 
     def test_complete_inspection_missing_scores(self):
         """Test completing inspection fails when missing required scores."""
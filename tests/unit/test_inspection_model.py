@@ -5,6 +5,8 @@ import pytest
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy.dialects.postgresql import JSONB
+
 from src.vehicle_inspection.infrastructure.database.models import InspectionModel
 from src.vehicle_inspection.domain.entities.inspection import InspectionStatus
 from src.vehicle_inspection.domain.entities.vehicle import VehicleType
@@ -188,6 +190,11 @@ class TestInspectionModel:
         """Test that the table name is correctly set."""
         assert InspectionModel.__tablename__ == "inspections"
 
+    def test_inspector_relationship_never_lazy_loads(self):
+        """Test that both sides of the inspector relationship raise on lazy access."""
+        assert InspectionModel.inspector.property.lazy == "raise"
+        assert InspectionModel.inspector.property.mapper.relationships["inspections"].lazy == "raise"
+
     def test_inspection_model_columns_exist(self):
         """Test that all expected columns exist in the model."""
         expected_columns = {
@@ -200,6 +207,10 @@ class TestInspectionModel:
 
         assert expected_columns == actual_columns
 
+    def test_checkpoint_scores_column_is_jsonb(self):
+        """Test that checkpoint scores use the native JSONB type."""
+        assert isinstance(InspectionModel.__table__.columns['checkpoint_scores'].type, JSONB)
+
     def test_inspection_model_database_defaults(self):
         """Test that database defaults are properly configured."""
         status_column = InspectionModel.__table__.columns['status']
@@ -229,3 +240,14 @@ class TestInspectionModel:
 
         assert model.status == InspectionStatus.COMPLETED
         assert model.observations == "Test observations"
+
+    def test_metadata_registers_each_table_once(self):
+        """Test that the shared Base registers every table exactly once."""
+        from src.vehicle_inspection.infrastructure.database.models import Base
+
+        table_names = list(Base.metadata.tables)
+
+        assert len(table_names) == len(set(table_names))
+        assert set(table_names) == {
+            'bookings', 'time_slots', 'vehicles', 'users', 'inspectors', 'inspections'
+        }
@@ -0,0 +1,63 @@
+"""Unit tests for the buffered log file handling."""
+
+import logging
+import queue
+from unittest.mock import Mock
+
+import pytest
+
+from src.vehicle_inspection.infrastructure.logging import (
+    _BufferedRotatingFileHandler,
+    _FlushingQueueListener
+)
+
+
+def _record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    """Build a log record outside any logger."""
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class TestBufferedRotatingFileHandler:
+    """Test cases for _BufferedRotatingFileHandler."""
+
+    def test_info_records_are_flushed_once_the_interval_passes(self, tmp_path):
+        """Test that below-ERROR records are buffered only until the flush interval elapses."""
+        log_file = tmp_path / "app.log"
+        handler = _BufferedRotatingFileHandler(filename=log_file, maxBytes=1024 * 1024)
+        try:
+            handler.emit(_record("first"))
+            assert log_file.read_text() == ""
+
+            handler._flush_due = 0.0
+            handler.emit(_record("second"))
+            assert log_file.read_text() == "first\nsecond\n"
+        finally:
+            handler.close()
+
+    def test_error_records_are_flushed_immediately(self, tmp_path):
+        """Test that an ERROR record is written straight through."""
+        log_file = tmp_path / "app.log"
+        handler = _BufferedRotatingFileHandler(filename=log_file, maxBytes=1024 * 1024)
+        try:
+            handler.emit(_record("failed", logging.ERROR))
+            assert log_file.read_text() == "failed\n"
+        finally:
+            handler.close()
+
+
+class TestFlushingQueueListener:
+    """Test cases for _FlushingQueueListener."""
+
+    def test_handlers_are_flushed_when_the_queue_drains(self):
+        """Test that handlers are flushed before the listener waits on an empty queue."""
+        log_queue: queue.Queue = queue.Queue()
+        handler = Mock()
+        listener = _FlushingQueueListener(log_queue, handler)
+        log_queue.put("queued")
+
+        assert listener.dequeue(False) == "queued"
+        handler.flush.assert_not_called()
+
+        with pytest.raises(queue.Empty):
+            listener.dequeue(False)
+        handler.flush.assert_called_once()
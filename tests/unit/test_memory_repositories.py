@@ -0,0 +1,126 @@
+"""Unit tests for in-memory repository implementations."""
+
+import pytest
+from datetime import datetime, date, time, timedelta
+from uuid import uuid4
+
+from src.vehicle_inspection.domain.entities.booking import Booking
+from src.vehicle_inspection.infrastructure.repositories.memory_repositories import (
+    InMemoryBookingRepository
+)
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _slot_for(slots, start_time):
+    """Pick the slot starting at the given time."""
+    return next(slot for slot in slots if slot.start_time == start_time)
+
+
+class TestInMemoryBookingRepository:
+    """Test cases for InMemoryBookingRepository."""
+
+    @pytest.fixture
+    def repository(self):
+        """Create a fresh repository."""
+        return InMemoryBookingRepository()
+
+    @pytest.fixture
+    def target_date(self):
+        """A date inside the repository's slot window."""
+        return date.today() + timedelta(days=1)
+
+    async def test_saved_booking_occupies_slot(self, repository, target_date):
+        """Test that a pending booking makes its slot unavailable."""
+        booking = Booking("ABC123", datetime.combine(target_date, time(10, 0)), uuid4())
+        await repository.save(booking)
+
+        slot = _slot_for(await repository.find_available_slots(target_date), time(10, 0))
+
+        assert slot.current_bookings == 1
+        assert slot.is_available is False
+        assert await repository.is_slot_available(booking.appointment_date) is False
+
+    async def test_resaving_booking_does_not_double_count(self, repository, target_date):
+        """Test that saving the same booking twice counts it once."""
+        booking = Booking("ABC123", datetime.combine(target_date, time(11, 0)), uuid4())
+        await repository.save(booking)
+        booking.confirm()
+        await repository.save(booking)
+
+        slot = _slot_for(await repository.find_available_slots(target_date), time(11, 0))
+
+        assert slot.current_bookings == 1
+
+    async def test_cancelled_booking_frees_slot(self, repository, target_date):
+        """Test that saving a cancelled booking releases its slot."""
+        booking = Booking("ABC123", datetime.combine(target_date, time(12, 0)), uuid4())
+        await repository.save(booking)
+        booking.cancel()
+        await repository.save(booking)
+
+        assert await repository.is_slot_available(booking.appointment_date) is True
+
+    async def test_delete_frees_slot(self, repository, target_date):
+        """Test that deleting a booking releases its slot."""
+        booking = Booking("ABC123", datetime.combine(target_date, time(13, 0)), uuid4())
+        await repository.save(booking)
+
+        assert await repository.delete(booking.id) is True
+        assert await repository.is_slot_available(booking.appointment_date) is True
+        assert await repository.delete(booking.id) is False
+
+    async def test_no_slots_outside_booking_window(self, repository):
+        """Test that dates outside the 30-day window have no slots."""
+        assert await repository.find_available_slots(date.today() - timedelta(days=1)) == []
+        assert await repository.find_available_slots(date.today() + timedelta(days=30)) == []
+        assert len(await repository.find_available_slots(date.today() + timedelta(days=29))) == 9
+
+    async def test_find_by_user_and_plate(self, repository, target_date):
+        """Test owner and plate lookups, including after deletion."""
+        user_id = uuid4()
+        first = Booking("ABC123", datetime.combine(target_date, time(9, 0)), user_id)
+        second = Booking("XYZ789", datetime.combine(target_date, time(10, 0)), user_id)
+        other = Booking("ABC123", datetime.combine(target_date, time(11, 0)), uuid4())
+        for booking in (first, second, other):
+            await repository.save(booking)
+
+        assert await repository.find_by_user_id(user_id) == [first, second]
+        assert await repository.find_by_license_plate("ABC123") == [first, other]
+
+        await repository.delete(first.id)
+
+        assert await repository.find_by_user_id(user_id) == [second]
+        assert await repository.find_by_license_plate("ABC123") == [other]
+        assert await repository.find_by_user_id(uuid4()) == []
+
+    async def test_lookups_keep_save_order(self, repository, target_date):
+        """Test that owner lookups return bookings in the order they were first saved."""
+        user_id = uuid4()
+        bookings = [
+            Booking(f"ABC{hour}", datetime.combine(target_date, time(hour, 0)), user_id)
+            for hour in range(8, 17)
+        ]
+        for booking in bookings:
+            await repository.save(booking)
+        await repository.save(bookings[0])
+
+        assert await repository.find_by_user_id(user_id) == bookings
+
+    async def test_delete_drops_emptied_index_keys(self, repository, target_date):
+        """Test that deleting a user's last booking leaves no empty index entries behind."""
+        booking = Booking("ABC123", datetime.combine(target_date, time(9, 0)), uuid4())
+        await repository.save(booking)
+
+        await repository.delete(booking.id)
+
+        assert repository._by_user == {}
+        assert repository._by_plate == {}
+
+    async def test_license_plate_lookup_is_normalized(self, repository, target_date):
+        """Test that plate lookups ignore case and surrounding whitespace."""
+        booking = Booking("ABC123", datetime.combine(target_date, time(14, 0)), uuid4())
+        await repository.save(booking)
+
+        assert await repository.find_by_license_plate("  abc123 ") == [booking]
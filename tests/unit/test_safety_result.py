@@ -0,0 +1,44 @@
+"""Unit tests for safety result value object."""
+
+import pytest
+
+from src.vehicle_inspection.domain.value_objects.safety_result import SafetyResult
+
+
+class TestSafetyResult:
+    """Test cases for SafetyResult value object."""
+
+    def test_score_percentage(self):
+        """Test score percentage is derived from total and max score."""
+        result = SafetyResult(is_safe=True, total_score=64, max_score=80, requires_reinspection=False)
+
+        assert result.score_percentage == 80.0
+
+    def test_score_percentage_with_zero_max_score(self):
+        """Test score percentage is zero when max score is zero."""
+        result = SafetyResult(is_safe=False, total_score=0, max_score=0, requires_reinspection=True)
+
+        assert result.score_percentage == 0.0
+
+    def test_validation_total_exceeds_max(self):
+        """Test validation fails when total score exceeds max score."""
+        with pytest.raises(ValueError, match="Total score cannot exceed maximum score"):
+            SafetyResult(is_safe=True, total_score=81, max_score=80, requires_reinspection=False)
+
+    def test_equality_and_hash(self):
+        """Test results with the same data are equal and hash alike."""
+        result1 = SafetyResult(is_safe=True, total_score=70, max_score=80, requires_reinspection=False)
+        result2 = SafetyResult(is_safe=True, total_score=70, max_score=80, requires_reinspection=False)
+
+        assert result1 == result2
+        assert hash(result1) == hash(result2)
+
+    def test_status(self):
+        """Test human-readable status values."""
+        safe = SafetyResult(is_safe=True, total_score=70, max_score=80, requires_reinspection=False)
+        reinspect = SafetyResult(is_safe=False, total_score=20, max_score=80, requires_reinspection=True)
+        conditional = SafetyResult(is_safe=False, total_score=50, max_score=80, requires_reinspection=False)
+
+        assert safe.status == "SAFE"
+        assert reinspect.status == "REQUIRES_REINSPECTION"
+        assert conditional.status == "CONDITIONAL"
@@ -0,0 +1,790 @@
+"""Unit tests for SQLAlchemy repository statement construction."""
+
+import pytest
+from datetime import datetime, date, time, timedelta
+from typing import Optional
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.vehicle_inspection.domain.entities.booking import Booking
+from src.vehicle_inspection.domain.entities.inspection import Inspection
+from src.vehicle_inspection.domain.entities.inspector import InspectorRole, InspectorStatus
+from src.vehicle_inspection.domain.entities.vehicle import Car, Motorcycle, VehicleType
+from src.vehicle_inspection.domain.value_objects.auth import AuthToken
+from src.vehicle_inspection.domain.value_objects.checkpoint_score import CheckpointScore
+from src.vehicle_inspection.domain.value_objects.checkpoint_types import CheckpointType
+from src.vehicle_inspection.infrastructure.database.models import (
+    InspectionModel,
+    TimeSlotModel,
+    VehicleModel
+)
+from src.vehicle_inspection.infrastructure.repositories.sql_repositories import (
+    SQLAlchemyInspectionRepository,
+    InMemoryAuthTokenRepository,
+    SQLAlchemyBookingRepository,
+    SQLAlchemyInspectorRepository,
+    SQLAlchemyUserRepository,
+    SQLAlchemyVehicleRepository,
+    _COUNTS_CACHE,
+    _SLOTS_CACHE,
+    _normalize_plate
+)
+
+
+pytestmark = pytest.mark.asyncio
+
+_STORED_AT = datetime(2030, 1, 1, 7, 30)
+
+
+def _mock_session(sync_session: Optional[Session] = None) -> AsyncMock:
+    """Mock an AsyncSession over a real sync Session, so transaction events fire."""
+    return AsyncMock(sync_session=sync_session or Session())
+
+
+def _executed_sql(session: AsyncMock) -> str:
+    """Compile the last statement passed to session.execute for PostgreSQL."""
+    statement = session.execute.call_args[0][0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestNormalizePlate:
+    """Test cases for inspection plate normalization."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("abc 123", "ABC123"), ("ab-12-cd", "AB12CD"), ("A B-1", "AB1"), ("XYZ789", "XYZ789")
+    ])
+    async def test_normalize_plate(self, raw, expected):
+        """Test that plates are upper-cased with spaces and dashes removed."""
+        assert _normalize_plate(raw) == expected
+
+
+class TestSQLAlchemyBookingRepository:
+    """Test cases for SQLAlchemyBookingRepository."""
+
+    @pytest.fixture(autouse=True)
+    def clear_slots_cache(self):
+        """Keep the process-wide slot cache from leaking between tests."""
+        _SLOTS_CACHE.clear()
+        yield
+        _SLOTS_CACHE.clear()
+
+    async def test_is_slot_available_uses_exists(self):
+        """Test that the slot check is a prebuilt EXISTS bound to the requested time."""
+        session = _mock_session()
+        session.scalar.return_value = False
+        appointment = datetime(2030, 1, 1, 9, 0)
+
+        assert await SQLAlchemyBookingRepository(session).is_slot_available(appointment) is True
+
+        statement, params = session.scalar.call_args[0]
+        assert statement is SQLAlchemyBookingRepository._SLOT_TAKEN
+        assert "EXISTS" in str(statement.compile(dialect=postgresql.dialect()))
+        assert params == {"appointment_date": appointment}
+
+    async def test_save_is_single_upsert(self):
+        """Test that save issues one INSERT ... ON CONFLICT DO UPDATE."""
+        session = _mock_session()
+        session.execute.return_value = Mock(one=Mock(return_value=(_STORED_AT, _STORED_AT)))
+        booking = Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4())
+
+        result = await SQLAlchemyBookingRepository(session).save(booking)
+
+        assert result is booking
+        session.execute.assert_awaited_once()
+        sql = _executed_sql(session)
+        assert sql.startswith("INSERT INTO bookings")
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "created_at = excluded.created_at" not in sql
+
+    async def test_save_adopts_stored_timestamps_from_returning(self):
+        """Test that save reads the stored timestamps back in the same statement."""
+        session = _mock_session()
+        updated = datetime(2030, 1, 2, 8, 0)
+        session.execute.return_value = Mock(one=Mock(return_value=(_STORED_AT, updated)))
+        booking = Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4())
+
+        await SQLAlchemyBookingRepository(session).save(booking)
+
+        assert _executed_sql(session).endswith(
+            "RETURNING bookings.created_at, bookings.updated_at"
+        )
+        assert booking.created_at == _STORED_AT
+        assert booking.updated_at == updated
+
+    async def test_save_into_taken_slot_raises_value_error(self):
+        """Test that the active-slot unique index surfaces as an unavailable slot."""
+        session = _mock_session()
+        session.execute.side_effect = IntegrityError(
+            "INSERT", {}, Exception('duplicate key value violates "ux_bookings_active_slot"')
+        )
+
+        with pytest.raises(ValueError, match="not available"):
+            await SQLAlchemyBookingRepository(session).save(
+                Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4())
+            )
+
+    async def test_save_reraises_other_integrity_errors(self):
+        """Test that unrelated constraint violations are not reported as taken slots."""
+        session = _mock_session()
+        session.execute.side_effect = IntegrityError("INSERT", {}, Exception("other constraint"))
+
+        with pytest.raises(IntegrityError):
+            await SQLAlchemyBookingRepository(session).save(
+                Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4())
+            )
+
+    async def test_save_many_is_one_executemany_upsert(self):
+        """Test that save_many sends every booking as one parameter list."""
+        session = _mock_session()
+        bookings = [
+            Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4()),
+            Booking("XYZ789", datetime(2030, 1, 1, 10, 0), uuid4())
+        ]
+
+        result = await SQLAlchemyBookingRepository(session).save_many(bookings)
+
+        assert result is bookings
+        session.execute.assert_awaited_once()
+        rows = session.execute.call_args[0][1]
+        assert [row["license_plate"] for row in rows] == ["ABC123", "XYZ789"]
+        assert "ON CONFLICT (id) DO UPDATE" in _executed_sql(session)
+
+    async def test_large_save_many_copies_into_staging_table(self):
+        """Test that big batches are COPYed to a staging table and upserted from it."""
+        session = _mock_session()
+        raw_connection = session.connection.return_value.get_raw_connection.return_value
+        bookings = [
+            Booking(f"ABC{index:03d}", datetime(2030, 1, 1, 9, 0), uuid4()) for index in range(100)
+        ]
+
+        await SQLAlchemyBookingRepository(session).save_many(bookings)
+
+        copy = raw_connection.driver_connection.copy_records_to_table
+        copy.assert_awaited_once()
+        records = copy.call_args.kwargs["records"]
+        assert len(records) == 100
+        assert records[0][3] == "PENDING"
+        executed = [
+            str(call[0][0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.call_args_list
+        ]
+        assert any(
+            sql.startswith("INSERT INTO bookings") and "FROM booking_stage" in sql
+            for sql in executed
+        )
+
+    async def test_large_save_many_copies_each_booking_id_once(self):
+        """Test that a repeated booking ID is staged once, with its last state."""
+        session = _mock_session()
+        raw_connection = session.connection.return_value.get_raw_connection.return_value
+        bookings = [
+            Booking(f"ABC{index:03d}", datetime(2030, 1, 1, 9, 0), uuid4()) for index in range(100)
+        ]
+        rebooked = Booking(
+            "XYZ789", datetime(2030, 1, 2, 9, 0), uuid4(), booking_id=bookings[0].id
+        )
+
+        await SQLAlchemyBookingRepository(session).save_many(bookings + [rebooked])
+
+        records = raw_connection.driver_connection.copy_records_to_table.call_args.kwargs["records"]
+        assert len(records) == 100
+        assert records[0][:2] == (rebooked.id, "XYZ789")
+
+    @pytest.mark.parametrize("batch_size", [2, 100])
+    async def test_save_many_into_taken_slot_raises_value_error(self, batch_size):
+        """Test that both save_many paths report the active-slot index as an unavailable slot."""
+        session = _mock_session()
+        session.execute.side_effect = IntegrityError(
+            "INSERT", {}, Exception('duplicate key value violates "ux_bookings_active_slot"')
+        )
+        bookings = [
+            Booking(f"ABC{index:03d}", datetime(2030, 1, 1, 9, 0), uuid4())
+            for index in range(batch_size)
+        ]
+
+        with pytest.raises(ValueError, match="not available"):
+            await SQLAlchemyBookingRepository(session).save_many(bookings)
+
+    async def test_save_many_with_no_bookings_skips_the_database(self):
+        """Test that an empty batch issues no statement."""
+        session = _mock_session()
+
+        assert await SQLAlchemyBookingRepository(session).save_many([]) == []
+        session.execute.assert_not_awaited()
+
+    async def test_save_statement_is_cacheable(self):
+        """Test that saves of different bookings share one compiled-cache key."""
+        session = _mock_session()
+        session.execute.return_value = Mock(one=Mock(return_value=(_STORED_AT, _STORED_AT)))
+        repository = SQLAlchemyBookingRepository(session)
+
+        await repository.save(Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4()))
+        first_key = session.execute.call_args[0][0]._generate_cache_key()
+        await repository.save(Booking("XYZ789", datetime(2031, 2, 2, 10, 0), uuid4()))
+        second_key = session.execute.call_args[0][0]._generate_cache_key()
+
+        assert first_key is not None
+        assert first_key == second_key
+
+    async def test_find_many_by_ids_is_one_in_query(self):
+        """Test that several bookings are fetched with the prebuilt IN statement."""
+        session = _mock_session()
+        session.execute.return_value = Mock(scalars=Mock(return_value=[]))
+        booking_ids = (uuid4(), uuid4())
+
+        assert await SQLAlchemyBookingRepository(session).find_many_by_ids(booking_ids) == {}
+
+        session.execute.assert_awaited_once()
+        statement, params = session.execute.call_args[0]
+        assert statement is SQLAlchemyBookingRepository._FIND_BY_IDS
+        assert params == {"ids": list(booking_ids)}
+
+    async def test_default_slots_are_memoized_per_date(self):
+        """Test that generated default slots are built once per date and copied per call."""
+        repository = SQLAlchemyBookingRepository(_mock_session())
+        target_date = date(2030, 1, 1)
+
+        first = repository._generate_default_slots(target_date)
+        second = repository._generate_default_slots(target_date)
+
+        assert len(first) == 9
+        assert first == second
+        assert first is not second
+        assert first[0] is second[0]
+        assert first[0].start_time == time(8, 0)
+        assert first[-1].end_time == time(17, 0)
+
+    async def test_find_available_slots_joins_booking_counts(self):
+        """Test that stored slots come back with live booking counts from one query."""
+        session = _mock_session()
+        slot_start = datetime(2030, 1, 1, 9, 0)
+        slot_model = TimeSlotModel(
+            date=slot_start, start_time=slot_start, end_time=datetime(2030, 1, 1, 10, 0),
+            is_available=True, max_bookings=1, current_bookings=0
+        )
+        session.execute.return_value = Mock(all=Mock(return_value=[(slot_model, 1)]))
+
+        slots = await SQLAlchemyBookingRepository(session).find_available_slots(date(2030, 1, 1))
+
+        session.execute.assert_awaited_once()
+        sql = _executed_sql(session)
+        assert "LEFT OUTER JOIN" in sql
+        assert "CAST(time_slots.date AS DATE) = " in sql
+        assert slots[0].current_bookings == 1
+        assert slots[0].is_available is False
+
+    async def test_find_available_slots_is_cached_until_a_booking_on_that_day_commits(self):
+        """Test that repeated availability reads skip the database until a booking on the day commits."""
+        session = _mock_session()
+        session.execute.return_value = Mock(
+            all=Mock(return_value=[]), one=Mock(return_value=(_STORED_AT, _STORED_AT))
+        )
+        repository = SQLAlchemyBookingRepository(session)
+        target_date = date(2030, 1, 1)
+
+        first = await repository.find_available_slots(target_date)
+        second = await repository.find_available_slots(target_date)
+        assert second == first
+        assert second is not first
+        assert session.execute.await_count == 1
+
+        await repository.save(Booking("ABC123", datetime(2030, 1, 1, 9, 0), uuid4()))
+        await repository.find_available_slots(target_date)
+        assert session.execute.await_count == 2
+
+        session.sync_session.commit()
+        await repository.find_available_slots(target_date)
+        assert session.execute.await_count == 3
+
+    async def test_rolled_back_delete_still_evicts_cached_days(self):
+        """Test that a write's evictions also apply when its transaction rolls back."""
+        sync_session = Session(bind=create_engine("sqlite://"))
+        session = _mock_session(sync_session)
+        session.execute.return_value = Mock(all=Mock(return_value=[]), rowcount=1)
+        repository = SQLAlchemyBookingRepository(session)
+
+        await repository.find_available_slots(date(2030, 1, 1))
+        sync_session.connection()
+        await repository.delete(uuid4())
+        assert date(2030, 1, 1) in _SLOTS_CACHE
+
+        sync_session.rollback()
+        assert _SLOTS_CACHE == {}
+
+    async def test_find_available_slots_zero_ttl_disables_the_cache(self):
+        """Test that a zero TTL always queries the database."""
+        session = _mock_session()
+        session.execute.return_value = Mock(all=Mock(return_value=[]))
+        repository = SQLAlchemyBookingRepository(session, cache_ttl_seconds=0)
+
+        await repository.find_available_slots(date(2030, 1, 1))
+        await repository.find_available_slots(date(2030, 1, 1))
+
+        assert session.execute.await_count == 2
+
+
+class TestSQLAlchemyVehicleRepository:
+    """Test cases for SQLAlchemyVehicleRepository."""
+
+    async def test_save_is_single_upsert(self):
+        """Test that save upserts on the license plate key."""
+        session = AsyncMock()
+
+        await SQLAlchemyVehicleRepository(session).save(Car("ABC123", "Toyota", "Corolla", 2020))
+
+        session.execute.assert_awaited_once()
+        assert "ON CONFLICT (license_plate) DO UPDATE" in _executed_sql(session)
+
+    async def test_save_stamps_updated_at_on_the_server(self):
+        """Test that the upsert takes updated_at from the database clock."""
+        session = AsyncMock()
+
+        await SQLAlchemyVehicleRepository(session).save(Car("ABC123", "Toyota", "Corolla", 2020))
+
+        assert "updated_at = timezone(" in _executed_sql(session)
+
+    @pytest.mark.parametrize("vehicle_type, expected_cls", [
+        ("car", Car), ("motorcycle", Motorcycle), ("truck", Car)
+    ])
+    async def test_model_to_entity_dispatches_on_vehicle_type(self, vehicle_type, expected_cls):
+        """Test that stored vehicle types map back to entity classes, defaulting to Car."""
+        model = VehicleModel(
+            license_plate="ABC123", make="Honda", model="CB500", year=2021, vehicle_type=vehicle_type
+        )
+
+        vehicle = SQLAlchemyVehicleRepository(AsyncMock())._model_to_entity(model)
+
+        assert type(vehicle) is expected_cls
+        assert vehicle.license_plate == "ABC123"
+
+    async def test_find_by_license_plate_is_cached_until_a_write(self):
+        """Test that repeated plate lookups in one session hit the database once until a save."""
+        session = AsyncMock()
+        model = VehicleModel(
+            license_plate="ABC123", make="Toyota", model="Corolla", year=2020, vehicle_type="car"
+        )
+        session.get.return_value = model
+        repository = SQLAlchemyVehicleRepository(session)
+
+        first = await repository.find_by_license_plate("ABC123")
+        assert await repository.find_by_license_plate("ABC123") is first
+        assert session.get.await_count == 1
+
+        await repository.save(first)
+        await repository.find_by_license_plate("ABC123")
+
+        assert session.get.await_count == 2
+
+    async def test_find_many_by_license_plates_is_one_in_query(self):
+        """Test that several plates are fetched together and keyed by plate."""
+        session = AsyncMock()
+        model = VehicleModel(
+            license_plate="ABC123", make="Toyota", model="Corolla", year=2020, vehicle_type="car"
+        )
+        session.execute.return_value = Mock(scalars=Mock(return_value=[model]))
+
+        vehicles = await SQLAlchemyVehicleRepository(session).find_many_by_license_plates(
+            ["ABC123", "XYZ789"]
+        )
+
+        session.execute.assert_awaited_once()
+        statement, params = session.execute.call_args[0]
+        assert statement is SQLAlchemyVehicleRepository._FIND_BY_PLATES
+        assert params == {"license_plates": ["ABC123", "XYZ789"]}
+        assert list(vehicles) == ["ABC123"]
+
+    async def test_find_many_by_license_plates_with_no_plates_skips_the_database(self):
+        """Test that an empty plate list issues no statement."""
+        session = AsyncMock()
+
+        assert await SQLAlchemyVehicleRepository(session).find_many_by_license_plates([]) == {}
+        session.execute.assert_not_awaited()
+
+    async def test_find_by_license_plate_uses_primary_key_get(self):
+        """Test that the plate lookup goes through session.get on the primary key."""
+        session = AsyncMock()
+        session.get.return_value = None
+
+        assert await SQLAlchemyVehicleRepository(session).find_by_license_plate("ABC123") is None
+
+        session.get.assert_awaited_once()
+        assert session.get.call_args[0] == (VehicleModel, "ABC123")
+        session.execute.assert_not_awaited()
+
+
+class TestSQLAlchemyInspectorRepository:
+    """Test cases for SQLAlchemyInspectorRepository."""
+
+    @pytest.mark.parametrize("rowcount,expected", [(1, True), (0, False)])
+    async def test_record_login_is_single_update(self, rowcount, expected):
+        """Test that record_login issues one UPDATE and reports whether a row matched."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(rowcount=rowcount)
+
+        assert await SQLAlchemyInspectorRepository(session).record_login(uuid4()) is expected
+
+        session.execute.assert_awaited_once()
+        sql = _executed_sql(session)
+        assert sql.startswith("UPDATE inspectors SET")
+        assert "failed_login_attempts" in sql
+
+    async def test_find_auth_row_by_email_projects_login_columns(self):
+        """Test that the auth lookup selects only the login columns."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(one_or_none=Mock(return_value=None))
+
+        assert await SQLAlchemyInspectorRepository(session).find_auth_row_by_email("a@b.com") is None
+
+        sql = _executed_sql(session)
+        selected = sql[len("SELECT "):sql.index("FROM")]
+        assert "inspectors.password_hash" in selected
+        assert "inspectors.locked_until" in selected
+        assert "inspectors.first_name" not in selected
+        assert sql.endswith("FOR UPDATE")
+
+    async def test_find_by_license_number_uses_prebuilt_statement(self):
+        """Test that the lookup binds its value into the class-level statement."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+
+        assert await SQLAlchemyInspectorRepository(session).find_by_license_number("LIC-1") is None
+
+        statement, params = session.execute.call_args[0]
+        assert statement is SQLAlchemyInspectorRepository._FIND_BY_LICENSE_NUMBER
+        assert params == {"license_number": "LIC-1"}
+
+    async def test_find_by_email_is_cached_until_a_write(self):
+        """Test that repeated lookups in one session hit the database once until a write."""
+        session = AsyncMock()
+        inspector_id = uuid4()
+        model = Mock(id=inspector_id, email="a@b.com")
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=model))
+        repository = SQLAlchemyInspectorRepository(session)
+        repository._model_to_entity = Mock(return_value=Mock(id=inspector_id, email="a@b.com"))
+
+        first = await repository.find_by_email("a@b.com")
+        assert await repository.find_by_email("a@b.com") is first
+        assert await repository.find_by_id(inspector_id) is first
+        assert session.execute.await_count == 1
+
+        session.execute.return_value = Mock(rowcount=1)
+        await repository.record_login(inspector_id)
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=model))
+        await repository.find_by_email("a@b.com")
+
+        assert session.execute.await_count == 3
+
+    async def test_find_all_active_builds_entities_from_column_rows(self):
+        """Test that active inspectors are built positionally from projected columns."""
+        session = AsyncMock()
+        inspector_id = uuid4()
+        created = datetime(2030, 1, 1, 9, 0)
+        session.execute.return_value = [(
+            "a@b.com", "Ana", "Diaz", InspectorRole.SENIOR, "LIC-1", inspector_id,
+            InspectorStatus.ACTIVE, None, created, created, created
+        )]
+
+        inspectors = await SQLAlchemyInspectorRepository(session).find_all_active()
+
+        assert session.execute.call_args[0][0] is SQLAlchemyInspectorRepository._FIND_ALL_ACTIVE
+        assert inspectors[0].id == inspector_id
+        assert inspectors[0].email == "a@b.com"
+        assert inspectors[0].role is InspectorRole.SENIOR
+        assert inspectors[0].hire_date == created
+
+    async def test_get_password_hash_reuses_prebuilt_statement(self):
+        """Test that scalar auth lookups bind parameters into one shared statement."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value="hash"))
+        repository = SQLAlchemyInspectorRepository(session)
+        first_id, second_id = uuid4(), uuid4()
+
+        assert await repository.get_password_hash(first_id) == "hash"
+        first_call = session.execute.call_args
+        await repository.get_password_hash(second_id)
+        second_call = session.execute.call_args
+
+        assert first_call[0][0] is second_call[0][0]
+        assert first_call[0][1] == {"inspector_id": first_id}
+        assert second_call[0][1] == {"inspector_id": second_id}
+
+
+class TestSQLAlchemyUserRepository:
+    """Test cases for SQLAlchemyUserRepository."""
+
+    async def test_exists_uses_exists_subquery(self):
+        """Test that exists asks the database for EXISTS rather than a COUNT."""
+        session = AsyncMock()
+        session.scalar.return_value = True
+
+        assert await SQLAlchemyUserRepository(session).exists(uuid4()) is True
+
+        statement = session.scalar.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "EXISTS" in sql
+        assert "count" not in sql.lower()
+
+    async def test_find_by_id_projects_user_columns(self):
+        """Test that find_by_id selects only the returned columns."""
+        session = AsyncMock()
+        user_id = uuid4()
+        row = Mock(id=user_id, _mapping={"id": user_id, "email": "user@example.com"})
+        session.execute.return_value = [row]
+
+        user = await SQLAlchemyUserRepository(session).find_by_id(user_id)
+
+        assert user == {"id": user_id, "email": "user@example.com"}
+        sql = _executed_sql(session)
+        assert sql.startswith("SELECT users.id, users.email, users.first_name")
+        assert "users.created_at" not in sql
+
+
+class TestSQLAlchemyInspectionRepository:
+    """Test cases for SQLAlchemyInspectionRepository."""
+
+    @pytest.fixture(autouse=True)
+    def clear_counts_cache(self):
+        """Keep the process-wide count cache from leaking between tests."""
+        _COUNTS_CACHE.clear()
+        yield
+        _COUNTS_CACHE.clear()
+
+    async def test_count_by_inspector_is_cached_until_a_write_commits(self):
+        """Test that repeated counts reuse the cached value until a saved inspection commits."""
+        session = _mock_session()
+        session.execute.return_value = Mock(scalar=Mock(return_value=4))
+        repository = SQLAlchemyInspectionRepository(session)
+        inspection = Inspection("ABC123", VehicleType.CAR, uuid4())
+
+        assert await repository.count_by_inspector(inspection.inspector_id) == 4
+        assert await repository.count_by_inspector(inspection.inspector_id) == 4
+        assert session.execute.await_count == 1
+
+        await repository.save(inspection)
+        await repository.count_by_inspector(inspection.inspector_id)
+        assert session.execute.await_count == 2
+
+        session.sync_session.commit()
+        await repository.count_by_inspector(inspection.inspector_id)
+        assert session.execute.await_count == 3
+
+    async def test_delete_clears_cached_counts_once_it_commits(self):
+        """Test that a delete forgets every cached count when its transaction commits."""
+        session = _mock_session()
+        session.execute.return_value = Mock(scalar=Mock(return_value=2), rowcount=1)
+        repository = SQLAlchemyInspectionRepository(session)
+
+        await repository.count_by_license_plate("ABC123")
+        await repository.delete(uuid4())
+        assert _COUNTS_CACHE
+
+        session.sync_session.commit()
+        assert _COUNTS_CACHE == {}
+
+    async def test_count_by_license_plate_caches_normalized_plate(self):
+        """Test that plate spellings sharing a normalized form share one cached count."""
+        session = _mock_session()
+        session.execute.return_value = Mock(scalar=Mock(return_value=2))
+        repository = SQLAlchemyInspectionRepository(session)
+
+        assert await repository.count_by_license_plate("abc-123") == 2
+        assert await repository.count_by_license_plate("ABC 123") == 2
+        session.execute.assert_awaited_once()
+
+    async def test_checkpoint_scores_round_trip_through_jsonb(self):
+        """Test that checkpoint scores are written as plain dicts and read back equal."""
+        repository = SQLAlchemyInspectionRepository(_mock_session())
+        scores = [
+            CheckpointScore(CheckpointType.BRAKING_SYSTEM, 8, "Good condition"),
+            CheckpointScore(CheckpointType.TIRES, 7, "Minor wear")
+        ]
+        inspection = Inspection("ABC123", VehicleType.CAR, uuid4(), checkpoint_scores=scores)
+
+        values = repository._entity_to_update_values(inspection)
+        assert values["checkpoint_scores"][0] == {
+            "checkpoint_type": "braking_system", "score": 8, "notes": "Good condition"
+        }
+        model = InspectionModel(
+            id=inspection.id, created_at=inspection.created_at,
+            **dict(values, updated_at=inspection.updated_at)
+        )
+
+        assert repository._model_to_entity(model).checkpoint_scores == scores
+
+    async def test_update_values_take_aggregates_from_one_safety_result(self):
+        """Test that total, safety and reinspection all come from a single calculation."""
+        repository = SQLAlchemyInspectionRepository(_mock_session())
+        scores = [CheckpointScore(checkpoint, 9) for checkpoint in CheckpointType]
+        inspection = Inspection("ABC123", VehicleType.CAR, uuid4(), checkpoint_scores=scores)
+
+        with patch.object(Inspection, "get_total_score", side_effect=AssertionError):
+            values = repository._entity_to_update_values(inspection)
+
+        assert values["total_score"] == 9 * len(scores)
+        assert values["is_safe"] is True
+        assert values["requires_reinspection"] is False
+
+    async def test_save_is_single_upsert(self):
+        """Test that save issues one INSERT ... ON CONFLICT DO UPDATE."""
+        session = _mock_session()
+        inspection = Inspection("ABC123", VehicleType.CAR, uuid4())
+
+        result = await SQLAlchemyInspectionRepository(session).save(inspection)
+
+        assert result is inspection
+        session.execute.assert_awaited_once()
+        sql = _executed_sql(session)
+        assert sql.startswith("INSERT INTO inspections")
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "created_at = excluded.created_at" not in sql
+
+    async def test_update_is_single_update_statement(self):
+        """Test that update writes the row with one UPDATE and no preliminary SELECT."""
+        session = _mock_session()
+        inspection = Inspection("ABC123", VehicleType.CAR, uuid4())
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=inspection.id))
+
+        assert await SQLAlchemyInspectionRepository(session).update(inspection) is inspection
+
+        session.execute.assert_awaited_once()
+        sql = _executed_sql(session)
+        assert sql.startswith("UPDATE inspections SET")
+        assert sql.endswith("RETURNING inspections.id")
+        assert "updated_at=timezone(" in sql
+        assert "created_at" not in sql
+
+    async def test_update_missing_inspection_raises(self):
+        """Test that updating an unknown inspection raises ValueError."""
+        session = _mock_session()
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+
+        with pytest.raises(ValueError, match="not found"):
+            await SQLAlchemyInspectionRepository(session).update(
+                Inspection("ABC123", VehicleType.CAR, uuid4())
+            )
+
+    async def test_count_by_inspectors_is_one_grouped_query(self):
+        """Test that counts for many inspectors come from one GROUP BY, zero-filled."""
+        session = _mock_session()
+        busy, idle = uuid4(), uuid4()
+        session.execute.return_value = Mock(all=Mock(return_value=[(busy, 3)]))
+
+        counts = await SQLAlchemyInspectionRepository(session).count_by_inspectors([busy, idle])
+
+        assert counts == {busy: 3, idle: 0}
+        session.execute.assert_awaited_once()
+        assert "GROUP BY inspections.inspector_id" in _executed_sql(session)
+
+    async def test_count_by_license_plates_keys_by_given_plate(self):
+        """Test that plate counts are matched on the normalized plate but keyed as given."""
+        session = _mock_session()
+        session.execute.return_value = Mock(all=Mock(return_value=[("ABC123", 2)]))
+
+        counts = await SQLAlchemyInspectionRepository(session).count_by_license_plates(["abc-123", "XYZ9"])
+
+        assert counts == {"abc-123": 2, "XYZ9": 0}
+        assert sorted(session.execute.call_args[0][1]["license_plates"]) == ["ABC123", "XYZ9"]
+
+    @pytest.mark.parametrize("finder, args", [
+        ("find_by_inspector", (uuid4(),)),
+        ("find_by_license_plate", ("ABC123",)),
+        ("find_by_status", ("draft",)),
+        ("find_completed_inspections", ()),
+        ("find_draft_inspections_by_inspector", (uuid4(),)),
+    ])
+    async def test_finders_forbid_lazy_relationship_loads(self, finder, args):
+        """Test that list finders attach raiseload so N+1 lazy loads fail loudly."""
+        session = _mock_session()
+        session.stream_scalars.return_value.__aiter__.return_value = []
+
+        assert await getattr(SQLAlchemyInspectionRepository(session), finder)(*args) == []
+
+        statement = session.stream_scalars.call_args[0][0]
+        assert any(
+            getattr(option, "strategy", None) == (("lazy", "raise"),)
+            for option in statement._with_options
+        )
+        assert "JOIN" not in str(statement)
+
+    async def test_list_finders_stream_in_batches(self):
+        """Test that list finders stream rows with yield_per and convert each model."""
+        session = _mock_session()
+        models = [Mock(), Mock()]
+        session.stream_scalars.return_value.__aiter__.return_value = models
+        repository = SQLAlchemyInspectionRepository(session)
+        repository._model_to_entity = Mock(side_effect=["first", "second"])
+
+        assert await repository.find_by_status("draft") == ["first", "second"]
+
+        session.execute.assert_not_awaited()
+        statement = session.stream_scalars.call_args[0][0]
+        assert statement.get_execution_options()["yield_per"] == 500
+
+    async def test_exists_uses_exists_subquery(self):
+        """Test that exists asks the database for EXISTS rather than a COUNT."""
+        session = _mock_session()
+        session.scalar.return_value = False
+
+        assert await SQLAlchemyInspectionRepository(session).exists(uuid4()) is False
+
+        statement = session.scalar.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "EXISTS" in sql
+        assert "count" not in sql.lower()
+
+
+class TestInMemoryAuthTokenRepository:
+    """Test cases for the in-memory auth token repository."""
+
+    async def test_cleanup_expired_tokens_keeps_live_tokens(self):
+        """Test cleanup removes only expired tokens and reports how many."""
+        repository = InMemoryAuthTokenRepository()
+        now = datetime.utcnow()
+        for name, offset in (("old-1", -2), ("old-2", -1), ("live", 1)):
+            await repository.save_token(AuthToken(
+                token=name,
+                inspector_id=uuid4(),
+                expires_at=now + timedelta(hours=offset),
+                created_at=now
+            ))
+
+        assert await repository.cleanup_expired_tokens() == 2
+        assert await repository.find_token("old-1") is None
+        assert await repository.find_token("live") is not None
+        assert await repository.cleanup_expired_tokens() == 0
+
+    async def test_cleanup_skips_stale_heap_entries(self):
+        """Test invalidated or re-saved tokens are not counted by cleanup."""
+        repository = InMemoryAuthTokenRepository()
+        now = datetime.utcnow()
+        inspector_id = uuid4()
+        expired = AuthToken("gone", inspector_id, now - timedelta(hours=1), now)
+        renewed = AuthToken("renewed", inspector_id, now - timedelta(hours=1), now)
+        await repository.save_token(expired)
+        await repository.save_token(renewed)
+        await repository.invalidate_token("gone")
+        await repository.save_token(AuthToken("renewed", inspector_id, now + timedelta(hours=1), now))
+
+        assert await repository.cleanup_expired_tokens() == 0
+        assert await repository.find_token("renewed") is not None
+
+    async def test_invalidation_compacts_the_expiry_heap(self):
+        """Test the heap is rebuilt once invalidated entries outnumber live tokens."""
+        repository = InMemoryAuthTokenRepository()
+        now = datetime.utcnow()
+        inspector_id = uuid4()
+        for index in range(100):
+            await repository.save_token(
+                AuthToken(f"token-{index}", inspector_id, now + timedelta(hours=1), now)
+            )
+        for index in range(99):
+            await repository.invalidate_token(f"token-{index}")
+
+        assert len(repository._expiry_heap) <= 2 + 64
+        assert await repository.find_token("token-99") is not None
+        assert await repository.cleanup_expired_tokens() == 0
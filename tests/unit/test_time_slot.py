@@ -342,8 +342,8 @@ class TestTimeSlot:
 
         assert slot.format_time_range() == "00:00 - 01:00"
 
-    def test_time_slot_immutability(self):
-        """Test that TimeSlot is immutable (dataclass frozen=True)."""
+    def test_time_slot_value_semantics(self):
+        """Test that booking transitions return new slots and leave the original intact."""
         slot_date = datetime(2025, 10, 1, 9, 0)
         start_time = time(9, 0)
         end_time = time(10, 0)
@@ -351,12 +351,17 @@ class TestTimeSlot:
         slot = TimeSlot(
             date=slot_date,
             start_time=start_time,
-            end_time=end_time
+            end_time=end_time,
+            max_bookings=2
         )
 
-        # Attempting to modify should raise an error
-        with pytest.raises(AttributeError):
-            slot.current_bookings = 5
+        booked = slot.with_booking()
+
+        assert booked is not slot
+        assert slot.current_bookings == 0
+        assert booked.current_bookings == 1
+        assert hash(slot) == hash(TimeSlot(slot_date, start_time, end_time, max_bookings=2))
 
+        # Slotted dataclass rejects unknown attributes
         with pytest.raises(AttributeError):
-            slot.is_available = False
+            slot.unknown_field = 5
@@ -19,6 +19,12 @@ class TestCar:
         assert car.year == 2020
         assert car.get_vehicle_type() == VehicleType.CAR
 
+    def test_car_normalizes_license_plate(self):
+        """Test license plate is stored stripped and upper-cased."""
+        car = Car(" abc123 ", "Toyota", "Camry", 2020)
+
+        assert car.license_plate == "ABC123"
+
     def test_car_required_checkpoints(self):
         """Test car returns correct checkpoints."""
         car = Car("ABC123", "Toyota", "Camry", 2020)